@@ -32,13 +32,14 @@ CardView class
 # -------------------------------------------------------------------------
 import pickle
 import time
+from collections import OrderedDict
 
 # -------------------------------------------------------------------------
 #
 # GTK Modules
 #
 # -------------------------------------------------------------------------
-from gi.repository import GObject, Gtk
+from gi.repository import GLib, GObject, Gtk
 
 # -------------------------------------------------------------------------
 #
@@ -48,7 +49,7 @@ from gi.repository import GObject, Gtk
 from gramps.gen.config import config as global_config
 from gramps.gen.const import GRAMPS_LOCALE as glocale
 from gramps.gen.db.dummydb import DummyDb
-from gramps.gen.errors import WindowActiveError
+from gramps.gen.errors import HandleError, WindowActiveError
 from gramps.gen.utils.db import navigation_label
 from gramps.gui.display import display_url
 
@@ -68,8 +69,14 @@ from view.config.config_templates import (
     EditTemplateOptions,
     build_templates_panel,
 )
+from view.services.service_backlinks import BacklinkService
 from view.services.service_images import ImagesService
+from view.services.service_lineage import LineageService
+from view.services.service_participants import EventParticipantService
+from view.services.service_relationships import RelationshipService
+from view.services.service_signals import make_callback
 from view.services.service_statistics import StatisticsService
+from view.services.service_vitals import VitalsService
 from view.services.service_windows import WindowService
 from view.actions import action_handler
 from view.views.view_builder import view_builder
@@ -113,19 +120,29 @@ class CardView(GlobalNavigationView):
 
         self.current_view = None
         self.current_context = None
+        self.page_view = None
+        self.page_dependencies = None
+        self.page_cache = OrderedDict()
+        self.pending_changes = []
+        self.pending_changes_id = None
 
         self.defer_refresh = False
         self.defer_refresh_id = None
         self.config_request = None
         self.additional_uis.append(self.additional_ui)
         dbstate.connect("database-changed", self._handle_db_change)
-        uistate.connect("nameformat-changed", self.build_tree)
-        uistate.connect("placeformat-changed", self.build_tree)
-        uistate.connect("font-changed", self.build_tree)
+        uistate.connect("nameformat-changed", self.rebuild_all)
+        uistate.connect("placeformat-changed", self.rebuild_all)
+        uistate.connect("font-changed", self.rebuild_all)
         self.first_action_group = None
         self.second_action_group = None
         self.second_action_group_sensitive = False
         self.image_service = ImagesService()
+        BacklinkService(self.grstate)
+        EventParticipantService(self.grstate)
+        RelationshipService(self.grstate)
+        LineageService(self.grstate)
+        VitalsService(self.grstate)
         if global_config.get("interface.cardview.enable-statistics-dashboard"):
             StatisticsService(self.grstate)
 
@@ -214,8 +231,100 @@ class CardView(GlobalNavigationView):
         ]:
             for suffix in ["-add", "-update", "-delete", "-rebuild"]:
                 key = "%s%s" % (obj_type, suffix)
-                self.callman.add_db_signal(key, self.build_tree)
-        self.callman.add_db_signal("home-person-changed", self.build_tree)
+                self.callman.add_db_signal(
+                    key, make_callback(self._drop_cached, obj_type.title())
+                )
+                self.callman.add_db_signal(
+                    key,
+                    make_callback(self._objects_changed, obj_type.title()),
+                )
+        self.callman.add_db_signal("home-person-changed", self.rebuild_all)
+
+    def _drop_cached(self, obj_type, handles=None):
+        """
+        Drop changed objects from the caches of the view, the shared
+        services watch the database themselves.
+        """
+        if self.grstate:
+            self.grstate.drop_cached(obj_type, handles)
+            self._drop_cached_pages(obj_type, handles)
+
+    def _drop_cached_pages(self, obj_type, handles=None):
+        """
+        Drop kept page views that depend on changed objects.
+        """
+        if not self.page_cache:
+            return
+        if handles is None:
+            self.page_cache.clear()
+            return
+        changed = {}
+        for (location, (view, dependencies)) in list(self.page_cache.items()):
+            include_tags = location[0] == "Tag"
+            if include_tags not in changed:
+                changed[include_tags] = get_changed_handles(
+                    self.dbstate.db, obj_type, handles, include_tags
+                )
+            if changed[include_tags] & dependencies or (
+                view.get_dependent_groups(changed[include_tags])
+            ):
+                del self.page_cache[location]
+
+    def _objects_changed(self, obj_type, handles=None):
+        """
+        Queue a change to be applied once idle, so the shared services have
+        all seen it first and changes made together update the page once.
+        """
+        self.pending_changes.append((obj_type, handles))
+        if not self.pending_changes_id:
+            self.pending_changes_id = GLib.idle_add(self._apply_changes)
+
+    def _cancel_changes(self):
+        """
+        Forget queued changes.
+        """
+        if self.pending_changes_id:
+            GLib.source_remove(self.pending_changes_id)
+            self.pending_changes_id = None
+        self.pending_changes = []
+
+    def _apply_changes(self):
+        """
+        Rebuild only what the current page shows that depends on changed
+        objects, or nothing at all if it does not depend on them.
+        """
+        self.pending_changes_id = None
+        changes, self.pending_changes = self.pending_changes, []
+        if (
+            self.active
+            and not self.dirty
+            and self.page_dependencies is not None
+            and all(x[1] is not None for x in changes)
+        ):
+            include_tags = self.current_context.primary_obj.obj_type == "Tag"
+            changed = set()
+            for (obj_type, handles) in changes:
+                changed.update(
+                    get_changed_handles(
+                        self.dbstate.db, obj_type, handles, include_tags
+                    )
+                )
+            if not changed & self.page_dependencies:
+                groups = self.page_view.get_dependent_groups(changed)
+                if not groups:
+                    return False
+                self.grstate.open_cache()
+                try:
+                    rebuilt = all(
+                        self.page_view.rebuild_group(x) for x in groups
+                    )
+                finally:
+                    self.grstate.close_cache()
+                if rebuilt:
+                    WindowService().refresh_all_windows()
+                    return False
+        self.build_tree()
+        return False
 
     def navigation_type(self):
         """
@@ -299,7 +408,7 @@ class CardView(GlobalNavigationView):
             self.defer_refresh = False
             return True
         self.defer_refresh = False
-        self.build_tree()
+        self.rebuild_all()
         if self.defer_refresh_id:
             GObject.source_remove(self.defer_refresh_id)
             self.defer_refresh_id = None
@@ -355,6 +464,8 @@ class CardView(GlobalNavigationView):
         Reset page if database changed.
         """
         self._change_db(db)
+        self._cancel_changes()
+        self.page_cache.clear()
         self._clear_current_view()
         if self.active:
             self.bookmarks.redraw()
@@ -389,11 +500,20 @@ class CardView(GlobalNavigationView):
         else:
             self.change_object(handle)
 
+    def rebuild_all(self, *_dummy_args):
+        """
+        Forget the kept page views and redraw, used when a setting changes
+        how every page looks.
+        """
+        self.page_cache.clear()
+        self.build_tree()
+
     def build_tree(self, *_dummy_args):
         """
         Perform redraw to populate tree.
         """
         self.dirty = True
+        self.page_dependencies = None
         if self.active:
             active_object = self.history.present()
             if active_object:
@@ -406,6 +526,10 @@ class CardView(GlobalNavigationView):
         """
         Clear view for object change.
         """
+        if self.page_view:
+            self.page_view.cancel_render()
+        self.page_view = None
+        self.page_dependencies = None
         list(
             map(
                 self.current_view.remove,
@@ -466,10 +590,27 @@ class CardView(GlobalNavigationView):
             return self.change_category(page_context.primary_obj.obj_type)
         start = time.time()
 
-        self._clear_current_view()
-        view = view_builder(self.grstate, page_context)
-        self.current_view.pack_start(view, True, True, 0)
-        self.post_render_page()
+        self._keep_current_view(page_context.page_location)
+        cached = self.page_cache.pop(page_context.page_location, None)
+        if cached:
+            (view, dependencies) = cached
+            self._clear_current_view()
+            self.current_view.pack_start(view, True, True, 0)
+            self.post_render_page()
+        else:
+            self.grstate.open_cache()
+            self.grstate.start_recording()
+            try:
+                self._clear_current_view()
+                view = view_builder(self.grstate, page_context)
+                self.current_view.pack_start(view, True, True, 0)
+                self.post_render_page()
+            finally:
+                dependencies = self.grstate.stop_recording()
+                self.grstate.close_cache()
+            dependencies.update(get_context_handles(page_context))
+        self.page_view = view
+        self.page_dependencies = dependencies
 
         if page_context.primary_obj.obj_type != "Tag":
             self.set_bookmarks(page_context.primary_obj.obj_type)
@@ -487,6 +628,33 @@ class CardView(GlobalNavigationView):
         self._set_status_bar(page_context)
         self.dirty = False
 
+    def _keep_current_view(self, location):
+        """
+        Keep the current page view for reuse when moving to another page,
+        if it is complete and up to date. The least recently used views
+        are dropped once more are kept than allowed.
+        """
+        size = self._config_view.get("display.cached-pages")
+        if (
+            not size
+            or not self.page_view
+            or self.page_dependencies is None
+            or self.page_view.render_queue
+            or not self.current_context
+            or self.current_context.page_location == location
+        ):
+            return
+        self.current_view.remove(self.page_view)
+        self.page_cache[self.current_context.page_location] = (
+            self.page_view,
+            self.page_dependencies,
+        )
+        self.page_cache.move_to_end(self.current_context.page_location)
+        while len(self.page_cache) > size:
+            self.page_cache.popitem(last=False)
+        self.page_view = None
+        self.page_dependencies = None
+
     def _set_status_bar(self, page_context):
         """
         Set the status bar label
@@ -716,3 +884,39 @@ class CardView(GlobalNavigationView):
                     "commit_%s", active.obj_type
                 )
                 commit_method(active.obj, trans)
+
+
+def get_context_handles(page_context):
+    """
+    Return the handles of the objects a page context was loaded from, as
+    they are fetched before the page render is recorded.
+    """
+    location = page_context.page_location
+    handles = {location[1]}
+    if location[3]:
+        handles.add(location[3])
+    if location[4] == "Tag":
+        handles.add(location[5])
+    return handles
+
+
+def get_changed_handles(db, obj_type, handles, include_tags=False):
+    """
+    Return the handles of changed objects and of the objects they refer
+    to. Tags are left out unless asked for as much of a page may share the
+    same tag.
+    """
+    changed = set(handles)
+    get_object = db.method("get_%s_from_handle", obj_type)
+    for handle in handles:
+        try:
+            obj = get_object(handle)
+        except HandleError:
+            continue
+        if obj:
+            changed.update(
+                x[1]
+                for x in obj.get_referenced_handles_recursively()
+                if include_tags or x[0] != "Tag"
+            )
+    return changed
@@ -42,6 +42,7 @@ from view.common.common_vitals import (
     get_span,
 )
 from view.config.config_utils import create_grid
+from view.services.service_vitals import find_vitals
 
 _ = glocale.translation.sgettext
 
@@ -120,11 +121,9 @@ def get_child_field(grstate, obj, _dummy_field_value, args):
     get_label = args.get("get_label")
 
     person_birth = None
-    birth_ref = obj.get_birth_ref()
-    if birth_ref:
-        event = grstate.dbstate.db.get_event_from_handle(birth_ref.ref)
-        if event:
-            person_birth = event.get_date_object()
+    vitals = find_vitals(grstate.dbstate.db, obj.handle, person=obj)
+    if vitals.birth:
+        person_birth = vitals.birth.get_date_object()
 
     parent_family_handle = obj.get_main_parents_family_handle()
     if not parent_family_handle:
@@ -35,6 +35,7 @@ from gramps.gen.lib import Family
 # Plugin Modules
 #
 # -------------------------------------------------------------------------
+from view.services.service_relationships import find_all_relationships
 
 _ = glocale.translation.sgettext
 
@@ -86,9 +87,7 @@ def get_relationship_field(grstate, obj, field_value, args):
     father = grstate.fetch("Person", obj.father_handle)
     mother = grstate.fetch("Person", obj.mother_handle)
 
-    relations = grstate.uistate.relationship.get_all_relationships(
-        grstate.dbstate.db, father, mother
-    )
+    relations = find_all_relationships(grstate.dbstate.db, father, mother)
     for relation in relations[0]:
         if _("husband") not in relation and _("wife") not in relation:
             text = relation
@@ -45,6 +45,7 @@ from gramps.gui.dialog import QuestionDialog
 # ------------------------------------------------------------------------
 from ..common.common_classes import GrampsObject
 from ..common.common_utils import describe_object
+from ..services.service_backlinks import find_backlinks
 from .action_const import GRAMPS_EDITORS
 from .delete import delete_object
 
@@ -201,10 +202,8 @@ class GrampsAction:
             target_object.is_primary or target_object.obj_type == "Tag"
         ):
             backlink_count = len(
-                list(
-                    self.grstate.dbstate.db.find_backlink_handles(
-                        target_object.obj.handle
-                    )
+                find_backlinks(
+                    self.grstate.dbstate.db, target_object.obj.handle
                 )
             )
             obj_lang = target_object.obj_lang
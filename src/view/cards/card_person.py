@@ -40,7 +40,6 @@ from gi.repository import Gtk
 from gramps.gen.config import config as global_config
 from gramps.gen.const import GRAMPS_LOCALE as glocale
 from gramps.gen.display.name import displayer as name_displayer
-from gramps.gen.utils.alive import probably_alive
 from gramps.gui.ddtargets import DdTargets
 
 # ------------------------------------------------------------------------
@@ -61,6 +60,7 @@ from ..menus.menu_utils import (
     add_person_menu_options,
     menu_item,
 )
+from ..services.service_vitals import find_living, find_vitals
 from .card_reference import ReferenceCard
 
 _ = glocale.translation.sgettext
@@ -140,9 +140,7 @@ class PersonCard(ReferenceCard):
         event_cache = []
         for event_ref in person.get_primary_event_ref_list():
             event_cache.append(self.fetch("Event", event_ref.ref))
-        self.birth, self.death, self.living = self.__get_birth_death(
-            event_cache
-        )
+        self.birth, self.death, self.living = self.__get_birth_death()
         if self.get_option("event-format") == 0:
             self.__load_years()
         else:
@@ -181,28 +179,15 @@ class PersonCard(ReferenceCard):
         text = format_date_string(self.birth, self.death)
         self.add_fact(self.get_label(text))
 
-    def __get_birth_death(self, event_cache):
+    def __get_birth_death(self):
         """
         Extract birth and death events.
         """
-        birth = False
-        death = False
-        living = True
-        birth_ref = self.primary.obj.get_birth_ref()
-        death_ref = self.primary.obj.get_death_ref()
-        for event in event_cache:
-            event_handle = event.handle
-            if birth_ref and event_handle == birth_ref.ref:
-                birth = event
-            elif death_ref and event_handle == death_ref.ref:
-                death = event
-                living = False
-            elif event.get_type().is_death_fallback():
-                living = False
-
-        if living:
-            living = probably_alive(self.primary.obj, self.grstate.dbstate.db)
-        return birth, death, living
+        person = self.primary.obj
+        db = self.grstate.dbstate.db
+        vitals = find_vitals(db, person.handle, person=person)
+        living = find_living(db, person)
+        return vitals.birth or False, vitals.death or False, living
 
     def __load_fields(self, grid_key, option_prefix, event_cache):
         """
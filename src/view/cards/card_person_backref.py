@@ -44,6 +44,7 @@ from ..common.common_strings import (
     RECIPROCAL,
 )
 from ..menus.menu_utils import menu_item
+from ..services.service_relationships import find_relationship
 from .card_person import PersonCard
 
 _ = glocale.translation.sgettext
@@ -85,7 +86,7 @@ class PersonBackRefCard(PersonCard):
             if not association:
                 association = NONE_PROVIDED
             self.add_ref_item(_("Association"), association)
-            relation = grstate.uistate.relationship.get_one_relationship(
+            relation = find_relationship(
                 grstate.dbstate.db, person, active_person
             )
             if relation:
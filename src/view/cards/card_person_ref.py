@@ -42,6 +42,7 @@ from ..common.common_strings import (
     NONE_PROVIDED,
 )
 from ..menus.menu_utils import menu_item
+from ..services.service_relationships import find_relationship
 from .card_person import PersonCard
 
 _ = glocale.translation.sgettext
@@ -78,9 +79,7 @@ class PersonRefCard(PersonCard):
             if not association:
                 association = NONE_PROVIDED
             self.add_ref_item(_("Association"), association)
-            relation = grstate.uistate.relationship.get_one_relationship(
-                grstate.dbstate.db, person, associate
-            )
+            relation = find_relationship(grstate.dbstate.db, person, associate)
             if relation:
                 self.add_ref_item(_("Relationship"), relation.capitalize())
             self.show_ref_items()
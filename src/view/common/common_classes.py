@@ -83,6 +83,10 @@ from .common_utils import (
 
 _ = glocale.translation.sgettext
 
+OBJECT_CLASSES = {x[1]: x[0] for x in GRAMPS_OBJECTS}
+
+READ_CHUNK_SIZE = 500
+
 
 # ------------------------------------------------------------------------
 #
@@ -566,6 +570,9 @@ class GrampsState:
         "page_type",
         "methods",
         "templates",
+        "cache",
+        "cache_depth",
+        "recorders",
     )
 
     def __init__(self, dbstate, uistate, callbacks, config):
@@ -577,6 +584,9 @@ class GrampsState:
         if callbacks:
             self.methods = callbacks.get("methods")
         self.templates = None
+        self.cache = None
+        self.cache_depth = 0
+        self.recorders = []
 
     def set_templates(self, templates):
         """
@@ -598,12 +608,101 @@ class GrampsState:
 
     def fetch(self, obj_type, obj_handle):
         """
-        Fetches an object from the database.
+        Fetches an object from the database, or from the object cache if
+        one is open.
         """
-        try:
-            return self.methods[obj_type](obj_handle)
-        except HandleError:
-            return None
+        cache = self.cache
+        key = (obj_type, obj_handle)
+        if cache is not None and key in cache:
+            obj = cache[key]
+        else:
+            try:
+                obj = self.methods[obj_type](obj_handle)
+            except HandleError:
+                obj = None
+            if cache is not None:
+                cache[key] = obj
+        if self.recorders:
+            self.recorders[-1][key] = obj
+        return obj
+
+    def fetch_many(self, obj_type, obj_handles):
+        """
+        Fetches a list of objects from the database, reading any not in the
+        object cache in bulk where the database backend allows. Returns the
+        objects in the same order, with None for any not found.
+        """
+        cache = self.cache
+        found = {}
+        missing = []
+        for obj_handle in obj_handles:
+            if obj_handle in found:
+                continue
+            key = (obj_type, obj_handle)
+            if cache is not None and key in cache:
+                found[obj_handle] = cache[key]
+            else:
+                found[obj_handle] = None
+                missing.append(obj_handle)
+        if missing:
+            objects = read_objects(self.dbstate.db, obj_type, missing)
+            if objects is None:
+                for obj_handle in missing:
+                    found[obj_handle] = self.fetch(obj_type, obj_handle)
+            else:
+                found.update(objects)
+                if cache is not None:
+                    for obj_handle in missing:
+                        cache[(obj_type, obj_handle)] = found[obj_handle]
+        if self.recorders:
+            recorder = self.recorders[-1]
+            for (obj_handle, obj) in found.items():
+                recorder[(obj_type, obj_handle)] = obj
+        return [found[x] for x in obj_handles]
+
+    def open_cache(self):
+        """
+        Open an object cache so each object is only fetched once, used
+        while rendering a page.
+        """
+        if self.cache_depth == 0:
+            self.cache = {}
+        self.cache_depth += 1
+
+    def close_cache(self):
+        """
+        Close the object cache once the outermost user is done with it.
+        """
+        self.cache_depth = max(self.cache_depth - 1, 0)
+        if self.cache_depth == 0:
+            self.cache = None
+
+    def start_recording(self):
+        """
+        Start recording the objects fetched, used to learn what a page or
+        group depends on. Recordings may be nested, an object is only
+        recorded by the innermost one.
+        """
+        self.recorders.append({})
+
+    def stop_recording(self):
+        """
+        Stop recording and return the handles of the objects fetched and
+        of everything they refer to.
+        """
+        return get_dependencies(self.recorders.pop())
+
+    def drop_cached(self, obj_type, handles=None):
+        """
+        Drop changed objects from the object cache, or all of them if the
+        handles are not known.
+        """
+        if self.cache:
+            if handles is None:
+                self.cache.clear()
+            else:
+                for handle in handles:
+                    self.cache.pop((obj_type, handle), None)
 
     def fetch_page_context(self):
         """
@@ -677,6 +776,51 @@ class GrampsState:
         return self.callbacks["set-dirty-redraw-trigger"]()
 
 
+def get_dependencies(objects):
+    """
+    Return the handles of a set of fetched objects and of the objects they
+    refer to.
+    """
+    handles = set()
+    for ((dummy_obj_type, obj_handle), obj) in objects.items():
+        handles.add(obj_handle)
+        if obj:
+            handles.update(
+                x[1] for x in obj.get_referenced_handles_recursively()
+            )
+    return handles
+
+
+def read_objects(db, obj_type, obj_handles):
+    """
+    Read a list of objects from a DB-API database in as few queries as
+    possible. Returns None if the database does not support it.
+    """
+    obj_class = OBJECT_CLASSES.get(obj_type)
+    if not obj_class or not hasattr(db, "dbapi"):
+        return None
+    serializer = getattr(db, "serializer", None)
+    if not serializer:
+        return None
+    objects = {}
+    for index in range(0, len(obj_handles), READ_CHUNK_SIZE):
+        chunk = obj_handles[index : index + READ_CHUNK_SIZE]
+        db.dbapi.execute(
+            "SELECT handle, %s FROM %s WHERE handle IN (%s)"
+            % (
+                serializer.data_field,
+                obj_type.lower(),
+                ",".join(["?"] * len(chunk)),
+            ),
+            chunk,
+        )
+        for (obj_handle, data) in db.dbapi.fetchall():
+            objects[obj_handle] = serializer.data_to_object(
+                serializer.string_to_data(data), obj_class
+            )
+    return objects
+
+
 # ------------------------------------------------------------------------
 #
 # GrampsOptions Class
@@ -780,6 +924,7 @@ class GrampsConfig:
             grstate.config, key="title", scheme=scheme
         )
         self.fetch = self.grstate.fetch
+        self.fetch_many = self.grstate.fetch_many
 
     def get_option(self, key, full=True):
         """
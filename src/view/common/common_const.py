@@ -214,6 +214,7 @@ GROUP_LABELS = {
     "stats-bookmark": _("Bookmarks"),
     "stats-uncited": _("Uncited Information"),
     "stats-privacy": _("Privacy"),
+    "stats-trend": _("Trends"),
 }
 
 GROUP_LABELS_SINGLE = {
@@ -55,6 +55,7 @@ from gramps.gen.utils.db import navigation_label
 # Plugin Modules
 #
 # ------------------------------------------------------------------------
+from ..services.service_backlinks import find_backlinks
 from .common_const import (
     _CONFIDENCE,
     _KP_ENTER,
@@ -440,7 +441,7 @@ def find_referencer(grstate, obj, reference_type, reference_hash):
         seek = ["Source"]
     else:
         return None
-    obj_list = grstate.dbstate.db.find_backlink_handles(obj.handle)
+    obj_list = find_backlinks(grstate.dbstate.db, obj.handle)
     for (obj_type, obj_handle) in obj_list:
         if obj_type in seek:
             work_obj = grstate.fetch(obj_type, obj_handle)
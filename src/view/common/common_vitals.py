@@ -34,7 +34,6 @@ from gramps.gen.const import GRAMPS_LOCALE as glocale
 from gramps.gen.display.name import displayer as name_displayer
 from gramps.gen.lib import EventType, Person, Span
 from gramps.gen.lib.date import Today
-from gramps.gen.relationship import get_relationship_calculator
 from gramps.gen.utils.alive import probably_alive
 from gramps.gen.utils.db import family_name
 
@@ -43,6 +42,9 @@ from gramps.gen.utils.db import family_name
 # Plugin Modules
 #
 # ------------------------------------------------------------------------
+from ..services.service_participants import find_participants
+from ..services.service_relationships import find_relationship
+from ..services.service_vitals import find_vitals
 from .common_utils import get_confidence
 
 _ = glocale.translation.sgettext
@@ -106,10 +108,8 @@ def get_relation(db, person, relation, depth=15):
         base_person = db.get_person_from_handle(relation)
     base_person_name = base_person.primary_name.get_regular_name().strip()
 
-    calc = get_relationship_calculator(reinit=True, clocale=glocale)
-    calc.set_depth(depth)
-    result = calc.get_one_relationship(
-        db, base_person, person, extra_info=True
+    result = find_relationship(
+        db, base_person, person, depth=depth, extra_info=True
     )
     if result[0]:
         return "%s %s %s" % (result[0].capitalize(), _("of"), base_person_name)
@@ -153,12 +153,8 @@ def get_participants(db, event):
     """
     participants = []
     event_handle = event.handle
-    result_list = list(
-        db.find_backlink_handles(
-            event_handle, include_classes=["Person", "Family"]
-        )
-    )
-    people = [x[1] for x in result_list if x[0] in ["Person"]]
+    result_list = find_participants(db, event_handle)
+    people = unique_handles(result_list, "Person")
     for handle in people:
         person = db.get_person_from_handle(handle)
         if person:
@@ -166,7 +162,7 @@ def get_participants(db, event):
             if participant:
                 participants.append(participant)
 
-    families = [x[1] for x in result_list if x[0] in ["Family"]]
+    families = unique_handles(result_list, "Family")
     for handle in families:
         family = db.get_family_from_handle(handle)
         if family:
@@ -176,6 +172,17 @@ def get_participants(db, event):
     return participants
 
 
+def unique_handles(result_list, obj_type):
+    """
+    Return the handles of a type from a participant list in order.
+    """
+    handles = []
+    for (entry_type, handle, dummy_role) in result_list:
+        if entry_type == obj_type and handle not in handles:
+            handles.append(handle)
+    return handles
+
+
 def get_primary_participant(participants):
     """
     Return first primary participant found, or first if none found
@@ -238,15 +245,10 @@ def get_person_birth_or_death(db, handle, birth=True):
     Get person and birth or death event given a handle.
     """
     person = db.get_person_from_handle(handle)
+    vitals = find_vitals(db, handle, person=person)
     if birth:
-        ref = person.get_birth_ref()
-    else:
-        ref = person.get_death_ref()
-    if ref:
-        event = db.get_event_from_handle(ref.ref)
-    else:
-        event = None
-    return person, event
+        return person, vitals.birth
+    return person, vitals.death
 
 
 def get_date_sortval(event):
@@ -29,18 +29,22 @@ GrampsTimeline
 # ------------------------------------------------------------------------
 from gramps.gen.const import GRAMPS_LOCALE as glocale
 from gramps.gen.lib import Date, EventType, Span
-from gramps.gen.relationship import get_relationship_calculator
 from gramps.gen.utils.alive import probably_alive_range
 
-event_type = EventType()
+# ------------------------------------------------------------------------
+#
+# Plugin Modules
+#
+# ------------------------------------------------------------------------
+from ..services.service_backlinks import find_backlinks
+from ..services.service_participants import find_participants
+from ..services.service_relationships import (
+    find_relationship,
+    find_relationships,
+)
+from ..services.service_vitals import find_vitals
 
-DEATH_INDICATORS = [
-    event_type.DEATH,
-    event_type.BURIAL,
-    event_type.CREMATION,
-    event_type.CAUSE_DEATH,
-    event_type.PROBATE,
-]
+event_type = EventType()
 
 RELATIVES = [
     "father",
@@ -302,6 +306,7 @@ class GrampsTimeline:
         By default birth and death will always be treated as available and if
         a fallback was identified for one of those we respect it.
         """
+        eligible = []
         for sortval, event, event_ref, family in timeline:
             if event.handle in self.cached_events:
                 continue
@@ -317,19 +322,28 @@ class GrampsTimeline:
                 continue
             if self.end_date and sortval > self.end_date.sortval:
                 continue
-            relationship = relation
+            primary = None
             if not relative:
                 role = event_ref.get_role()
                 if not role.is_primary() and not role.is_family():
                     primary = self.get_primary_event_participant(event.handle)
-                    if primary:
-                        calculator = get_relationship_calculator(
-                            reinit=True, clocale=self.locale
-                        )
-                        calculator.set_depth(4)
-                        relationship = calculator.get_one_relationship(
-                            self.db_handle, person, primary
-                        )
+            eligible.append((sortval, event, event_ref, family, primary))
+            self.cached_events.append(event.handle)
+
+        others = [x[4] for x in eligible if x[4]]
+        relationships = {}
+        if others:
+            relationships = find_relationships(
+                self.db_handle,
+                person,
+                others,
+                depth=4,
+                locale=self.locale,
+            )
+        for (sortval, event, event_ref, family, primary) in eligible:
+            relationship = relation
+            if primary:
+                relationship = relationships[primary.handle]
             self.timeline.append(
                 (
                     sortval,
@@ -343,24 +357,16 @@ class GrampsTimeline:
                     ),
                 )
             )
-            self.cached_events.append(event.handle)
 
     def get_primary_event_participant(self, handle):
         """
         Get the primary event participant.
         """
-        get_person_from_handle = self.db_handle.get_person_from_handle
-        for backlink in self.db_handle.find_backlink_handles(
-            handle, include_classes=["Person"]
+        for (obj_type, obj_handle, role) in find_participants(
+            self.db_handle, handle
         ):
-            person = get_person_from_handle(backlink[1])
-            if person:
-                for event_ref in person.get_primary_event_ref_list():
-                    if (
-                        handle == event_ref.ref
-                        and event_ref.get_role().is_primary()
-                    ):
-                        return person
+            if obj_type == "Person" and role.is_primary():
+                return self.db_handle.get_person_from_handle(obj_handle)
         return None
 
     def prepare_event_sortvals(self, events):
@@ -440,42 +446,18 @@ class GrampsTimeline:
         to better handle undated events. Note if being called to gather events
         for a relative we only want primary events.
         """
-        birth = None
-        birth_fallback = None
-        death = None
-        death_fallback = None
         events = []
         get_event_from_handle = self.db_handle.get_event_from_handle
         get_family_from_handle = self.db_handle.get_family_from_handle
         for event_ref in person.event_ref_list:
-            role = event_ref.get_role()
-            event = get_event_from_handle(event_ref.ref)
-            if role.is_primary():
-                if event.type.is_birth():
-                    birth = event
-                if (
-                    not birth
-                    and not birth_fallback
-                    and event.type.is_birth_fallback()
-                ):
-                    birth_fallback = event
-                if event.type.is_death():
-                    death = event
-                if (
-                    not death
-                    and not death_fallback
-                    and event.type in DEATH_INDICATORS
-                ):
-                    death_fallback = event
-                events.append((event, event_ref, None))
-            elif not relative:
+            if not relative or event_ref.get_role().is_primary():
+                event = get_event_from_handle(event_ref.ref)
                 events.append((event, event_ref, None))
 
         timeline = self.prepare_event_sortvals(events)
-        if not birth and birth_fallback:
-            birth = birth_fallback
-        if not death and death_fallback:
-            death = death_fallback
+        vitals = find_vitals(self.db_handle, person.handle, person=person)
+        birth = vitals.get_birth()
+        death = vitals.get_death()
 
         events = []
         for family_handle in person.family_list:
@@ -558,12 +540,12 @@ class GrampsTimeline:
         if not self.eligible_relatives:
             return
         person = self.db_handle.get_person_from_handle(handle)
-        calculator = get_relationship_calculator(
-            reinit=True, clocale=self.locale
-        )
-        calculator.set_depth(self.depth)
-        relationship = calculator.get_one_relationship(
-            self.db_handle, self.reference_person, person
+        relationship = find_relationship(
+            self.db_handle,
+            self.reference_person,
+            person,
+            depth=self.depth,
+            locale=self.locale,
         )
         for relative in self.eligible_relatives:
             if relative in relationship:
@@ -688,7 +670,7 @@ class GrampsTimeline:
         for (
             obj_type,
             obj_handle,
-        ) in self.db_handle.find_backlink_handles(handle):
+        ) in find_backlinks(self.db_handle, handle):
             if obj_type == "Place":
                 place = get_place_from_handle(obj_handle)
                 for place_ref in place.placeref_list:
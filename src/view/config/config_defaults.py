@@ -94,6 +94,9 @@ VIEWDEFAULTS = (
     ("display.icons-active-width", 24),
     ("display.icons-group-width", 12),
     ("display.max-changes-per-list", 20),
+    ("display.rows-per-list-page", 25),
+    ("display.render-slice-time", 40),
+    ("display.cached-pages", 8),
     ######################################################################
     ## General Options
     ######################################################################
@@ -112,6 +115,11 @@ VIEWDEFAULTS = (
     ######################################################################
     ("dashboard.concurrent-threshold", 50000),
     ("dashboard.summarize-all-events", True),
+    ("dashboard.incremental-updates", False),
+    ("dashboard.auto-recalculate", False),
+    ("dashboard.recalculate-quiet-period", 1500),
+    ("dashboard.recalculate-max-staleness", 30),
+    ("dashboard.approximate-sample-percentage", 5),
     ######################################################################
     ## Menu Options
     ######################################################################
@@ -1354,7 +1362,8 @@ VIEWDEFAULTS = (
         "stats-person,stats-family,stats-child,stats-association,stats-event,"
         "stats-ldsordperson,stats-ldsordfamily,stats-participant,stats-place,"
         "stats-media,stats-note,stats-tag,stats-bookmark,stats-repository,"
-        "stats-source,stats-citation,stats-uncited,stats-privacy",
+        "stats-source,stats-citation,stats-uncited,stats-privacy,"
+        "stats-trend",
     ),
     ("layout.statistics.stats-person.visible", True),
     ("layout.statistics.stats-person.append", True),
@@ -1392,6 +1401,8 @@ VIEWDEFAULTS = (
     ("layout.statistics.stats-uncited.append", True),
     ("layout.statistics.stats-privacy.visible", True),
     ("layout.statistics.stats-privacy.append", True),
+    ("layout.statistics.stats-trend.visible", True),
+    ("layout.statistics.stats-trend.append", True),
     ######################################################################
     # Miscellaneous Options
     ######################################################################
@@ -231,6 +231,33 @@ def build_display_grid(configdialog, grstate, *_dummy_args):
         "display.max-changes-per-list",
         (1, 40),
     )
+    configdialog.add_spinner(
+        grid,
+        _(
+            "Cards to build at a time in long lists, 0 to build all at once "
+            "up to the group maximums"
+        ),
+        28,
+        "display.rows-per-list-page",
+        (0, 500),
+    )
+    configdialog.add_spinner(
+        grid,
+        _(
+            "Milliseconds per step when building page groups, 0 for all "
+            "at once"
+        ),
+        29,
+        "display.render-slice-time",
+        (0, 1000),
+    )
+    configdialog.add_spinner(
+        grid,
+        _("Recently viewed pages to keep for reuse, 0 to keep none"),
+        30,
+        "display.cached-pages",
+        (0, 50),
+    )
     return add_config_buttons(
         configdialog, grstate, "display", grid, HELP_CONFIG_DISPLAY
     )
@@ -255,6 +282,43 @@ def build_dashboard_grid(configdialog, grstate, *_dummy_args):
         4,
         "dashboard.summarize-all-events",
     )
+    configdialog.add_checkbox(
+        grid,
+        _("Update statistics as objects change (requires restart)"),
+        5,
+        "dashboard.incremental-updates",
+    )
+    configdialog.add_checkbox(
+        grid,
+        _("Recalculate statistics automatically (requires restart)"),
+        6,
+        "dashboard.auto-recalculate",
+    )
+    configdialog.add_spinner(
+        grid,
+        _("Milliseconds to wait for changes to settle (requires restart)"),
+        7,
+        "dashboard.recalculate-quiet-period",
+        (0, 60000),
+    )
+    configdialog.add_spinner(
+        grid,
+        _("Maximum seconds to defer statistics updates (requires restart)"),
+        8,
+        "dashboard.recalculate-max-staleness",
+        (1, 3600),
+    )
+    configdialog.add_spinner(
+        grid,
+        _(
+            "Percentage of objects to sample for estimates shown until "
+            "concurrent collection completes, 0 to disable "
+            "(requires restart)"
+        ),
+        9,
+        "dashboard.approximate-sample-percentage",
+        (0, 50),
+    )
     return add_config_buttons(
         configdialog, grstate, "dashboard", grid, HELP_CONFIG_DASHBOARD
     )
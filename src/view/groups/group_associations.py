@@ -38,6 +38,7 @@ from gramps.gui.editors import EditPersonRef
 #
 # ------------------------------------------------------------------------
 from ..cards import PersonBackRefCard, PersonRefCard
+from ..services.service_backlinks import find_backlinks
 from .group_list import CardGroupList
 
 _ = glocale.translation.sgettext
@@ -61,8 +62,8 @@ class AssociationsCardGroup(CardGroupList):
         )
         back_list = [
             y
-            for (x, y) in grstate.dbstate.db.find_backlink_handles(
-                obj.handle, ["Person"]
+            for (x, y) in find_backlinks(
+                grstate.dbstate.db, obj.handle, ["Person"]
             )
         ]
 
@@ -44,12 +44,17 @@ from gramps.gen.lib import Family, Person
 # ------------------------------------------------------------------------
 from ..common.common_classes import GrampsOptions
 from ..cards import FamilyCard
+from ..services.service_backlinks import find_backlinks
 from .group_children import ChildrenCardGroup
 from .group_const import GENERIC_GROUPS, STATISTICS_GROUPS
 from .group_events import EventsCardGroup
 from .group_expander import CardGroupExpander
 from .group_generic import GenericCardGroup
-from .group_statistics import StatisticsCardGroup
+from .group_list import get_list_maximum
+from .group_statistics import (
+    StatisticsCardGroup,
+    StatisticsTrendCardGroup,
+)
 
 _ = glocale.translation.sgettext
 
@@ -116,7 +121,10 @@ def build_statistics_group(grstate, group):
     """
     title = STATISTICS_GROUPS[group]
     groptions = GrampsOptions("group.%s" % group)
-    group = StatisticsCardGroup(grstate, groptions, group)
+    if group == "stats-trend":
+        group = StatisticsTrendCardGroup(grstate, groptions, group)
+    else:
+        group = StatisticsCardGroup(grstate, groptions, group)
     return group_wrapper(grstate, group, (title, title, title))
 
 
@@ -297,15 +305,17 @@ def get_references_group(
     Get the group of objects that reference the given object.
     """
     if not obj_list:
-        obj_list = grstate.dbstate.db.find_backlink_handles(obj.handle)
+        obj_list = find_backlinks(grstate.dbstate.db, obj.handle)
         if not obj_list:
             return None
 
     total, tuple_list = prepare_reference_items(obj_types, obj_list)
     not_shown = 0
     if not maximum:
-        maximum = grstate.config.get("general.references-max-per-group")
-    if total > maximum:
+        maximum = get_list_maximum(
+            grstate, "general.references-max-per-group"
+        )
+    if maximum and total > maximum:
         not_shown = total - maximum
         tuple_list = tuple_list[:maximum]
 
@@ -22,6 +22,13 @@
 CitationsCardGroup
 """
 
+# ------------------------------------------------------------------------
+#
+# Python Modules
+#
+# ------------------------------------------------------------------------
+from functools import partial
+
 # ------------------------------------------------------------------------
 #
 # Gramps Modules
@@ -36,7 +43,8 @@ from gramps.gen.lib.citationbase import CitationBase
 #
 # ------------------------------------------------------------------------
 from ..cards import CitationCard
-from .group_list import CardGroupList
+from ..services.service_backlinks import find_backlinks
+from .group_list import CardGroupList, get_list_maximum
 
 _ = glocale.translation.sgettext
 
@@ -60,7 +68,9 @@ class CitationsCardGroup(CardGroupList):
             groptions.set_backlink(
                 (self.group_base.obj_type, self.group_base.obj.handle)
             )
-        self.maximum = grstate.config.get("group.citation.max-per-group")
+        self.maximum = get_list_maximum(
+            grstate, "group.citation.max-per-group"
+        )
         citation_list = self.collect_citations()
         if citation_list:
             if self.get_option("sort-by-date"):
@@ -70,10 +80,15 @@ class CitationsCardGroup(CardGroupList):
 
             for citation, references, ref_type, ref_desc in citation_list:
                 reference = (references, ref_type, ref_desc)
-                card = CitationCard(
-                    grstate, groptions, citation, reference=reference
+                self.add_card_builder(
+                    partial(
+                        CitationCard,
+                        grstate,
+                        groptions,
+                        citation,
+                        reference=reference,
+                    )
                 )
-                self.add_card(card)
         self.show_all()
 
     def save_new_object(self, handle, insert_row):
@@ -95,7 +110,8 @@ class CitationsCardGroup(CardGroupList):
 
     def collect_citations(self):
         """
-        Helper to collect the citation data for the current object.
+        Helper to collect the citation data for the current object. The
+        citations are gathered by handle and then fetched together.
         """
         group_base_obj = self.group_base.obj
         group_base_obj_type = self.group_base.obj_type
@@ -175,10 +191,9 @@ class CitationsCardGroup(CardGroupList):
                     for child_ref in family.child_ref_list:
                         if child_ref.ref == group_base_obj.handle:
                             for handle in child_ref.citation_list:
-                                citation = self.fetch("Citation", handle)
                                 citation_list.append(
                                     (
-                                        citation,
+                                        handle,
                                         [child_ref],
                                         1,
                                         _("Parent Family Child"),
@@ -194,15 +209,22 @@ class CitationsCardGroup(CardGroupList):
             for (
                 obj_type,
                 obj_handle,
-            ) in self.grstate.dbstate.db.find_backlink_handles(
-                group_base_obj.handle, ["Citation"]
+            ) in find_backlinks(
+                self.grstate.dbstate.db, group_base_obj.handle, ["Citation"]
             ):
-                citation = self.fetch("Citation", obj_handle)
-                citation_list.append((citation, [group_base_obj], 0, obj_type))
-                if len(citation_list) >= self.maximum:
+                citation_list.append(
+                    (obj_handle, [group_base_obj], 0, obj_type)
+                )
+                if self.maximum and len(citation_list) >= self.maximum:
                     break
 
-        return citation_list
+        citations = self.fetch_many(
+            "Citation", [x[0] for x in citation_list]
+        )
+        return [
+            (citation,) + entry[1:]
+            for (citation, entry) in zip(citations, citation_list)
+        ]
 
     def extract_citations(
         self,
@@ -223,11 +245,8 @@ class CitationsCardGroup(CardGroupList):
         for item in data:
             if isinstance(item, CitationBase):
                 for handle in item.citation_list:
-                    citation = self.fetch("Citation", handle)
-                    citation_list.append(
-                        (citation, [item], ref_type, ref_desc)
-                    )
-                    if len(citation_list) >= self.maximum:
+                    citation_list.append((handle, [item], ref_type, ref_desc))
+                    if self.maximum and len(citation_list) >= self.maximum:
                         break
 
     def extract_family_citations(self, citation_list, family):
@@ -172,5 +172,6 @@ STATISTICS_GROUPS = {
     "stats-repository": _("Repositories"),
     "stats-source": _("Sources"),
     "stats-tag": _("Tags"),
+    "stats-trend": _("Trends"),
     "stats-uncited": _("Uncited Information"),
 }
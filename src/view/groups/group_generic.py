@@ -22,6 +22,13 @@
 GenericCardGroup
 """
 
+# ------------------------------------------------------------------------
+#
+# Python Modules
+#
+# ------------------------------------------------------------------------
+from functools import partial
+
 # ------------------------------------------------------------------------
 #
 # GTK Modules
@@ -92,13 +99,23 @@ class GenericCardGroup(CardGroupList):
             "image": Gtk.SizeGroup(mode=Gtk.SizeGroupMode.HORIZONTAL),
         }
 
+        objects = {}
+        for obj_type in CARD_MAP:
+            handles = [y for (x, y) in tuple_list if x == obj_type]
+            if handles:
+                for (handle, obj) in zip(
+                    handles, self.fetch_many(obj_type, handles)
+                ):
+                    objects[(obj_type, handle)] = obj
+
         for obj_type, obj_handle in tuple_list:
             if obj_type not in CARD_MAP:
                 continue
             group_space = "group.%s" % obj_type.lower()
             group_groptions = GrampsOptions(group_space, size_groups=groups)
             group_groptions.set_age_base(groptions.age_base)
-            obj = self.fetch(obj_type, obj_handle)
-            card = CARD_MAP[obj_type](grstate, group_groptions, obj)
-            self.add_card(card)
+            obj = objects[(obj_type, obj_handle)]
+            self.add_card_builder(
+                partial(CARD_MAP[obj_type], grstate, group_groptions, obj)
+            )
         self.show_all()
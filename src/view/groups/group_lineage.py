@@ -36,6 +36,7 @@ from gramps.gen.const import GRAMPS_LOCALE as glocale
 # ------------------------------------------------------------------------
 from ..common.common_classes import GrampsOptions
 from ..cards import FamilyCard
+from ..services.service_lineage import find_line
 from .group_list import CardGroupList
 
 _ = glocale.translation.sgettext
@@ -87,34 +88,25 @@ class PaternalLineageCardGroup(CardGroupList):
         """
         Return a set of ordered tuples for a direct line.
         """
-        families = []
         ancestors = []
-        family_handle = self.group_base.obj.get_main_parents_family_handle()
-        while family_handle:
-            family = self.grstate.fetch("Family", family_handle)
-            families.append(family)
-            if not maternal:
-                if family.father_handle:
-                    father = self.grstate.fetch("Person", family.father_handle)
-                    if family.mother_handle:
-                        mother = self.grstate.fetch(
-                            "Person", family.mother_handle
-                        )
-                    else:
-                        mother = None
-                    ancestors.append((father, mother))
-                    family_handle = father.get_main_parents_family_handle()
+        line = find_line(
+            self.grstate.dbstate.db,
+            self.group_base.obj.handle,
+            maternal=maternal,
+        )
+        families = self.fetch_many("Family", line)
+        for family in families:
+            if maternal:
+                parents = (family.mother_handle, family.father_handle)
             else:
-                if family.mother_handle:
-                    mother = self.grstate.fetch("Person", family.mother_handle)
-                    if family.father_handle:
-                        father = self.grstate.fetch(
-                            "Person", family.father_handle
-                        )
-                    else:
-                        father = None
-                    ancestors.append((mother, father))
-                    family_handle = mother.get_main_parents_family_handle()
+                parents = (family.father_handle, family.mother_handle)
+            if parents[0]:
+                ancestors.append(
+                    tuple(
+                        self.grstate.fetch("Person", x) if x else None
+                        for x in parents
+                    )
+                )
         return families, ancestors
 
 
@@ -29,12 +29,19 @@ CardGroupList
 # ------------------------------------------------------------------------
 import pickle
 
+# ------------------------------------------------------------------------
+#
+# Gramps Modules
+#
+# ------------------------------------------------------------------------
+from gramps.gen.const import GRAMPS_LOCALE as glocale
+
 # ------------------------------------------------------------------------
 #
 # GTK Modules
 #
 # ------------------------------------------------------------------------
-from gi.repository import Gdk, Gtk
+from gi.repository import Gdk, GLib, Gtk
 
 # ------------------------------------------------------------------------
 #
@@ -45,6 +52,8 @@ from ..common.common_classes import GrampsConfig, GrampsObject
 from ..common.common_utils import set_dnd_css
 from ..cards.card_object import ObjectCard
 
+_ = glocale.translation.sgettext
+
 
 # ------------------------------------------------------------------------
 #
@@ -56,6 +65,10 @@ class CardGroupList(Gtk.ListBox, GrampsConfig):
     The CardGroupList class provides the core methods for managing
     a list of Card objects. It primarily supports drag and drop
     actions related to the list.
+
+    Cards added through a builder are only created as the end of the
+    list comes near the viewport, a page of rows at a time, so long
+    lists stay cheap to show.
     """
 
     def __init__(self, grstate, groptions, obj, enable_drop=True):
@@ -64,6 +77,10 @@ class CardGroupList(Gtk.ListBox, GrampsConfig):
         self.group_base = GrampsObject(obj)
         self.managed_obj_type = None
         self.row_cards = []
+        self.row_pending = []
+        self.row_page_size = grstate.config.get("display.rows-per-list-page")
+        self.row_more = None
+        self.row_idle = None
         self.row_previous = 0
         self.row_current = 0
         self.row_previous_provider = None
@@ -89,7 +106,83 @@ class CardGroupList(Gtk.ListBox, GrampsConfig):
         self.row_cards.append(gramps_card)
         row = Gtk.ListBoxRow(selectable=False)
         row.add(self.row_cards[-1])
-        self.add(row)
+        if self.row_more:
+            self.insert(row, len(self.row_cards) - 1)
+        else:
+            self.add(row)
+
+    def add_card_builder(self, build_card):
+        """
+        Add a Card object that is built when it is about to be seen.
+        """
+        if not self.row_page_size or (
+            not self.row_pending and len(self.row_cards) < self.row_page_size
+        ):
+            self.add_card(build_card())
+            return
+        self.row_pending.append(build_card)
+        if not self.row_more:
+            self.row_more = Gtk.ListBoxRow(selectable=False)
+            button = Gtk.Button(relief=Gtk.ReliefStyle.NONE)
+            button.connect("clicked", self.show_more_rows)
+            self.row_more.add(button)
+            self.row_more.connect("draw", self.on_more_drawn)
+            self.add(self.row_more)
+        self.update_more_row()
+
+    def __len__(self):
+        """
+        Return the number of cards, including those not yet built.
+        """
+        return len(self.row_cards) + len(self.row_pending)
+
+    def update_more_row(self):
+        """
+        Update the label on the row that shows more cards.
+        """
+        self.row_more.get_child().set_label(
+            "%s (%s)" % (_("Show More"), len(self.row_pending))
+        )
+
+    def on_more_drawn(self, *_dummy_args):
+        """
+        Build the next page of rows once the end of the list is drawn,
+        which happens as it comes near the viewport.
+        """
+        if self.row_pending and not self.row_idle:
+            self.row_idle = GLib.idle_add(self.on_more_idle)
+
+    def on_more_idle(self):
+        """
+        Build the next page of rows if the list is still in use.
+        """
+        self.row_idle = None
+        if self.get_realized():
+            self.show_more_rows()
+        return False
+
+    def show_more_rows(self, *_dummy_args, show_all=False):
+        """
+        Build the next page of rows, or all of them.
+        """
+        if self.row_idle:
+            GLib.source_remove(self.row_idle)
+            self.row_idle = None
+        if show_all:
+            count = len(self.row_pending)
+        else:
+            count = self.row_page_size
+        pending = self.row_pending[:count]
+        self.row_pending = self.row_pending[count:]
+        for build_card in pending:
+            self.add_card(build_card())
+            self.get_row_at_index(len(self.row_cards) - 1).show_all()
+        if self.row_more:
+            if self.row_pending:
+                self.update_more_row()
+            else:
+                self.remove(self.row_more)
+                self.row_more = None
 
     def on_drag_data_received(
         self,
@@ -160,6 +253,8 @@ class CardGroupList(Gtk.ListBox, GrampsConfig):
         """
         Update the view while a user drag and drop is underway.
         """
+        if self.row_pending:
+            self.show_more_rows(show_all=True)
         self.reset_dnd_css()
         current_row = self.get_row_at_y(y_location)
         if current_row:
@@ -224,3 +319,14 @@ class CardGroupList(Gtk.ListBox, GrampsConfig):
             context.remove_provider(self.row_current_provider)
             self.row_current_provider = None
         self.row_cards[self.row_current].set_css_style()
+
+
+def get_list_maximum(grstate, option):
+    """
+    Return the most cards a list may hold, or 0 if there is no limit. A
+    list built a page of rows at a time holds them all, so the configured
+    cap only applies when paging is turned off.
+    """
+    if grstate.config.get("display.rows-per-list-page"):
+        return 0
+    return grstate.config.get(option)
@@ -195,8 +195,10 @@ class MediaCardGroup(CardGroupList):
         if not isinstance(obj, MediaBase):
             return
 
-        for media_ref in obj.media_list:
-            media = self.fetch("Media", media_ref.ref)
+        media_objects = self.fetch_many(
+            "Media", [x.ref for x in obj.media_list]
+        )
+        for (media_ref, media) in zip(obj.media_list, media_objects):
             media_type = ""
             for attribute in media.attribute_list:
                 if attribute.get_type().xml_str() == "Media-Type":
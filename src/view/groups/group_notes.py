@@ -68,8 +68,8 @@ class NotesCardGroup(CardGroupList):
             notes = self.get_child_object_notes(notes)
 
         notes = notes[:maximum]
-        for (obj_lang, handle) in notes:
-            note = self.fetch("Note", handle)
+        note_list = self.fetch_many("Note", [x[1] for x in notes])
+        for ((obj_lang, dummy_handle), note) in zip(notes, note_list):
             card = NoteCard(grstate, groptions, note, reference=obj_lang)
             card.set_size_request(220, -1)
             self.add_card(card)
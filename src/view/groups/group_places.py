@@ -35,6 +35,7 @@ from gramps.gen.const import GRAMPS_LOCALE as glocale
 #
 # ------------------------------------------------------------------------
 from ..cards import PlaceRefCard
+from ..services.service_backlinks import find_backlinks
 from .group_list import CardGroupList
 
 _ = glocale.translation.sgettext
@@ -121,8 +122,8 @@ class EnclosedPlacesCardGroup(CardGroupList):
         Build a list of enclosed places.
         """
         db = self.grstate.dbstate.db
-        for (dummy_obj_type, obj_handle) in db.find_backlink_handles(
-            handle, ["Place"]
+        for (dummy_obj_type, obj_handle) in find_backlinks(
+            db, handle, ["Place"]
         ):
             if len(place_list) < self.maximum:
                 place = db.get_place_from_handle(obj_handle)
@@ -35,6 +35,7 @@ from gramps.gen.const import GRAMPS_LOCALE as glocale
 #
 # ------------------------------------------------------------------------
 from ..cards import SourceCard
+from ..services.service_backlinks import find_backlinks
 from .group_list import CardGroupList
 
 _ = glocale.translation.sgettext
@@ -55,20 +56,19 @@ class SourcesCardGroup(CardGroupList):
         CardGroupList.__init__(
             self, grstate, groptions, obj, enable_drop=False
         )
-        sources_list = []
+        source_handles = []
         if self.group_base.obj_type == "Repository":
             for (
                 obj_type,
                 obj_handle,
-            ) in grstate.dbstate.db.find_backlink_handles(
-                self.group_base.obj.handle
+            ) in find_backlinks(
+                grstate.dbstate.db, self.group_base.obj.handle
             ):
                 if obj_type == "Source":
-                    source = self.fetch("Source", obj_handle)
-                    sources_list.append(source)
+                    source_handles.append(obj_handle)
 
         maximum = grstate.config.get("group.source.max-per-group")
-        sources_list = sources_list[:maximum]
+        sources_list = self.fetch_many("Source", source_handles[:maximum])
 
         if sources_list:
             for source in sources_list:
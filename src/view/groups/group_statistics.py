@@ -47,7 +47,10 @@ from gramps.gen.lib import (
 from ..cards.card_text import TextCard
 from ..common.common_strings import UNKNOWN
 from .group_list import CardGroupList
-from ..services.service_statistics import StatisticsService
+from ..services.service_statistics import (
+    GROUP_SOURCES,
+    StatisticsService,
+)
 from ..services.service_statistics_labels import (
     PERSON_LABELS,
     PARTICIPANT_LABELS,
@@ -67,6 +70,7 @@ from ..services.service_statistics_labels import (
     PRIVATE_LABELS,
     TAG_LABELS,
     BOOKMARK_LABELS,
+    TREND_LABELS,
 )
 
 _ = glocale.translation.sgettext
@@ -267,18 +271,20 @@ def get_association_statistics(data):
     """
     associations = data.get("association")
     result = prepare_statistics(["refs"], associations, ASSOCIATION_LABELS)
+    estimates = associations.get("estimate") or {}
     types = associations.get("types")
     if types:
         output = []
         for key in types:
             (count, total) = types[key]
+            margin = estimates.get(("types", key))
             if not key:
                 key = UNKNOWN
             output.append(
                 (
                     count,
                     "• %s" % key,
-                    "%s of %s" % (count, total),
+                    "%s of %s" % (format_count(count, margin), total),
                     count * 100 / total,
                 )
             )
@@ -375,12 +381,18 @@ def get_citation_statistics(data):
         citations,
         CITATION_LABELS,
     )
+    estimates = citations.get("estimate") or {}
     types = citations.get("confidence")
     if types:
         result.append((CITATION_LABELS["confidence"], "", None))
         for (key, (count, total)) in types.items():
+            margin = estimates.get(("confidence", key))
             result.append(
-                ("• %s" % CITATION_LABELS[key], count, count * 100 / total)
+                (
+                    "• %s" % CITATION_LABELS[key],
+                    format_count(count, margin),
+                    count * 100 / total,
+                )
             )
     return result
 
@@ -524,20 +536,57 @@ def prepare_statistics(keys, data, labels):
     """
     Prepare statistics data for rendering.
     """
+    estimates = data.get("estimate") or {}
     result = []
     for key in keys:
         (count, total) = data.get(key) or (0, None)
-        if count == 0:
+        margin = estimates.get(key)
+        if count == 0 and not margin:
             result.append((labels[key], _("None"), None))
         elif total and str(count).isnumeric() and "size" not in key:
             result.append(
-                (labels[key], "%s of %s" % (count, total), count * 100 / total)
+                (
+                    labels[key],
+                    "%s of %s" % (format_count(count, margin), total),
+                    count * 100 / total,
+                )
             )
         else:
-            result.append((labels[key], count, None))
+            result.append((labels[key], format_count(count, margin), None))
     return result
 
 
+def format_count(count, margin):
+    """
+    Format a count, marking it as an estimate if it has a margin of error.
+    """
+    if margin:
+        return "≈%s ±%s" % (count, margin)
+    return count
+
+
+def mark_estimates(data):
+    """
+    Return a copy of the data with the margins of error for any estimated
+    counts added to the group they belong to.
+    """
+    estimates = data.get("estimate")
+    if not estimates:
+        return data
+    data = dict(data)
+    for (path, margin) in estimates.items():
+        group = path[0]
+        if group not in data or group == "estimate":
+            continue
+        if "estimate" not in data[group]:
+            data[group] = dict(data[group], estimate={})
+        if len(path) == 2:
+            data[group]["estimate"][path[1]] = margin
+        else:
+            data[group]["estimate"][path[1:]] = margin
+    return data
+
+
 def prepare_type_statistics(
     result, data, object_class, labels, type_key="types"
 ):
@@ -546,15 +595,17 @@ def prepare_type_statistics(
     """
     if data.get(type_key):
         output = []
+        estimates = data.get("estimate") or {}
         statistics = data.get(type_key)
         for key in statistics:
             object_type = object_class().unserialize(key)
             (count, total) = statistics[key]
+            margin = estimates.get((type_key, key))
             output.append(
                 (
                     count,
                     "• %s" % object_type,
-                    "%s of %s" % (count, total),
+                    "%s of %s" % (format_count(count, margin), total),
                     count * 100 / total,
                 )
             )
@@ -587,6 +638,8 @@ PREPARE_GROUP = {
     "privacy": get_private_statistics,
 }
 
+TREND_PERIODS = (30, 365)
+
 
 # ------------------------------------------------------------------------
 #
@@ -611,20 +664,48 @@ class StatisticsCardGroup(CardGroupList):
         self.card = TextCard(grstate, groptions)
         self.add_card(self.card)
 
-        statistics_service = StatisticsService(grstate)
-        statistics_service.connect("statistics-updated", self.load_data)
+        self.loaded = False
+        self.statistics_service = StatisticsService(grstate)
+        self.statistics_service.connect("statistics-updated", self.load_data)
+        self.statistics_service.connect(
+            "statistics-progress", self.load_progress
+        )
 
-        data = statistics_service.request_data()
+        data = self.statistics_service.request_data(GROUP_SOURCES[self.key])
         if data:
             self.load_data(data)
         else:
             self.card.load_data([(_("Calculating..."), "")])
 
+    def load_progress(self, data, complete, percent):
+        """
+        Load card data if the object types it depends on are complete,
+        otherwise show progress.
+        """
+        if self.loaded:
+            return
+        for obj_type in GROUP_SOURCES[self.key]:
+            if obj_type not in complete:
+                self.card.load_data(
+                    [(_("Calculating..."), "{0}%".format(percent))]
+                )
+                self.show_all()
+                return
+        self.render_data(data)
+
     def load_data(self, data):
         """
-        Load card data.
+        Load card data if the object types it depends on were collected.
         """
-        result = PREPARE_GROUP[self.key](data)
+        if self.statistics_service.has_categories(GROUP_SOURCES[self.key]):
+            self.render_data(data)
+
+    def render_data(self, data):
+        """
+        Render card data.
+        """
+        self.loaded = True
+        result = PREPARE_GROUP[self.key](mark_estimates(data))
 
         output = []
         for (label, value, bonus) in result:
@@ -634,3 +715,40 @@ class StatisticsCardGroup(CardGroupList):
                 output.append((label, value, ""))
         self.card.load_data(output)
         self.show_all()
+
+
+# ------------------------------------------------------------------------
+#
+# StatisticsTrendCardGroup
+#
+# ------------------------------------------------------------------------
+class StatisticsTrendCardGroup(StatisticsCardGroup):
+    """
+    The StatisticsTrendCardGroup class provides a container for showing
+    how the database statistics changed over time.
+    """
+
+    def render_data(self, data):
+        """
+        Render the trends from the statistics history.
+        """
+        self.loaded = True
+        trends = self.statistics_service.get_trends(
+            list(TREND_LABELS), TREND_PERIODS
+        )
+        output = []
+        for (name, label) in TREND_LABELS.items():
+            if name in trends:
+                (current, (month, year)) = trends[name]
+                output.append(
+                    (
+                        label,
+                        current,
+                        _("%(month)+d in 30 days, %(year)+d in a year")
+                        % {"month": month, "year": year},
+                    )
+                )
+        if not output:
+            output.append((_("No history recorded yet"), ""))
+        self.card.load_data(output)
+        self.show_all()
@@ -22,6 +22,13 @@
 TimelineCardGroup
 """
 
+# ------------------------------------------------------------------------
+#
+# Python Modules
+#
+# ------------------------------------------------------------------------
+from functools import partial
+
 # ------------------------------------------------------------------------
 #
 # Gramps Modules
@@ -43,7 +50,7 @@ from ..cards import (
     MediaCard,
     NameCard,
 )
-from .group_list import CardGroupList
+from .group_list import CardGroupList, get_list_maximum
 
 _ = glocale.translation.sgettext
 
@@ -107,8 +114,9 @@ class TimelineCardGroup(CardGroupList):
                 obj = event_person
                 if event_family:
                     obj = event_family
-                self.add_card(
-                    EventRefCard(
+                self.add_card_builder(
+                    partial(
+                        EventRefCard,
                         grstate,
                         groptions,
                         obj,
@@ -117,10 +125,13 @@ class TimelineCardGroup(CardGroupList):
                 )
             elif timeline_obj_type == "media":
                 (media, dummy_media_ref) = item
-                self.add_card(MediaCard(grstate, groptions, media))
+                self.add_card_builder(
+                    partial(MediaCard, grstate, groptions, media)
+                )
             elif timeline_obj_type == "address":
-                self.add_card(
-                    AddressCard(
+                self.add_card_builder(
+                    partial(
+                        AddressCard,
                         grstate,
                         groptions,
                         timeline_obj,
@@ -128,8 +139,9 @@ class TimelineCardGroup(CardGroupList):
                     )
                 )
             elif timeline_obj_type == "name":
-                self.add_card(
-                    NameCard(
+                self.add_card_builder(
+                    partial(
+                        NameCard,
                         grstate,
                         groptions,
                         timeline_obj,
@@ -137,16 +149,18 @@ class TimelineCardGroup(CardGroupList):
                     )
                 )
             elif timeline_obj_type == "citation":
-                self.add_card(
-                    CitationCard(
+                self.add_card_builder(
+                    partial(
+                        CitationCard,
                         grstate,
                         groptions,
                         item,
                     )
                 )
             elif timeline_obj_type == "ldsord":
-                self.add_card(
-                    LDSOrdinanceCard(
+                self.add_card_builder(
+                    partial(
+                        LDSOrdinanceCard,
                         grstate,
                         groptions,
                         timeline_obj,
@@ -211,8 +225,9 @@ class TimelineCardGroup(CardGroupList):
             self.groptions.set_relation(obj)
 
         timeline.sort(key=lambda x: x[0])
-        maximum = self.grstate.config.get("group.event.max-per-group")
-        timeline = timeline[:maximum]
+        maximum = get_list_maximum(self.grstate, "group.event.max-per-group")
+        if maximum:
+            timeline = timeline[:maximum]
         return timeline
 
     def extract_objects(self, timeline):
@@ -50,6 +50,7 @@ from gramps.gen.utils.db import family_name
 # ------------------------------------------------------------------------
 from ..actions import action_handler
 from ..common.common_utils import citation_option_text
+from ..services.service_backlinks import find_backlinks
 from ..zotero.zotero import GrampsZotero
 
 _ = glocale.translation.sgettext
@@ -991,8 +992,8 @@ def get_enclosed_places(db, place):
     Build list of enclosed places. This only returns the first set of children.
     """
     places = []
-    for (dummy_obj_type, obj_handle) in db.find_backlink_handles(
-        place.handle, ["Place"]
+    for (dummy_obj_type, obj_handle) in find_backlinks(
+        db, place.handle, ["Place"]
     ):
         places.append(db.get_place_from_handle(obj_handle))
     return places
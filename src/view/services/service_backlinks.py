@@ -0,0 +1,150 @@
+#
+# Gramps - a GTK+/GNOME based genealogy program
+#
+# Copyright (C) 2022       Christopher Horn
+#
+# This program is free software; you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation; either version 2 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program; if not, write to the Free Software
+# Foundation, Inc., 51 Franklin Street, Fifth Floor, Boston, MA 02110-1301 USA.
+#
+
+"""
+BacklinkService
+"""
+
+# -------------------------------------------------------------------------
+#
+# Gramps Modules
+#
+# -------------------------------------------------------------------------
+from gramps.gen.errors import HandleError
+
+# -------------------------------------------------------------------------
+#
+# Plugin Modules
+#
+# -------------------------------------------------------------------------
+from .service_signals import get_signal_map
+
+
+# -------------------------------------------------------------------------
+#
+# BacklinkService Class
+#
+# -------------------------------------------------------------------------
+class BacklinkService:
+    """
+    A singleton class that remembers the backlinks for each object as they
+    are looked up, so an object referenced all over a page is only queried
+    once. Entries are dropped when an object referring to them changes.
+    """
+
+    def __new__(cls, grstate):
+        """
+        Return the singleton class.
+        """
+        if not hasattr(cls, "instance"):
+            cls.instance = super(BacklinkService, cls).__new__(cls)
+            cls.instance.__init_singleton__(grstate)
+        return cls.instance
+
+    def __init_singleton__(self, grstate):
+        """
+        Prepare the backlink service for use.
+        """
+        self.dbstate = grstate.dbstate
+        self.backlinks = {}
+        self.referrers = {}
+        self.signal_map = get_signal_map(
+            [
+                "Person",
+                "Family",
+                "Event",
+                "Place",
+                "Source",
+                "Citation",
+                "Media",
+                "Repository",
+                "Note",
+                "Tag",
+            ],
+            self.drop_backlinks,
+        )
+        self.dbstate.connect("database-changed", self.database_changed)
+        self.database_changed()
+
+    def database_changed(self, *_dummy_args):
+        """
+        Connect to the new database and forget everything.
+        """
+        for (sig, callback) in self.signal_map.items():
+            self.dbstate.db.connect(sig, callback)
+        self.clear_cache()
+
+    def clear_cache(self):
+        """
+        Forget everything.
+        """
+        self.backlinks = {}
+        self.referrers = {}
+
+    def get_backlinks(self, handle, include_classes=None):
+        """
+        Return the list of (obj_type, handle) tuples for the objects that
+        refer to the given one.
+        """
+        backlinks = self.backlinks.get(handle)
+        if backlinks is None:
+            backlinks = list(self.dbstate.db.find_backlink_handles(handle))
+            self.backlinks[handle] = backlinks
+            for (dummy_obj_type, obj_handle) in backlinks:
+                self.referrers.setdefault(obj_handle, set()).add(handle)
+        if include_classes:
+            return [x for x in backlinks if x[0] in include_classes]
+        return backlinks
+
+    def drop_backlinks(self, obj_type, handles=None):
+        """
+        Drop the entries a changed object may appear in, or everything if
+        the handles are not known.
+        """
+        if handles is None:
+            self.clear_cache()
+            return
+        if not self.backlinks:
+            return
+        get_object = self.dbstate.db.method("get_%s_from_handle", obj_type)
+        for handle in handles:
+            targets = self.referrers.pop(handle, set())
+            targets.add(handle)
+            try:
+                obj = get_object(handle)
+            except HandleError:
+                obj = None
+            if obj:
+                targets.update(
+                    x[1] for x in obj.get_referenced_handles_recursively()
+                )
+            for target in targets:
+                self.backlinks.pop(target, None)
+
+
+def find_backlinks(db, handle, include_classes=None):
+    """
+    Return backlinks through the service if it is running for the database,
+    otherwise query the database directly.
+    """
+    service = getattr(BacklinkService, "instance", None)
+    if service and service.dbstate.db is db:
+        return service.get_backlinks(handle, include_classes)
+    return list(db.find_backlink_handles(handle, include_classes))
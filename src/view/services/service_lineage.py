@@ -0,0 +1,212 @@
+#
+# Gramps - a GTK+/GNOME based genealogy program
+#
+# Copyright (C) 2022       Christopher Horn
+#
+# This program is free software; you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation; either version 2 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program; if not, write to the Free Software
+# Foundation, Inc., 51 Franklin Street, Fifth Floor, Boston, MA 02110-1301 USA.
+#
+
+"""
+LineageService
+"""
+
+# -------------------------------------------------------------------------
+#
+# Plugin Modules
+#
+# -------------------------------------------------------------------------
+from .service_signals import get_signal_map
+
+
+# -------------------------------------------------------------------------
+#
+# LineageService Class
+#
+# -------------------------------------------------------------------------
+class LineageService:
+    """
+    A singleton class that remembers the direct paternal and maternal lines
+    of people, as the list of main parent families from a person back to
+    the progenitors. Walking a line caches it for every ancestor on it as
+    well. A line that loops back on itself is cut where the loop starts.
+    """
+
+    def __new__(cls, grstate):
+        """
+        Return the singleton class.
+        """
+        if not hasattr(cls, "instance"):
+            cls.instance = super(LineageService, cls).__new__(cls)
+            cls.instance.__init_singleton__(grstate)
+        return cls.instance
+
+    def __init_singleton__(self, grstate):
+        """
+        Prepare the lineage service for use.
+        """
+        self.dbstate = grstate.dbstate
+        self.lines = {}
+        self.ends = {}
+        self.dependents = {}
+        self.signal_map = get_signal_map(["Person", "Family"], self.drop_lines)
+        self.dbstate.connect("database-changed", self.database_changed)
+        self.database_changed()
+
+    def database_changed(self, *_dummy_args):
+        """
+        Connect to the new database and forget the lines.
+        """
+        for (sig, callback) in self.signal_map.items():
+            self.dbstate.db.connect(sig, callback)
+        self.clear_cache()
+
+    def clear_cache(self):
+        """
+        Forget the lines.
+        """
+        self.lines = {}
+        self.ends = {}
+        self.dependents = {}
+
+    def drop_lines(self, obj_type, handles=None):
+        """
+        Forget the lines that pass through changed people or families.
+        """
+        if obj_type not in ["Person", "Family"]:
+            return
+        if handles is None:
+            self.clear_cache()
+            return
+        for handle in handles:
+            for key in self.dependents.pop(handle, []):
+                self.lines.pop(key, None)
+                self.ends.pop(key, None)
+
+    def get_line(self, person_handle, maternal=False):
+        """
+        Return the handles of the families in the direct line of a person,
+        starting with their main parents.
+        """
+        key = (person_handle, maternal)
+        if key not in self.lines:
+            self.walk_line(person_handle, maternal)
+        return tuple(x[1] for x in self.lines[key])
+
+    def walk_line(self, person_handle, maternal):
+        """
+        Walk a direct line back until it ends, loops, or reaches someone
+        whose line is already known. The line is kept as a list of person
+        and main parent family handle pairs, along with the person it ends
+        with as they may later gain parents.
+        """
+        db = self.dbstate.db
+        entries = []
+        seen = set()
+        looped = False
+        handle = person_handle
+        while handle:
+            known = self.lines.get((handle, maternal))
+            if known is not None:
+                for entry in known:
+                    if entry[1] in seen:
+                        looped = True
+                        break
+                    seen.add(entry[1])
+                    entries.append(entry)
+                handle = self.ends.get((handle, maternal))
+                break
+            person = db.get_person_from_handle(handle)
+            if not person:
+                break
+            family_handle = person.get_main_parents_family_handle()
+            if not family_handle:
+                break
+            if family_handle in seen:
+                looped = True
+                break
+            family = db.get_family_from_handle(family_handle)
+            if not family:
+                break
+            seen.add(family_handle)
+            entries.append((handle, family_handle))
+            if maternal:
+                handle = family.mother_handle
+            else:
+                handle = family.father_handle
+
+        if looped or not entries:
+            self.record_line(person_handle, maternal, tuple(entries), handle)
+            return
+        for index, entry in enumerate(entries):
+            key = (entry[0], maternal)
+            if key in self.lines:
+                break
+            self.record_line(
+                entry[0], maternal, tuple(entries[index:]), handle
+            )
+
+    def record_line(self, person_handle, maternal, line, end):
+        """
+        Record a line and the people and families it depends on.
+        """
+        key = (person_handle, maternal)
+        self.lines[key] = line
+        self.ends[key] = end
+        self.dependents.setdefault(person_handle, set()).add(key)
+        if end:
+            self.dependents.setdefault(end, set()).add(key)
+        for entry in line:
+            for handle in entry:
+                self.dependents.setdefault(handle, set()).add(key)
+
+
+def find_line(db, person_handle, maternal=False):
+    """
+    Return the handles of the families in the direct line of a person
+    through the service if it is running for the database, otherwise by
+    walking the line.
+    """
+    service = getattr(LineageService, "instance", None)
+    if service and service.dbstate.db is db:
+        return service.get_line(person_handle, maternal=maternal)
+    line = []
+    handle = person_handle
+    while handle:
+        person = db.get_person_from_handle(handle)
+        if not person:
+            break
+        family_handle = person.get_main_parents_family_handle()
+        if not family_handle or family_handle in line:
+            break
+        family = db.get_family_from_handle(family_handle)
+        if not family:
+            break
+        line.append(family_handle)
+        if maternal:
+            handle = family.mother_handle
+        else:
+            handle = family.father_handle
+    return tuple(line)
+
+
+def find_progenitors(db, person_handle, maternal=False):
+    """
+    Return the progenitor family handle for a person and the number of
+    generations back to it.
+    """
+    line = find_line(db, person_handle, maternal=maternal)
+    if line:
+        return line[-1], len(line)
+    return None, 0
@@ -0,0 +1,233 @@
+#
+# Gramps - a GTK+/GNOME based genealogy program
+#
+# Copyright (C) 2022       Christopher Horn
+#
+# This program is free software; you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation; either version 2 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program; if not, write to the Free Software
+# Foundation, Inc., 51 Franklin Street, Fifth Floor, Boston, MA 02110-1301 USA.
+#
+
+"""
+EventParticipantService
+"""
+
+# -------------------------------------------------------------------------
+#
+# Gtk Modules
+#
+# -------------------------------------------------------------------------
+from gi.repository import GLib
+
+# -------------------------------------------------------------------------
+#
+# Gramps Modules
+#
+# -------------------------------------------------------------------------
+from gramps.gen.errors import HandleError
+
+# -------------------------------------------------------------------------
+#
+# Plugin Modules
+#
+# -------------------------------------------------------------------------
+from .service_signals import get_signal_map
+
+BUILD_CHUNK = 500
+
+
+# -------------------------------------------------------------------------
+#
+# EventParticipantService Class
+#
+# -------------------------------------------------------------------------
+class EventParticipantService:
+    """
+    A singleton class that maintains an index from each event to the people
+    and families that refer to it, with the role they played. The index is
+    built in idle time starting the first time it is needed and then
+    updated as people, families and events change. Until it is ready the
+    participants are found from the event backlinks.
+    """
+
+    def __new__(cls, grstate):
+        """
+        Return the singleton class.
+        """
+        if not hasattr(cls, "instance"):
+            cls.instance = super(EventParticipantService, cls).__new__(cls)
+            cls.instance.__init_singleton__(grstate)
+        return cls.instance
+
+    def __init_singleton__(self, grstate):
+        """
+        Prepare the participant service for use.
+        """
+        self.dbstate = grstate.dbstate
+        self.index = None
+        self.contributions = {}
+        self.pending = None
+        self.updated = set()
+        self.build_id = None
+        self.signal_map = get_signal_map(
+            ["Person", "Family", "Event"], self.update_participants
+        )
+        self.dbstate.connect("database-changed", self.database_changed)
+        self.database_changed()
+
+    def database_changed(self, *_dummy_args):
+        """
+        Connect to the new database and forget the index.
+        """
+        for (sig, callback) in self.signal_map.items():
+            self.dbstate.db.connect(sig, callback)
+        self.clear_cache()
+
+    def clear_cache(self):
+        """
+        Forget the index, stopping any build in progress.
+        """
+        if self.build_id:
+            GLib.source_remove(self.build_id)
+            self.build_id = None
+        self.index = None
+        self.contributions = {}
+        self.pending = None
+        self.updated = set()
+
+    def start_build(self):
+        """
+        Start building the participant index in idle time.
+        """
+        db = self.dbstate.db
+        self.index = {}
+        self.contributions = {}
+        self.updated = set()
+        self.pending = [("Family", x) for x in db.get_family_handles()]
+        self.pending.extend(("Person", x) for x in db.get_person_handles())
+        self.build_id = GLib.idle_add(self.build_step)
+
+    def build_step(self):
+        """
+        Index the next chunk of people and families, skipping any already
+        indexed because they changed during the build.
+        """
+        db = self.dbstate.db
+        for dummy_count in range(BUILD_CHUNK):
+            if not self.pending:
+                self.pending = None
+                self.updated = set()
+                self.build_id = None
+                return False
+            obj_type, handle = self.pending.pop()
+            if handle in self.updated:
+                continue
+            try:
+                obj = db.method("get_%s_from_handle", obj_type)(handle)
+            except HandleError:
+                obj = None
+            if obj:
+                self.add_participant(obj_type, obj)
+        return True
+
+    def add_participant(self, obj_type, obj):
+        """
+        Index the events a person or family refers to.
+        """
+        events = set()
+        for event_ref in obj.event_ref_list:
+            self.index.setdefault(event_ref.ref, []).append(
+                (obj_type, obj.handle, event_ref.get_role())
+            )
+            events.add(event_ref.ref)
+        if events:
+            self.contributions[obj.handle] = events
+
+    def remove_participant(self, handle):
+        """
+        Remove a person or family from the index.
+        """
+        for event_handle in self.contributions.pop(handle, []):
+            entries = [
+                x for x in self.index.get(event_handle, []) if x[1] != handle
+            ]
+            if entries:
+                self.index[event_handle] = entries
+            else:
+                self.index.pop(event_handle, None)
+
+    def get_participants(self, event_handle):
+        """
+        Return the list of (obj_type, handle, role) entries for the people
+        and families that took part in an event.
+        """
+        if self.index is None:
+            self.start_build()
+        if self.pending is not None:
+            return get_backlink_participants(self.dbstate.db, event_handle)
+        return self.index.get(event_handle, [])
+
+    def update_participants(self, obj_type, handles=None):
+        """
+        Update the index for changed objects, or discard it if the handles
+        are not known.
+        """
+        if self.index is None or obj_type not in ["Person", "Family", "Event"]:
+            return
+        if handles is None:
+            self.clear_cache()
+            return
+        if obj_type == "Event":
+            for handle in handles:
+                if not self.dbstate.db.has_event_handle(handle):
+                    self.index.pop(handle, None)
+            return
+        get_object = self.dbstate.db.method("get_%s_from_handle", obj_type)
+        for handle in handles:
+            if self.pending is not None:
+                self.updated.add(handle)
+            self.remove_participant(handle)
+            try:
+                obj = get_object(handle)
+            except HandleError:
+                obj = None
+            if obj:
+                self.add_participant(obj_type, obj)
+
+
+def find_participants(db, event_handle):
+    """
+    Return the participant entries for an event through the service if it
+    is running for the database, otherwise from the event backlinks.
+    """
+    service = getattr(EventParticipantService, "instance", None)
+    if service and service.dbstate.db is db:
+        return service.get_participants(event_handle)
+    return get_backlink_participants(db, event_handle)
+
+
+def get_backlink_participants(db, event_handle):
+    """
+    Return the participant entries for an event from the event backlinks.
+    """
+    participants = []
+    for (obj_type, obj_handle) in db.find_backlink_handles(
+        event_handle, ["Person", "Family"]
+    ):
+        get_object = db.method("get_%s_from_handle", obj_type)
+        for event_ref in get_object(obj_handle).event_ref_list:
+            if event_ref.ref == event_handle:
+                participants.append(
+                    (obj_type, obj_handle, event_ref.get_role())
+                )
+    return participants
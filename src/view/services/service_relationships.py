@@ -0,0 +1,315 @@
+#
+# Gramps - a GTK+/GNOME based genealogy program
+#
+# Copyright (C) 2022       Christopher Horn
+#
+# This program is free software; you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation; either version 2 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program; if not, write to the Free Software
+# Foundation, Inc., 51 Franklin Street, Fifth Floor, Boston, MA 02110-1301 USA.
+#
+
+"""
+RelationshipService
+"""
+
+# -------------------------------------------------------------------------
+#
+# Gramps Modules
+#
+# -------------------------------------------------------------------------
+from gramps.gen.config import config as global_config
+from gramps.gen.const import GRAMPS_LOCALE as glocale
+from gramps.gen.errors import HandleError
+from gramps.gen.relationship import get_relationship_calculator
+
+# -------------------------------------------------------------------------
+#
+# Plugin Modules
+#
+# -------------------------------------------------------------------------
+from .service_signals import get_signal_map
+
+
+# -------------------------------------------------------------------------
+#
+# RelationshipService Class
+#
+# -------------------------------------------------------------------------
+class RelationshipService:
+    """
+    A singleton class that keeps one relationship calculator per language
+    and remembers the relationships it has worked out. As a relationship
+    can depend on any part of the family graph all of them are forgotten
+    when a person, family or event changes.
+    """
+
+    def __new__(cls, grstate):
+        """
+        Return the singleton class.
+        """
+        if not hasattr(cls, "instance"):
+            cls.instance = super(RelationshipService, cls).__new__(cls)
+            cls.instance.__init_singleton__(grstate)
+        return cls.instance
+
+    def __init_singleton__(self, grstate):
+        """
+        Prepare the relationship service for use.
+        """
+        self.dbstate = grstate.dbstate
+        self.calculators = {}
+        self.results = {}
+        self.signal_map = get_signal_map(
+            ["Person", "Family", "Event"], self.drop_relationships
+        )
+        self.dbstate.connect("database-changed", self.database_changed)
+        self.database_changed()
+
+    def database_changed(self, *_dummy_args):
+        """
+        Connect to the new database and forget the relationships.
+        """
+        for (sig, callback) in self.signal_map.items():
+            self.dbstate.db.connect(sig, callback)
+        self.clear_cache()
+
+    def clear_cache(self):
+        """
+        Forget the relationships and the ancestor maps the calculators
+        keep.
+        """
+        self.results = {}
+        for calculator in self.calculators.values():
+            calculator.dirtymap = True
+
+    def drop_relationships(self, obj_type, _dummy_handles=None):
+        """
+        Forget the relationships after a change that may affect them.
+        """
+        if obj_type in ["Person", "Family", "Event"]:
+            self.clear_cache()
+
+    def get_calculator(self, depth, locale=glocale):
+        """
+        Return the calculator for a language set to search to a depth.
+        """
+        language = locale.language[0]
+        calculator = self.calculators.get(language)
+        if calculator is None:
+            calculator = get_relationship_calculator(
+                reinit=True, clocale=locale
+            )
+            calculator.storemap = True
+            self.calculators[language] = calculator
+        calculator.set_depth(depth)
+        return calculator
+
+    def get_one_relationship(
+        self, person, other, depth=None, extra_info=False, locale=glocale
+    ):
+        """
+        Return the most relevant relationship of other to person.
+        """
+        depth = get_depth(depth)
+        key = (
+            "one",
+            person.handle,
+            other.handle,
+            depth,
+            extra_info,
+            locale.language[0],
+        )
+        if key not in self.results:
+            calculator = self.get_calculator(depth, locale=locale)
+            self.results[key] = calculator.get_one_relationship(
+                self.dbstate.db, person, other, extra_info=extra_info
+            )
+        return self.results[key]
+
+    def get_all_relationships(self, person, other, depth=None, locale=glocale):
+        """
+        Return all of the relationships of other to person.
+        """
+        depth = get_depth(depth)
+        key = ("all", person.handle, other.handle, depth, locale.language[0])
+        if key not in self.results:
+            calculator = self.get_calculator(depth, locale=locale)
+            self.results[key] = calculator.get_all_relationships(
+                self.dbstate.db, person, other
+            )
+        return self.results[key]
+
+    def get_relationships(self, person, others, depth=None, locale=glocale):
+        """
+        Return a dictionary with the relationship of each of a list of
+        people to person. A single search out from person finds their kin
+        so the calculator only runs for those, anyone else is unrelated.
+        """
+        depth = get_depth(depth)
+        key = ("kin", person.handle, depth)
+        relationships = {}
+        for other in others:
+            if other.handle in relationships:
+                continue
+            if key not in self.results:
+                self.results[key] = find_kin(self.dbstate.db, person, depth)
+            if other.handle in self.results[key]:
+                relationships[other.handle] = self.get_one_relationship(
+                    person, other, depth=depth, locale=locale
+                )
+            else:
+                relationships[other.handle] = ""
+        return relationships
+
+
+def get_depth(depth):
+    """
+    Return the search depth, defaulting to the configured one.
+    """
+    if depth:
+        return depth
+    return global_config.get("behavior.generation-depth")
+
+
+def find_kin(db, person, depth):
+    """
+    Return the handles of everyone who may share an ancestor with person
+    within the search depth, along with the spouses of person. They are
+    found going up to the ancestors of person and then down to all of
+    their descendants, following every parent family as the calculator
+    does. Families without parents lead to the siblings instead.
+    """
+    kin = {person.handle}
+    for family in get_families(db, person.family_list):
+        kin.update(
+            x for x in (family.father_handle, family.mother_handle) if x
+        )
+    seen = {person.handle}
+    current = [person]
+    ancestors = [person]
+    for dummy_generation in range(depth):
+        following = []
+        for family in get_families(db, get_parent_families(current)):
+            handles = [
+                x for x in (family.father_handle, family.mother_handle) if x
+            ] or [x.ref for x in family.child_ref_list]
+            following.extend(get_new_people(db, handles, seen))
+        ancestors.extend(following)
+        current = following
+    current = ancestors
+    for dummy_generation in range(depth):
+        following = []
+        for family in get_families(db, get_own_families(current)):
+            handles = [x.ref for x in family.child_ref_list]
+            following.extend(get_new_people(db, handles, seen))
+        current = following
+    kin.update(seen)
+    return kin
+
+
+def get_parent_families(people):
+    """
+    Return the handles of the families people are children in.
+    """
+    return list(
+        dict.fromkeys(
+            x for person in people for x in person.parent_family_list
+        )
+    )
+
+
+def get_own_families(people):
+    """
+    Return the handles of the families people are parents in.
+    """
+    return list(
+        dict.fromkeys(x for person in people for x in person.family_list)
+    )
+
+
+def get_families(db, handles):
+    """
+    Return the families for a list of handles, skipping any missing.
+    """
+    families = []
+    for handle in handles:
+        try:
+            families.append(db.get_family_from_handle(handle))
+        except HandleError:
+            continue
+    return families
+
+
+def get_new_people(db, handles, seen):
+    """
+    Return the people for the handles not yet seen, marking them seen.
+    """
+    people = []
+    for handle in handles:
+        if handle not in seen:
+            seen.add(handle)
+            try:
+                people.append(db.get_person_from_handle(handle))
+            except HandleError:
+                continue
+    return people
+
+
+def find_relationship(
+    db, person, other, depth=None, extra_info=False, locale=glocale
+):
+    """
+    Return the most relevant relationship of other to person through the
+    service if it is running for the database.
+    """
+    service = getattr(RelationshipService, "instance", None)
+    if service and service.dbstate.db is db:
+        return service.get_one_relationship(
+            person, other, depth=depth, extra_info=extra_info, locale=locale
+        )
+    calculator = get_relationship_calculator(reinit=True, clocale=locale)
+    calculator.set_depth(get_depth(depth))
+    return calculator.get_one_relationship(
+        db, person, other, extra_info=extra_info
+    )
+
+
+def find_all_relationships(db, person, other, depth=None, locale=glocale):
+    """
+    Return all of the relationships of other to person through the service
+    if it is running for the database.
+    """
+    service = getattr(RelationshipService, "instance", None)
+    if service and service.dbstate.db is db:
+        return service.get_all_relationships(
+            person, other, depth=depth, locale=locale
+        )
+    calculator = get_relationship_calculator(reinit=True, clocale=locale)
+    calculator.set_depth(get_depth(depth))
+    return calculator.get_all_relationships(db, person, other)
+
+
+def find_relationships(db, person, others, depth=None, locale=glocale):
+    """
+    Return a dictionary with the relationship of each of a list of people
+    to person through the service if it is running for the database.
+    """
+    service = getattr(RelationshipService, "instance", None)
+    if service and service.dbstate.db is db:
+        return service.get_relationships(
+            person, others, depth=depth, locale=locale
+        )
+    return {
+        x.handle: find_relationship(db, person, x, depth=depth, locale=locale)
+        for x in others
+    }
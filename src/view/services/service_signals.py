@@ -0,0 +1,53 @@
+#
+# Gramps - a GTK+/GNOME based genealogy program
+#
+# Copyright (C) 2022       Christopher Horn
+#
+# This program is free software; you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation; either version 2 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program; if not, write to the Free Software
+# Foundation, Inc., 51 Franklin Street, Fifth Floor, Boston, MA 02110-1301 USA.
+#
+
+"""
+Database signal helpers for the services and views.
+"""
+
+SIGNAL_ACTIONS = ["add", "update", "delete", "rebuild"]
+
+
+def make_callback(method, *args):
+    """
+    Return a callback for a database signal that calls the method with the
+    given arguments followed by the handles, which are None for a rebuild.
+    Gramps only calls functions and methods for signals so a partial can
+    not be used.
+    """
+
+    def callback(handles=None):
+        method(*args, handles)
+
+    return callback
+
+
+def get_signal_map(obj_types, method):
+    """
+    Return a map of the add, update, delete and rebuild signals for the
+    object types to callbacks calling the method with the object type and
+    the handles.
+    """
+    signal_map = {}
+    for obj_type in obj_types:
+        callback = make_callback(method, obj_type)
+        for action in SIGNAL_ACTIONS:
+            signal_map["{}-{}".format(obj_type.lower(), action)] = callback
+    return signal_map
@@ -33,6 +33,8 @@ import os
 import sys
 import time
 import pickle
+from functools import partial
+from queue import Empty, Queue
 from subprocess import Popen, PIPE, TimeoutExpired
 from threading import Event, Lock, Thread
 
@@ -49,7 +51,7 @@ from gi.repository import GLib
 #
 # -------------------------------------------------------------------------
 from gramps.gen.const import GRAMPS_LOCALE as glocale
-from gramps.gen.const import USER_PLUGINS
+from gramps.gen.const import USER_PLUGINS, VERSION_DIR
 from gramps.gen.utils.callback import Callback
 
 # -------------------------------------------------------------------------
@@ -57,7 +59,15 @@ from gramps.gen.utils.callback import Callback
 # Plugin Modules
 #
 # -------------------------------------------------------------------------
-from .service_statistics_worker import gather_statistics, get_object_list
+from .service_signals import SIGNAL_ACTIONS, make_callback
+from .service_statistics_history import StatisticsHistory
+from .service_statistics_worker import (
+    build_statistics_ledger,
+    fold,
+    gather_statistics,
+    get_object_list,
+    read_message,
+)
 
 CATEGORIES = [
     "Person",
@@ -72,6 +82,42 @@ CATEGORIES = [
     "Tag",
 ]
 
+ALL_TYPES = (
+    "Person",
+    "Family",
+    "Event",
+    "Place",
+    "Media",
+    "Source",
+    "Citation",
+    "Repository",
+    "Note",
+    "Tag",
+)
+
+GROUP_SOURCES = {
+    "person": ("Person",),
+    "person-short": ("Person",),
+    "family": ("Family", "Event"),
+    "child": ("Family",),
+    "association": ("Person",),
+    "event": ("Event",),
+    "ldsordperson": ("Person",),
+    "ldsordfamily": ("Family",),
+    "participant": ("Person", "Family"),
+    "place": ("Place",),
+    "media": ALL_TYPES[:7],
+    "note": ("Note",),
+    "bookmark": ("Bookmark",),
+    "tag": ALL_TYPES,
+    "repository": ("Repository",),
+    "source": ("Source",),
+    "citation": ("Citation",),
+    "uncited": ALL_TYPES[:5],
+    "privacy": ALL_TYPES[:9],
+    "trend": (),
+}
+
 _ = glocale.translation.sgettext
 
 
@@ -87,6 +133,7 @@ class StatisticsService(Callback):
 
     __signals__ = {
         "statistics-updated": (dict,),
+        "statistics-progress": (dict, list, int),
         "changes-detected": (),
     }
 
@@ -111,20 +158,61 @@ class StatisticsService(Callback):
                 self.__init_callback = True
             if grstate:
                 self.dbstate = grstate.dbstate
+                self.config = grstate.config
                 self.threshold = grstate.config.get(
                     "dashboard.concurrent-threshold"
                 )
                 self.all_events = grstate.config.get(
                     "dashboard.summarize-all-events"
                 )
+                self.incremental = grstate.config.get(
+                    "dashboard.incremental-updates"
+                )
+                self.auto_recalculate = grstate.config.get(
+                    "dashboard.auto-recalculate"
+                )
+                self.quiet_period = grstate.config.get(
+                    "dashboard.recalculate-quiet-period"
+                )
+                self.max_staleness = (
+                    grstate.config.get("dashboard.recalculate-max-staleness")
+                    * 1000
+                )
+                self.sample = grstate.config.get(
+                    "dashboard.approximate-sample-percentage"
+                )
+                self.timer = None
+                self.first_change = None
                 self.threads = []
                 self.lock = Lock()
                 self.data = {}
+                self.ledger = None
+                self.pending_changes = None
+                self.payloads = {}
+                self.dirty = set()
+                self.wanted = set()
+                self.estimated = False
+                self.running_categories = None
+                self.history = StatisticsHistory(
+                    os.path.join(
+                        VERSION_DIR,
+                        "statistics",
+                        "CardView_statistics_history.db",
+                    )
+                )
                 self.worker = find_statistics_service_worker()
+                self.worker_process = None
+                self.worker_messages = None
+                self.worker_dbname = None
                 self.concurrent = self.determine_collection_method()
                 self.signal_map = {}
                 for obj_type in CATEGORIES:
-                    self.__register_signals(obj_type)
+                    for action in SIGNAL_ACTIONS:
+                        self.signal_map[
+                            "{}-{}".format(obj_type.lower(), action)
+                        ] = make_callback(
+                            self.change_detected, obj_type, action
+                        )
                 self.dbstate.connect("database-changed", self.database_changed)
                 self.__init = True
 
@@ -135,21 +223,95 @@ class StatisticsService(Callback):
         for sig, callback in self.signal_map.items():
             self.dbstate.db.connect(sig, callback)
 
-    def __register_signals(self, object_type):
+    def change_detected(self, obj_type, action, handles=None):
         """
-        Register signal.
+        Record a change for the next scheduled update. If collecting
+        incrementally a rebuild triggers a full collection.
         """
-        lower_type = object_type.lower()
-        for sig in ["add", "update", "delete", "rebuild"]:
-            self.signal_map[
-                "{}-{}".format(lower_type, sig)
-            ] = self.change_detected
+        if self.incremental:
+            if action == "rebuild":
+                self.spawn_collect_statistics()
+                return
+            if not handles:
+                return
+            if self.pending_changes is None:
+                self.pending_changes = []
+            self.pending_changes.append((obj_type, action, handles))
+        elif action == "rebuild":
+            self.dirty.update(CATEGORIES)
+        else:
+            self.dirty.add(obj_type)
+            if obj_type in ["Event", "Family"]:
+                self.dirty.add("Person")
+        self.schedule_update()
+
+    def schedule_update(self):
+        """
+        Schedule an update once changes stop arriving for the quiet period,
+        but no later than the maximum staleness after the first change.
+        """
+        now = time.monotonic() * 1000
+        if self.first_change is None:
+            self.first_change = now
+        if self.timer:
+            GLib.source_remove(self.timer)
+        delay = min(
+            self.quiet_period, self.first_change + self.max_staleness - now
+        )
+        self.timer = GLib.timeout_add(max(int(delay), 0), self.run_update)
+        if self.auto_recalculate and not self.incremental:
+            self.cancel_collection()
+
+    def cancel_update(self):
+        """
+        Cancel a scheduled update.
+        """
+        if self.timer:
+            GLib.source_remove(self.timer)
+        self.timer = None
+        self.first_change = None
+
+    def run_update(self):
+        """
+        Handle the scheduled update for the accumulated changes.
+        """
+        self.timer = None
+        self.first_change = None
+        if self.incremental:
+            if self.ledger and self.pending_changes:
+                self.apply_pending_changes()
+                self.save_snapshot()
+                self.record_history()
+                self.emit("statistics-updated", (self.data,))
+        elif self.auto_recalculate:
+            self.recalculate_data()
+        else:
+            self.emit("changes-detected", ())
+        return False
 
-    def change_detected(self, *_dummy_args):
+    def cancel_collection(self):
         """
-        Emit change detected signal.
+        Abandon a collection in progress for the open tree as the data
+        it returns will already be stale.
         """
-        self.emit("changes-detected", ())
+        current_dbname = self.dbstate.db.get_dbname()
+        for (dbname, dummy_thread, event) in self.threads:
+            if dbname == current_dbname and not event.is_set():
+                event.set()
+                if self.running_categories:
+                    self.dirty.update(self.running_categories)
+                else:
+                    self.dirty.update(CATEGORIES)
+
+    def apply_pending_changes(self):
+        """
+        Apply the queued changes to the ledger.
+        """
+        if self.ledger and self.pending_changes:
+            self.ledger.apply_changes(self.dbstate.db, self.pending_changes)
+            with self.lock:
+                self.data = self.ledger.summarize(self.dbstate.db)
+        self.pending_changes = None
 
     def determine_collection_method(self):
         """
@@ -163,100 +325,292 @@ class StatisticsService(Callback):
                 return True
         return False
 
-    def emit_statistics_updated(self, thread_dbname):
+    def emit_statistics_updated(self, thread_event):
         """
         Emit statistics updated signal.
         """
-        for (index, (dbname, dummy_thread, dummy_event)) in enumerate(
+        for (index, (dbname, dummy_thread, event)) in enumerate(
             self.threads
         ):
-            if dbname == thread_dbname:
-                if self.dbstate.db.get_dbname() == thread_dbname:
-                    self.emit("statistics-updated", (self.data,))
+            if event is thread_event:
                 del self.threads[index]
+                if self.dbstate.db.get_dbname() == dbname:
+                    self.apply_pending_changes()
+                    self.save_snapshot()
+                    self.record_history()
+                    self.emit("statistics-updated", (self.data,))
+                    self.collect_missing_categories()
+                break
+        return False
+
+    def emit_statistics_estimated(self, thread_event):
+        """
+        Emit statistics updated signal for the estimated statistics.
+        """
+        for (dbname, dummy_thread, event) in self.threads:
+            if event is thread_event and not event.is_set():
+                if self.dbstate.db.get_dbname() == dbname:
+                    self.emit("statistics-updated", (self.data,))
+                break
         return False
 
-    def clean_stale_thread(self, thread_dbname):
+    def clean_stale_thread(self, thread_event):
         """
         Cleanup aborted thread entry.
         """
-        for (index, (dbname, dummy_thread, dummy_event)) in enumerate(
+        for (index, (dummy_dbname, dummy_thread, event)) in enumerate(
             self.threads
         ):
-            if dbname == thread_dbname:
+            if event is thread_event:
                 del self.threads[index]
+                break
+        return False
 
-    def collect_statistics(self, event, dbname):
+    def collect_statistics(self, event, dbname, categories, keep_data):
         """
-        Thread to handle the statistics collection work.
+        Thread to handle the statistics collection work. If categories are
+        given only the statistics for those object types are collected, and
+        if keep_data is set those for the others are retained.
         """
         s = time.time()
         done = False
-        if self.concurrent and self.worker:
-            args = ["python3", "-u", self.worker, "-t", dbname]
-            if self.all_events:
-                args.append("-a")
-            try:
-                process = Popen(args, stdout=PIPE)
-                finished = False
-                while not finished:
-                    try:
-                        output, dummy_errors = process.communicate(timeout=0.1)
-                        finished = True
-                    except TimeoutExpired:
-                        if event.is_set():
-                            process.terminate()
-                            output, dummy_errors = process.communicate()
-                            finished = True
-                if not event.is_set():
-                    with self.lock:
-                        self.data = pickle.loads(output)
-                print(
-                    "stats collected: %s" % (time.time() - s), file=sys.stderr
-                )
-                done = True
-            except FileNotFoundError:
-                self.worker = None
-            except EOFError:
-                self.worker = None
-        if not done:
+        if self.incremental:
             args = {
                 "all_events": self.all_events,
                 "tree_name": dbname,
-                "serial": True,
+                "raw": True,
             }
-            dummy_total, data = gather_statistics(args, event=event)
+            ledger, data = build_statistics_ledger(args, thread_event=event)
             if not event.is_set():
                 with self.lock:
+                    self.ledger = ledger
                     self.data = data
+                    self.payloads = {}
+                    self.wanted = set(CATEGORIES)
+            print("stats collected: %s" % (time.time() - s), file=sys.stderr)
+            done = True
+        if not done and not keep_data and self.concurrent and self.sample:
+            payloads = self.collect_payloads(
+                event, dbname, categories, sample=self.sample / 100
+            )
+            if not event.is_set():
+                with self.lock:
+                    self.data = self.merge_payloads(payloads, False)
+                    self.estimated = True
+                GLib.idle_add(self.emit_statistics_estimated, event)
+        if not done and not event.is_set():
+            payloads = self.collect_payloads(event, dbname, categories)
+            if not event.is_set():
+                with self.lock:
+                    self.data = self.merge_payloads(payloads, keep_data)
+                    self.estimated = False
             print("stats collected: %s" % (time.time() - s), file=sys.stderr)
         if not event.is_set():
-            GLib.idle_add(self.emit_statistics_updated, dbname)
+            GLib.idle_add(self.emit_statistics_updated, event)
+        else:
+            GLib.idle_add(self.clean_stale_thread, event)
+
+    def collect_payloads(self, event, dbname, categories, sample=None):
+        """
+        Collect the statistics for each object type using the worker process
+        if needed and available, otherwise serially. If a sample fraction is
+        given the statistics are estimated.
+        """
+        if self.concurrent and self.worker:
+            try:
+                progress = self.stream_statistics(
+                    event, dbname, categories, sample=sample
+                )
+                return progress["payloads"]
+            except FileNotFoundError:
+                self.worker = None
+            except EOFError:
+                self.worker = None
+        args = {
+            "all_events": self.all_events,
+            "tree_name": dbname,
+            "serial": True,
+            "raw": True,
+            "categories": categories,
+            "sample": sample,
+        }
+        progress = get_progress()
+        gather_statistics(
+            args,
+            event=event,
+            report=partial(self.report_progress, dbname, progress),
+        )
+        return progress["payloads"]
+
+    def merge_payloads(self, payloads, keep_data):
+        """
+        Record the statistics collected for each object type and return the
+        combined statistics.
+        """
+        if keep_data:
+            self.payloads.update(payloads)
         else:
-            GLib.idle_add(self.clean_stale_thread, dbname)
+            self.payloads = payloads
+        data = {}
+        for payload in self.payloads.values():
+            fold(data, payload)
+        return data
+
+    def start_worker(self, dbname):
+        """
+        Start the worker process for a tree if it is not already running,
+        it stays attached to the tree to serve later requests.
+        """
+        process = self.worker_process
+        if process and process.poll() is None:
+            if self.worker_dbname == dbname:
+                return
+        self.stop_worker()
+        args = ["python3", "-u", self.worker, "-t", dbname, "--serve"]
+        if self.all_events:
+            args.append("-a")
+        process = Popen(args, stdin=PIPE, stdout=PIPE)
+        messages = Queue()
+        reader = Thread(
+            target=read_worker_messages,
+            args=(process.stdout, messages),
+            daemon=True,
+        )
+        reader.start()
+        self.worker_process = process
+        self.worker_messages = messages
+        self.worker_dbname = dbname
+
+    def stop_worker(self, process=None):
+        """
+        Shut down the worker process, or the given one if still current.
+        """
+        if process is None:
+            process = self.worker_process
+        if process is self.worker_process:
+            self.worker_process = None
+        if process and process.poll() is None:
+            try:
+                process.stdin.write(b"quit\n")
+                process.stdin.close()
+                process.wait(timeout=1)
+            except (OSError, TimeoutExpired):
+                process.terminate()
 
-    def spawn_collect_statistics(self):
+    def stream_statistics(self, event, dbname, categories, sample=None):
         """
-        Spawn statistics collection thread.
+        Send a request to the worker process and handle the messages it
+        streams back as each object type is completed.
+        """
+        self.start_worker(dbname)
+        process = self.worker_process
+        messages = self.worker_messages
+        command = "recompute"
+        if categories:
+            command = "%s categories %s" % (command, ",".join(categories))
+        if sample:
+            command = "%s sample %s" % (command, sample)
+        command = "%s\n" % command
+        try:
+            process.stdin.write(command.encode("utf-8"))
+            process.stdin.flush()
+        except OSError:
+            self.stop_worker(process)
+            raise EOFError
+        progress = get_progress()
+        while True:
+            try:
+                message = messages.get(timeout=0.1)
+            except Empty:
+                message = ()
+            if event.is_set():
+                self.stop_worker(process)
+                break
+            if message is None:
+                break
+            if message:
+                (kind, value) = message
+                if kind == "complete":
+                    break
+                self.report_progress(dbname, progress, kind, value)
+        if not event.is_set():
+            if message is None or not progress["complete"]:
+                self.stop_worker(process)
+                raise EOFError
+        return progress
+
+    def report_progress(self, dbname, progress, kind, value):
+        """
+        Record a progress report and pass it along to the main thread.
+        """
+        if kind == "facts":
+            (obj_type, payload) = value
+            fold(progress["facts"], payload)
+            progress["payloads"][obj_type] = payload
+            progress["complete"].append(obj_type)
+        elif kind == "progress":
+            (count, total) = value
+            if total:
+                progress["percent"] = int(count * 100 / total)
+        facts = {
+            key: dict(value) for (key, value) in progress["facts"].items()
+        }
+        GLib.idle_add(
+            self.emit_statistics_progress,
+            dbname,
+            facts,
+            list(progress["complete"]),
+            progress["percent"],
+        )
+
+    def emit_statistics_progress(
+        self, thread_dbname, facts, complete, percent
+    ):
+        """
+        Emit statistics progress signal.
+        """
+        if self.dbstate.db.get_dbname() == thread_dbname:
+            for (dbname, dummy_thread, event) in self.threads:
+                if dbname == thread_dbname and not event.is_set():
+                    self.emit(
+                        "statistics-progress", (facts, complete, percent)
+                    )
+        return False
+
+    def spawn_collect_statistics(self, keep_data=False, categories=None):
+        """
+        Spawn statistics collection thread. If keep_data is set the current
+        data is still served until the collection completes. If categories
+        are given only the statistics for those object types are refreshed.
         """
         current_dbname = self.dbstate.db.get_dbname()
         if current_dbname:
+            if not categories:
+                self.dirty = set()
+                categories = self.get_wanted_categories()
             need_collect = True
             for (dbname, dummy_thread, event) in self.threads:
-                if dbname == current_dbname:
+                if dbname == current_dbname and not event.is_set():
                     need_collect = False
                 else:
                     event.set()
             if need_collect:
                 self.concurrent = self.determine_collection_method()
                 with self.lock:
-                    self.data.clear()
+                    if not keep_data:
+                        self.data = {}
+                    self.ledger = None
+                    if self.incremental:
+                        self.pending_changes = []
+                    self.running_categories = categories
                     event = Event()
                     thread = Thread(
                         target=self.collect_statistics,
                         args=(
                             event,
                             current_dbname,
+                            categories,
+                            keep_data,
                         ),
                     )
                     self.threads.append((current_dbname, thread, event))
@@ -265,30 +619,231 @@ class StatisticsService(Callback):
             for (dummy_dbname, dummy_thread, event) in self.threads:
                 event.set()
             with self.lock:
-                self.data.clear()
+                self.data = {}
+                self.ledger = None
+                self.pending_changes = None
 
     def database_changed(self, *_dummy_args):
         """
-        Rescan the database.
+        Serve the last saved statistics for the tree if available and
+        rescan the database in the background unless known to be current.
         """
         self.__init_signals()
+        self.cancel_update()
+        for (dummy_dbname, dummy_thread, event) in self.threads:
+            event.set()
+        self.stop_worker()
+        self.payloads = {}
+        self.dirty = set()
+        self.wanted = self.get_layout_categories()
+        snapshot = self.load_snapshot()
+        if snapshot:
+            (marker, data, payloads) = snapshot
+            with self.lock:
+                self.data = data
+                self.payloads = payloads
+            self.emit("statistics-updated", (self.data,))
+            if marker == get_modified_marker(self.dbstate.db):
+                if not self.incremental:
+                    self.collect_missing_categories()
+                    return
+            self.spawn_collect_statistics(keep_data=True)
+            return
         self.spawn_collect_statistics()
 
-    def request_data(self):
+    def get_layout_categories(self):
+        """
+        Return the object types needed by the visible dashboard groups.
+        """
+        categories = set()
+        groups = self.config.get("layout.statistics.groups").split(",")
+        for group in groups:
+            if self.config.get("layout.statistics.%s.visible" % group):
+                key = group.split("-")[1]
+                categories.update(GROUP_SOURCES.get(key, ALL_TYPES))
+        categories.discard("Bookmark")
+        return categories
+
+    def get_wanted_categories(self):
+        """
+        Return the object types to collect, or None if all of them.
+        """
+        if self.incremental or len(self.wanted) == len(CATEGORIES):
+            return None
+        return [x for x in CATEGORIES if x in self.wanted]
+
+    def get_collected_categories(self):
+        """
+        Return the object types for which statistics are available.
+        """
+        if self.payloads:
+            return set(self.payloads)
+        if self.data:
+            return set(CATEGORIES)
+        return set()
+
+    def has_categories(self, categories):
+        """
+        Return true if statistics for the object types are available.
+        """
+        collected = self.get_collected_categories()
+        for obj_type in categories:
+            if obj_type != "Bookmark" and obj_type not in collected:
+                return False
+        return True
+
+    def collect_missing_categories(self):
+        """
+        Collect statistics for any wanted object types not yet available.
+        """
+        collected = self.get_collected_categories()
+        missing = [
+            x for x in CATEGORIES if x in self.wanted and x not in collected
+        ]
+        if missing:
+            self.spawn_collect_statistics(keep_data=True, categories=missing)
+
+    def get_snapshot_path(self):
+        """
+        Return path to the statistics snapshot for the open tree.
+        """
+        return os.path.join(
+            VERSION_DIR,
+            "statistics",
+            "CardView_statistics_%s.pickle" % self.dbstate.db.get_dbid(),
+        )
+
+    def load_snapshot(self):
+        """
+        Load the last saved statistics for the open tree.
+        """
+        if not self.dbstate.is_open():
+            return None
+        try:
+            with open(self.get_snapshot_path(), "rb") as snapshot_file:
+                snapshot = pickle.load(snapshot_file)
+        except (OSError, EOFError, pickle.UnpicklingError):
+            return None
+        if snapshot.get("all_events") != self.all_events:
+            return None
+        return (
+            snapshot.get("marker"),
+            snapshot.get("data"),
+            snapshot.get("payloads", {}),
+        )
+
+    def save_snapshot(self):
+        """
+        Save the current statistics for the open tree.
+        """
+        if not self.dbstate.is_open() or not self.data:
+            return
+        snapshot = {
+            "marker": get_modified_marker(self.dbstate.db),
+            "all_events": self.all_events,
+            "data": self.data,
+            "payloads": self.payloads,
+        }
+        path = self.get_snapshot_path()
+        try:
+            os.makedirs(os.path.dirname(path), exist_ok=True)
+            with open(path, "wb") as snapshot_file:
+                pickle.dump(snapshot, snapshot_file)
+        except OSError:
+            pass
+
+    def record_history(self):
+        """
+        Record the current statistics in the history for the open tree.
+        """
+        if self.dbstate.is_open() and self.data and not self.estimated:
+            self.history.record(self.dbstate.db.get_dbid(), self.data)
+
+    def get_trends(self, names, periods):
+        """
+        Return the latest value of the named counters for the open tree and
+        how much each changed over the given periods in days.
+        """
+        if not self.dbstate.is_open():
+            return {}
+        return self.history.get_trends(
+            self.dbstate.db.get_dbid(), names, periods
+        )
+
+    def request_data(self, categories=None):
         """
         Return data if available otherwise initiate statistics collection.
+        If categories are given statistics for any of those object types
+        not yet collected are gathered.
         """
+        if categories:
+            self.wanted.update(x for x in categories if x != "Bookmark")
         with self.lock:
-            if self.data != {}:
-                return self.data
+            data = self.data
+        if data != {}:
+            if not categories or self.has_categories(categories):
+                return data
+            self.collect_missing_categories()
+            return None
         self.spawn_collect_statistics()
         return None
 
     def recalculate_data(self):
         """
-        Force a statistics collection if one not running.
+        Force a statistics collection if one not running. When the changes
+        since the last collection are known only those object types are
+        recollected.
         """
-        self.spawn_collect_statistics()
+        categories = None
+        if (
+            self.payloads
+            and not self.estimated
+            and self.dirty
+            and len(self.dirty) < len(CATEGORIES)
+        ):
+            collected = self.get_collected_categories()
+            categories = [
+                x for x in CATEGORIES if x in self.dirty and x in collected
+            ]
+            if not categories:
+                self.dirty = set()
+                return
+        self.dirty = set()
+        self.spawn_collect_statistics(
+            keep_data=bool(categories), categories=categories
+        )
+
+
+def get_progress():
+    """
+    Return new progress tracking record.
+    """
+    return {"facts": {}, "payloads": {}, "complete": [], "percent": 0}
+
+
+def read_worker_messages(stream, messages):
+    """
+    Thread to read the framed messages from the worker process, None
+    is queued when the stream ends.
+    """
+    message = read_message(stream)
+    while message:
+        messages.put(message)
+        message = read_message(stream)
+    messages.put(None)
+
+
+def get_modified_marker(db):
+    """
+    Return the last modified marker for a tree, this is the time stamp of
+    the file Gramps touches when closing a tree after use.
+    """
+    try:
+        return os.path.getmtime(
+            os.path.join(db.get_save_path(), "meta_data.db")
+        )
+    except (OSError, TypeError):
+        return None
 
 
 def find_statistics_service_worker():
@@ -0,0 +1,209 @@
+#
+# Gramps - a GTK+/GNOME based genealogy program
+#
+# Copyright (C) 2022       Christopher Horn
+#
+# This program is free software; you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation; either version 2 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program; if not, write to the Free Software
+# Foundation, Inc., 51 Franklin Street, Fifth Floor, Boston, MA 02110-1301 USA.
+#
+
+"""
+StatisticsHistory
+"""
+
+# -------------------------------------------------------------------------
+#
+# Python Modules
+#
+# -------------------------------------------------------------------------
+import os
+import sqlite3
+import time
+
+SCHEMA = (
+    "CREATE TABLE IF NOT EXISTS runs ("
+    "id INTEGER PRIMARY KEY, tree_id TEXT, timestamp REAL)",
+    "CREATE INDEX IF NOT EXISTS runs_tree ON runs (tree_id, timestamp)",
+    "CREATE TABLE IF NOT EXISTS counters ("
+    "run_id INTEGER, name TEXT, value INTEGER, PRIMARY KEY (run_id, name))",
+    "CREATE INDEX IF NOT EXISTS counters_name ON counters (name, run_id)",
+)
+
+DAY = 86400
+
+
+# -------------------------------------------------------------------------
+#
+# StatisticsHistory Class
+#
+# -------------------------------------------------------------------------
+class StatisticsHistory:
+    """
+    Keeps the counters from every completed statistics run for each tree
+    in a small SQLite database so trends can be shown without a rescan.
+    """
+
+    def __init__(self, path):
+        self.path = path
+
+    def connect(self):
+        """
+        Open the history database, creating it if needed.
+        """
+        os.makedirs(os.path.dirname(self.path), exist_ok=True)
+        connection = sqlite3.connect(self.path)
+        for statement in SCHEMA:
+            connection.execute(statement)
+        return connection
+
+    def record(self, tree_id, facts, timestamp=None):
+        """
+        Record the counters for a run, unless unchanged from the last one.
+        Returns true if recorded.
+        """
+        counters = flatten_facts(facts)
+        if not counters:
+            return False
+        try:
+            connection = self.connect()
+        except (OSError, sqlite3.Error):
+            return False
+        try:
+            with connection:
+                run_id = get_last_run(connection, tree_id)
+                if run_id and get_counters(connection, run_id) == counters:
+                    return False
+                cursor = connection.execute(
+                    "INSERT INTO runs (tree_id, timestamp) VALUES (?, ?)",
+                    (tree_id, timestamp or time.time()),
+                )
+                connection.executemany(
+                    "INSERT INTO counters (run_id, name, value) "
+                    "VALUES (?, ?, ?)",
+                    [(cursor.lastrowid, x, y) for (x, y) in counters.items()],
+                )
+            return True
+        except sqlite3.Error:
+            return False
+        finally:
+            connection.close()
+
+    def get_series(self, tree_id, name, since=None):
+        """
+        Return the recorded timestamps and values for a counter.
+        """
+        query = (
+            "SELECT runs.timestamp, counters.value FROM runs "
+            "JOIN counters ON counters.run_id = runs.id "
+            "WHERE runs.tree_id = ? AND counters.name = ?"
+        )
+        values = [tree_id, name]
+        if since:
+            query = "%s AND runs.timestamp >= ?" % query
+            values.append(since)
+        query = "%s ORDER BY runs.timestamp" % query
+        try:
+            connection = self.connect()
+        except (OSError, sqlite3.Error):
+            return []
+        try:
+            return connection.execute(query, values).fetchall()
+        except sqlite3.Error:
+            return []
+        finally:
+            connection.close()
+
+    def get_trends(self, tree_id, names, periods):
+        """
+        Return the latest value of each counter and how much it changed
+        over each period in days. If the history does not reach back that
+        far the change since the first run is given.
+        """
+        now = time.time()
+        trends = {}
+        for name in names:
+            series = self.get_series(tree_id, name)
+            if not series:
+                continue
+            (dummy_timestamp, current) = series[-1]
+            changes = []
+            for days in periods:
+                start = now - days * DAY
+                past = series[0][1]
+                for (timestamp, value) in series:
+                    if timestamp > start:
+                        break
+                    past = value
+                changes.append(current - past)
+            trends[name] = (current, changes)
+        return trends
+
+
+def get_last_run(connection, tree_id):
+    """
+    Return the id of the last run recorded for a tree.
+    """
+    row = connection.execute(
+        "SELECT id FROM runs WHERE tree_id = ? "
+        "ORDER BY timestamp DESC LIMIT 1",
+        (tree_id,),
+    ).fetchone()
+    if row:
+        return row[0]
+    return None
+
+
+def get_counters(connection, run_id):
+    """
+    Return the counters recorded for a run.
+    """
+    return dict(
+        connection.execute(
+            "SELECT name, value FROM counters WHERE run_id = ?", (run_id,)
+        ).fetchall()
+    )
+
+
+def flatten_facts(facts):
+    """
+    Flatten the counts in a statistics facts dictionary into named
+    counters. Estimates and values that are not counts are skipped.
+    """
+    counters = {}
+    for (group, entries) in facts.items():
+        if group == "estimate":
+            continue
+        for (key, value) in entries.items():
+            if isinstance(value, dict):
+                for (subkey, subvalue) in value.items():
+                    count = get_count(subvalue)
+                    if count is not None:
+                        name = "%s.%s.%s" % (group, key, subkey)
+                        counters[name] = count
+            else:
+                count = get_count(value)
+                if count is not None:
+                    counters["%s.%s" % (group, key)] = count
+    return counters
+
+
+def get_count(value):
+    """
+    Return the count from a statistics value if it has one.
+    """
+    if isinstance(value, tuple) and value:
+        value = value[0]
+    if isinstance(value, int) and not isinstance(value, bool):
+        return value
+    return None
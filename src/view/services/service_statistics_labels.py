@@ -279,3 +279,17 @@ BOOKMARK_LABELS = {
     "repository": _("Repository bookmarks"),
     "note": _("Note bookmarks"),
 }
+
+TREND_LABELS = {
+    "person.total": _("People"),
+    "family.total": _("Families"),
+    "event.total": _("Events"),
+    "place.total": _("Places"),
+    "media.total": _("Media"),
+    "source.total": _("Sources"),
+    "citation.total": _("Citations"),
+    "repository.total": _("Repositories"),
+    "note.total": _("Notes"),
+    "uncited.event": _("Uncited events"),
+    "person.no_birth": _("People missing birth"),
+}
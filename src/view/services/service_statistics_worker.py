@@ -29,506 +29,1150 @@ Statistics service worker
 # Python Modules
 #
 # -------------------------------------------------------------------------
-import io
 import os
 import sys
+import json
+import math
 import time
 import pickle
+import random
+import struct
 import argparse
-from multiprocessing import Process, Queue
+import tracemalloc
+from array import array
+from collections import Counter
+from contextlib import contextmanager
+from functools import partial
+from multiprocessing import Pool
 
 # -------------------------------------------------------------------------
 #
 # Gramps Modules
 #
 # -------------------------------------------------------------------------
-from gramps.gen.datehandler import get_date
+from gramps.gen.config import config
+from gramps.gen.datehandler import displayer, get_date
 from gramps.gen.db import DBLOCKFN, DBMODE_R
 from gramps.gen.db.utils import (
     lookup_family_tree,
     make_database,
     write_lock_file,
 )
-from gramps.gen.lib import Citation, Person, EventType, EventRoleType
+from gramps.gen.errors import HandleError
+from gramps.gen.lib import (
+    ChildRefType,
+    Citation,
+    Date,
+    Event,
+    EventRoleType,
+    EventType,
+    Family,
+    FamilyRelType,
+    Media,
+    Note,
+    NoteType,
+    Person,
+    Place,
+    PlaceType,
+    Repository,
+    RepositoryType,
+    Source,
+    SourceMediaType,
+    Tag,
+)
+from gramps.gen.lib import json_utils
+from gramps.gen.lib.date import Today
 from gramps.gen.utils.alive import probably_alive
 from gramps.gen.utils.file import media_path_full
 
+CUSTOM_TYPES = {
+    gramps_type.__name__: gramps_type.CUSTOM
+    for gramps_type in (
+        ChildRefType,
+        EventRoleType,
+        EventType,
+        FamilyRelType,
+        NoteType,
+        PlaceType,
+        RepositoryType,
+        SourceMediaType,
+    )
+}
 
-def examine_people(args, queue=None, thread_event=None):
+
+# -------------------------------------------------------------------------
+#
+# Field accessors that work for both objects and raw rows. Raw rows are the
+# DataDict wrapped JSON data which provides attribute access to the fields
+# so the analyze functions can run on either.
+#
+# -------------------------------------------------------------------------
+def get_type_key(gramps_type):
     """
-    Parse and analyze people.
+    Return serialized form of a type.
+    """
+    if isinstance(gramps_type, dict):
+        value = gramps_type["value"]
+        if value == CUSTOM_TYPES[gramps_type["_class"]]:
+            return (value, gramps_type["string"])
+        return (value, "")
+    return gramps_type.serialize()
+
+
+def get_type(event):
+    """
+    Return type of an event.
+    """
+    if isinstance(event, dict):
+        return event["type"]
+    return event.get_type()
+
+
+def get_role(event_ref):
+    """
+    Return role for an event reference.
+    """
+    if isinstance(event_ref, dict):
+        return event_ref["role"]
+    return event_ref.get_role()
+
+
+def get_event_ref(person, index):
+    """
+    Return event reference at given index, used for birth and death.
+    """
+    event_ref_list = person.event_ref_list
+    if 0 <= index < len(event_ref_list):
+        return event_ref_list[index]
+    return None
+
+
+def get_year(event):
+    """
+    Return year of an event if the date is valid, otherwise zero.
+    """
+    if isinstance(event, dict):
+        date = event["date"]
+        (modifier, sortval) = (date["modifier"], date["sortval"])
+        year = date["dateval"][2] if date["dateval"] else 0
+    else:
+        date = event.get_date_object()
+        (modifier, sortval) = (date.modifier, date.sortval)
+        year = date.get_year()
+    if modifier == Date.MOD_TEXTONLY or not sortval:
+        return 0
+    return year
+
+
+def has_date(obj):
+    """
+    Return true if object has a date that displays as non-empty.
     """
+    if isinstance(obj, dict):
+        date = json_utils.data_to_object(obj["date"])
+        return bool(displayer.display(date))
+    return bool(get_date(obj))
 
-    def get_gender_stats(gender_stats, gender):
+
+# -------------------------------------------------------------------------
+#
+# Event index shared by the handlers
+#
+# -------------------------------------------------------------------------
+class EventIndex:
+    """
+    Compact table of the event fields needed when analyzing people, built
+    with one sequential scan so the events need not be read one at a time
+    for every reference. The fields are kept in parallel arrays with a map
+    from the handle to the position.
+    """
+
+    def __init__(self):
+        self.positions = {}
+        self.types = []
+        self.dated = bytearray()
+        self.placed = bytearray()
+        self.citations = array("I")
+        self.private = bytearray()
+        self.years = array("i")
+        self.type_keys = {}
+
+    def build(self, db, args, thread_event=None):
         """
-        Return gender statistics.
+        Load the fields for all the events.
         """
-        if gender not in gender_stats:
-            gender_stats[gender] = {
-                "total": 0,
-                "private": 0,
-                "tagged": 0,
-                "uncited": 0,
-                "living": 0,
-                "living_not_private": 0,
-            }
-        return gender_stats[gender]
-
-    gender_stats = {}
-    media, media_refs, missing_region = 0, 0, 0
-    incomplete_names, alternate_names, no_families, total_living = 0, 0, 0, 0
-    names_private, names_uncited = 0, 0
-    association_types = {}
-    association, association_refs = 0, 0
-    association_private, association_uncited = 0, 0
-    participant_roles = {}
-    participant, participant_refs, participant_private = 0, 0, 0
-    ldsord_people, ldsord_refs, ldsord_private, ldsord_uncited = 0, 0, 0, 0
-    no_temple, no_status, no_date, no_place, no_family = 0, 0, 0, 0, 0
-
-    no_birth, no_birth_date, no_birth_place = 0, 0, 0
-    births_uncited, births_private = 0, 0
-    no_baptism, no_baptism_date, no_baptism_place = 0, 0, 0
-    baptisms_private = 0
-    no_death, no_death_date, no_death_place = 0, 0, 0
-    deaths_uncited, deaths_private = 0, 0
-    no_burial, no_burial_date, no_burial_place = 0, 0, 0
-    burials_private = 0
+        for event in iter_objects(db, "Event", args):
+            if thread_event and thread_event.is_set():
+                return False
+            self.add(event)
+        return True
 
-    db = open_readonly_database(args.get("tree_name"))
-    total_people = db.get_number_of_people()
-    all_events = args.get("all_events")
+    def add(self, event):
+        """
+        Add or update the fields for an event.
+        """
+        (event_type, dated, placed, cited, private) = get_event_fields(event)
+        event_type = self.type_keys.setdefault(event_type, event_type)
+        year = get_year(event)
+        position = self.positions.get(event.handle)
+        if position is None:
+            self.positions[event.handle] = len(self.types)
+            self.types.append(event_type)
+            self.dated.append(dated)
+            self.placed.append(placed)
+            self.citations.append(cited)
+            self.private.append(private)
+            self.years.append(year)
+        else:
+            self.types[position] = event_type
+            self.dated[position] = dated
+            self.placed[position] = placed
+            self.citations[position] = cited
+            self.private[position] = private
+            self.years[position] = year
+
+    def remove(self, handle):
+        """
+        Remove an event, the slot is simply abandoned.
+        """
+        self.positions.pop(handle, None)
 
-    for person in db.iter_people():
-        if thread_event and thread_event.is_set():
-            break
+    def apply_change(self, db, action, handles):
+        """
+        Apply a database change to the indexed events.
+        """
+        for handle in handles:
+            event = None
+            if action != "delete":
+                event = fetch_object(db, "Event", handle)
+            if event:
+                self.add(event)
+            else:
+                self.remove(handle)
+
+    def get(self, handle):
+        """
+        Return the fields for an event or None if not known.
+        """
+        position = self.positions.get(handle)
+        if position is None:
+            return None
+        return (
+            self.types[position],
+            bool(self.dated[position]),
+            bool(self.placed[position]),
+            self.citations[position],
+            bool(self.private[position]),
+        )
+
+    def get_type_year(self, handle):
+        """
+        Return the type value and valid year, or zero if none, for an event
+        or None if not known.
+        """
+        position = self.positions.get(handle)
+        if position is None:
+            return None
+        return (self.types[position][0], self.years[position])
+
+
+def get_event_fields(event):
+    """
+    Return the type, date present, place present, citation count and
+    privacy for an event.
+    """
+    return (
+        get_type_key(get_type(event)),
+        has_date(event),
+        bool(event.place),
+        len(event.citation_list),
+        bool(event.private),
+    )
 
-        length = len(person.media_list)
-        if length > 0:
-            media += 1
-            media_refs += length
-            for media_ref in person.media_list:
-                if not media_ref.rect:
-                    missing_region += 1
-
-        if person.alternate_names:
-            alternate_names += 1
-        for name in [person.primary_name] + person.alternate_names:
-            if name.private:
-                names_private += 1
-            if not name.citation_list:
-                names_uncited += 1
-            if name.first_name.strip() == "":
-                incomplete_names += 1
+
+def lookup_event(db, handle, args):
+    """
+    Return the indexed fields for an event, reading the event if there
+    is no index or it is not in it.
+    """
+    event_index = args.get("event_index")
+    if event_index is not None:
+        fields = event_index.get(handle)
+        if fields:
+            return fields
+    return get_event_fields(db.get_event_from_handle(handle))
+
+
+def build_event_index(args):
+    """
+    Build the event index for a tree.
+    """
+    event_index = EventIndex()
+    with readonly_database(args) as db:
+        event_index.build(db, args)
+    return event_index
+
+
+def is_living(db, person, args):
+    """
+    Return true if person is probably living, using the bulk living status
+    if available.
+    """
+    if "living" in args:
+        return person.handle in args["living"]
+    if isinstance(person, dict):
+        person = json_utils.data_to_object(person)
+    return probably_alive(person, db)
+
+
+def install_shared_indexes(shared, tree_name):
+    """
+    Install the indexes shared by the handlers in a pool worker process,
+    along with the tree opened once for all the shards it examines. The
+    tree is left open as the pool terminates the process when done.
+    """
+    SHARED_INDEXES.update(shared)
+    SHARED_INDEXES["db"] = open_readonly_database(tree_name)
+
+
+# -------------------------------------------------------------------------
+#
+# Bulk living status
+#
+# -------------------------------------------------------------------------
+BIRTH_FALLBACKS = (EventType.STILLBIRTH, EventType.BAPTISM, EventType.CHRISTEN)
+
+DEATH_FALLBACKS = (
+    EventType.STILLBIRTH,
+    EventType.BURIAL,
+    EventType.CREMATION,
+    EventType.CAUSE_DEATH,
+    EventType.PROBATE,
+)
+
+YEAR_SPAN = 10000
+
+
+class LivingStatus:
+    """
+    Determines who is probably living for the whole tree in one pass
+    instead of calling probably_alive for each person, which for people
+    without dates walks their relatives again every time.
+
+    A range of possible birth years is kept for every person. Recorded
+    births are fixed while death dates, dated family events and the ranges
+    of parents, children, siblings and spouses narrow the others until no
+    range changes. Someone is living unless known to be dead, or born too
+    long ago or not yet born according to their range. The same behavior
+    settings as probably_alive are used. Ranges only ever narrow and are
+    kept within YEAR_SPAN years of now, so a loop in the data where
+    someone is their own ancestor still settles. The result does not
+    depend on the order people are looked at.
+
+    After a full calculation the ranges are kept so a change only needs
+    the family neighbourhood of the changed people worked out again.
+    """
+
+    def __init__(self, current_year=None):
+        self.max_age = config.get("behavior.max-age-prob-alive")
+        self.max_sibling_gap = config.get("behavior.max-sib-age-diff")
+        self.generation_gap = config.get("behavior.avg-generation-gap")
+        self.min_generation = config.get("behavior.min-generation-years")
+        self.current_year = current_year or Today().get_year()
+        self.people = {}
+        self.families = {}
+        self.relations = None
+        self.ranges = None
+        self.living = set()
+
+    def load(self, db, args, thread_event=None):
+        """
+        Load the people and families using the event index.
+        """
+        event_index = args["event_index"]
+        for person in iter_objects(db, "Person", args):
+            if thread_event and thread_event.is_set():
+                return False
+            self.add_person(person, event_index)
+        for family in iter_objects(db, "Family", args):
+            if thread_event and thread_event.is_set():
+                return False
+            self.add_family(family, event_index)
+        return True
+
+    def add_person(self, person, event_index):
+        """
+        Add or update the vital years for a person.
+        """
+        birth_ref = get_event_ref(person, person.birth_ref_index)
+        death_ref = get_event_ref(person, person.death_ref_index)
+        events = []
+        for event_ref in person.event_ref_list:
+            if get_type_key(get_role(event_ref))[0] == EventRoleType.PRIMARY:
+                type_year = event_index.get_type_year(event_ref.ref)
+                if type_year:
+                    events.append((event_ref.ref,) + type_year)
+
+        (birth, death, dead) = (0, 0, False)
+        for (handle, dummy_type, year) in events:
+            if birth_ref and handle == birth_ref.ref:
+                birth = year
+            elif death_ref and handle == death_ref.ref:
+                (death, dead) = (year, True)
+        if not death:
+            for (handle, event_type, year) in events:
+                if event_type in DEATH_FALLBACKS:
+                    dead = True
+                    if year:
+                        death = year
+                        break
+        if not birth:
+            for (handle, event_type, year) in events:
+                if event_type in BIRTH_FALLBACKS and year:
+                    birth = year
+                    break
+
+        parent_family = None
+        if person.parent_family_list:
+            parent_family = person.parent_family_list[0]
+        self.people[person.handle] = (
+            birth,
+            death,
+            dead,
+            parent_family,
+            tuple(person.family_list),
+        )
+
+    def add_family(self, family, event_index):
+        """
+        Add or update the members and dated events for a family.
+        """
+        years = []
+        for event_ref in family.event_ref_list:
+            type_year = event_index.get_type_year(event_ref.ref)
+            if type_year and type_year[1]:
+                years.append(type_year[1])
+        self.families[family.handle] = (
+            family.father_handle,
+            family.mother_handle,
+            tuple(child_ref.ref for child_ref in family.child_ref_list),
+            tuple(years),
+        )
+
+    def remove_person(self, handle):
+        """
+        Remove a person.
+        """
+        self.people.pop(handle, None)
+
+    def remove_family(self, handle):
+        """
+        Remove a family.
+        """
+        self.families.pop(handle, None)
+
+    def apply_change(self, db, obj_type, action, handles, event_index):
+        """
+        Update the vital years and families for a database change and
+        return the handles of the people to recalculate. The event index
+        must already be updated.
+        """
+        people = set()
+        families = set()
+        if obj_type == "Person":
+            people.update(handles)
+        elif obj_type == "Family":
+            families.update(handles)
+        elif obj_type == "Event" and action != "delete":
+            for handle in handles:
+                for (backlink_type, backlink_handle) in (
+                    db.find_backlink_handles(handle, ["Person", "Family"])
+                ):
+                    if backlink_type == "Person":
+                        people.add(backlink_handle)
+                    else:
+                        families.add(backlink_handle)
+        for handle in families:
+            family = self.families.get(handle)
+            if family:
+                people.update(x for x in family[:2] if x)
+                people.update(family[2])
+            family = fetch_object(db, "Family", handle)
+            if family:
+                self.add_family(family, event_index)
+                for parent in (family.father_handle, family.mother_handle):
+                    if parent:
+                        people.add(parent)
+                people.update(x.ref for x in family.child_ref_list)
             else:
-                if name.get_surname_list():
-                    for surname in name.get_surname_list():
-                        if surname.get_surname().strip() == "":
-                            incomplete_names += 1
-                else:
-                    incomplete_names += 1
-
-        if not person.parent_family_list and not person.family_list:
-            no_families += 1
-
-        gender = get_gender_stats(gender_stats, person.get_gender())
-        gender["total"] += 1
-        if person.private:
-            gender["private"] += 1
-        if person.tag_list:
-            gender["tagged"] += 1
-        if not person.citation_list:
-            gender["uncited"] += 1
-
-        living = True
-        birth_ref = person.get_birth_ref()
-        death_ref = person.get_death_ref()
-        has_birth, has_baptism = False, False
-        has_death, has_burial = False, False
-
-        if person.event_ref_list:
-            participant += 1
-            if all_events:
-                for event_ref in person.event_ref_list:
-                    participant_refs += 1
-                    role = event_ref.get_role()
-                    role_key = role.serialize()
-                    if role_key not in participant_roles:
-                        participant_roles[role_key] = 0
-                    participant_roles[role_key] += 1
-                    if event_ref.private:
-                        participant_private += 1
-
-                    if role == EventRoleType.PRIMARY:
-                        event = db.get_event_from_handle(event_ref.ref)
-                        if birth_ref and event.handle == birth_ref.ref:
-                            has_birth = True
-                            birth_ref = None
-                            if not get_date(event):
-                                no_birth_date += 1
-                            if not event.place:
-                                no_birth_place += 1
-                            if not event.citation_list:
-                                births_uncited += 1
-                            if event.private:
-                                births_private += 1
-                            continue
-                        if death_ref and event.handle == death_ref.ref:
-                            has_death = True
-                            death_ref = None
-                            if not get_date(event):
-                                no_death_date += 1
-                            if not event.place:
-                                no_death_place += 1
-                            if not event.citation_list:
-                                deaths_uncited += 1
-                            if event.private:
-                                deaths_private += 1
-                            living = False
-                            continue
-                        event_type = event.get_type()
-                        if event_type in [
-                            EventType.BAPTISM,
-                            EventType.CHRISTEN,
-                        ]:
-                            has_baptism = True
-                            if not get_date(event):
-                                no_baptism_date += 1
-                            if not event.place:
-                                no_baptism_place += 1
-                            if event.private:
-                                baptisms_private += 1
-                            continue
-                        if event_type in [
-                            EventType.BURIAL,
-                            EventType.CREMATION,
-                        ]:
-                            has_burial = True
-                            if not get_date(event):
-                                no_burial_date += 1
-                            if not event.place:
-                                no_burial_place += 1
-                            if event.private:
-                                burials_private += 1
-                            living = False
-                            continue
-                        if event_type in [
-                            EventType.CAUSE_DEATH,
-                            EventType.PROBATE,
-                        ]:
-                            living = False
+                self.remove_family(handle)
+        for handle in people:
+            person = fetch_object(db, "Person", handle)
+            if person:
+                self.add_person(person, event_index)
             else:
-                if birth_ref:
-                    event = db.get_event_from_handle(birth_ref.ref)
-                    has_birth = True
-                    if not get_date(event):
-                        no_birth_date += 1
-                    if not event.place:
-                        no_birth_place += 1
-                    if not event.citation_list:
-                        births_uncited += 1
-                    if event.private:
-                        births_private += 1
-                if death_ref:
-                    event = db.get_event_from_handle(death_ref.ref)
-                    has_death = True
-                    if not get_date(event):
-                        no_death_date += 1
-                    if not event.place:
-                        no_death_place += 1
-                    if not event.citation_list:
-                        deaths_uncited += 1
-                    if event.private:
-                        deaths_private += 1
-                    living = False
-
-        if not has_birth:
-            no_birth += 1
-        if not has_baptism:
-            no_baptism += 1
+                self.remove_person(handle)
+        return people
 
-        if living:
-            if not probably_alive(person, db):
-                living = False
+    def get_relations(self):
+        """
+        Return the parents, children, siblings and spouses of everyone.
+        """
+        return {x: self.get_person_relations(x) for x in self.people}
+
+    def get_person_relations(self, handle):
+        """
+        Return the parents, children, siblings and spouses of a person.
+        """
+        person = self.people[handle]
+        parents, children, siblings, spouses = [], [], [], []
+        family = self.families.get(person[3])
+        if family:
+            parents = [x for x in family[:2] if x in self.people]
+            siblings = [
+                x for x in family[2] if x != handle and x in self.people
+            ]
+        for family_handle in person[4]:
+            family = self.families.get(family_handle)
+            if family:
+                children.extend([x for x in family[2] if x in self.people])
+                for spouse in family[:2]:
+                    if spouse and spouse != handle:
+                        if spouse in self.people:
+                            spouses.append(spouse)
+        return (parents, children, siblings, spouses)
+
+    def get_initial_range(self, handle):
+        """
+        Return initial birth year range for a person from their own dates
+        and the dated events of their families.
+        """
+        (birth, death, dummy_dead, dummy_parents, families) = self.people[
+            handle
+        ]
+        if birth:
+            return [birth, birth]
+        (low, high) = (None, None)
+        if death:
+            (low, high) = (death - self.max_age, death)
+        for family_handle in families:
+            family = self.families.get(family_handle)
+            if family:
+                for year in family[3]:
+                    low = tighten_low(low, year - self.max_age)
+                    high = tighten_high(high, year - self.min_generation)
+        return [low, high]
+
+    def get_bounds(self, handle, ranges, relations):
+        """
+        Return birth year range implied for a person by their relatives.
+        """
+        (low, high) = ranges[handle]
+        (parents, children, siblings, spouses) = relations[handle]
+        for parent in parents:
+            (parent_low, parent_high) = ranges[parent]
+            if parent_low is not None:
+                low = tighten_low(low, parent_low + self.min_generation)
+            parent_death = self.people[parent][1]
+            if parent_death:
+                if parent == self.families[self.people[handle][3]][0]:
+                    parent_death = parent_death + 1
+            elif parent_high is not None:
+                parent_death = parent_high + self.max_age
+            if parent_death:
+                high = tighten_high(high, parent_death)
+        for child in children:
+            (child_low, child_high) = ranges[child]
+            if child_low is not None:
+                low = tighten_low(low, child_low - self.max_age)
+            if child_high is not None:
+                high = tighten_high(high, child_high - self.min_generation)
+        for (relatives, gap) in (
+            (siblings, self.max_sibling_gap),
+            (spouses, self.generation_gap),
+        ):
+            for relative in relatives:
+                (relative_low, relative_high) = ranges[relative]
+                if relative_low is not None:
+                    low = tighten_low(low, relative_low - gap)
+                if relative_high is not None:
+                    high = tighten_high(high, relative_high + gap)
+        if low is not None:
+            low = min(low, self.current_year + YEAR_SPAN)
+        if high is not None:
+            high = max(high, self.current_year - YEAR_SPAN)
+        return [low, high]
+
+    def calculate(self):
+        """
+        Propagate the birth year ranges until they are stable and return
+        the set of people who are probably living.
+        """
+        self.relations = self.get_relations()
+        self.ranges = {x: self.get_initial_range(x) for x in self.people}
+        self.propagate(
+            [x for x in self.people if self.ranges[x] != [None, None]]
+        )
+        self.living = {x for x in self.people if self.check_living(x)}
+        return self.living
+
+    def update(self, handles):
+        """
+        Recalculate the living status after the people with the given
+        handles, or their families, were added, updated or removed and
+        return the handles of the people whose status changed. The ranges
+        of the people and their relatives before and after the change are
+        reset and then propagated again.
+        """
+        previous = self.living
+        if self.ranges is None:
+            return previous.symmetric_difference(self.calculate())
+        region = set()
+        for handle in handles:
+            region.add(handle)
+            for relatives in self.relations.get(handle, ()):
+                region.update(relatives)
+        for handle in list(region):
+            if handle in self.people:
+                self.relations[handle] = self.get_person_relations(handle)
+                for relatives in self.relations[handle]:
+                    region.update(relatives)
+        for handle in list(region):
+            if handle not in self.people:
+                self.relations.pop(handle, None)
+                self.ranges.pop(handle, None)
+                region.discard(handle)
+                continue
+            self.relations[handle] = self.get_person_relations(handle)
+            self.ranges[handle] = self.get_initial_range(handle)
+        pending = set(region)
+        for handle in region:
+            for relatives in self.relations[handle]:
+                pending.update(relatives)
+        touched = region | self.propagate(list(pending))
+        living = {x for x in previous if x in self.people}
+        for handle in touched:
+            if self.check_living(handle):
+                living.add(handle)
             else:
-                total_living += 1
-                gender["living"] += 1
-                if not person.private:
-                    gender["living_not_private"] += 1
-
-        if not living:
-            if not has_death:
-                no_death += 1
-            if not has_burial:
-                no_burial += 1
-
-        if person.person_ref_list:
-            association += 1
-            for person_ref in person.person_ref_list:
-                association_refs += 1
-                if person_ref.private:
-                    association_private += 1
-                if not person_ref.citation_list:
-                    association_uncited += 1
-                if person_ref.rel not in association_types:
-                    association_types[person_ref.rel] = 0
-                association_types[person_ref.rel] += 1
-
-        if person.lds_ord_list:
-            ldsord_people += 1
-            for ldsord in person.lds_ord_list:
-                ldsord_refs += 1
-                if ldsord.private:
-                    ldsord_private += 1
-                if not ldsord.citation_list:
-                    ldsord_uncited += 1
-                if not get_date(ldsord):
-                    no_date += 1
-                if not ldsord.place:
-                    no_place += 1
-                if not ldsord.famc:
-                    no_family += 1
-                if not ldsord.temple:
-                    no_temple += 1
-                if not ldsord.status:
-                    no_status += 1
-    close_readonly_database(db)
-
-    for key in participant_roles:
-        participant_roles[key] = (participant_roles[key], participant_refs)
-    for key in association_types:
-        association_types[key] = (association_types[key], association_refs)
-
-    with_birth = total_people - no_birth
-    with_baptism = total_people - no_baptism
+                living.discard(handle)
+        self.living = living
+        return previous.symmetric_difference(living)
+
+    def propagate(self, pending):
+        """
+        Narrow the ranges of the relatives of the pending people until no
+        range changes and return the handles of those that changed.
+        """
+        ranges = self.ranges
+        relations = self.relations
+        changed = set()
+        queued = set(pending)
+        while pending:
+            handle = pending.pop()
+            queued.discard(handle)
+            (parents, children, siblings, spouses) = relations[handle]
+            for relative in parents + children + siblings + spouses:
+                if self.people[relative][0]:
+                    continue
+                bounds = self.get_bounds(relative, ranges, relations)
+                if bounds != ranges[relative]:
+                    ranges[relative] = bounds
+                    changed.add(relative)
+                    if relative not in queued:
+                        queued.add(relative)
+                        pending.append(relative)
+        return changed
+
+    def check_living(self, handle):
+        """
+        Return true if a person is probably living given their range.
+        """
+        if self.people[handle][2]:
+            return False
+        (low, high) = self.ranges[handle]
+        if high is not None and high + self.max_age < self.current_year:
+            return False
+        if low is not None and low > self.current_year:
+            return False
+        return True
+
+    def is_living(self, handle):
+        """
+        Return true if person is probably living.
+        """
+        return handle in self.living
+
+
+def tighten_low(low, value):
+    """
+    Return the larger of a lower bound and a new value.
+    """
+    if low is None or value > low:
+        return value
+    return low
+
+
+def tighten_high(high, value):
+    """
+    Return the smaller of an upper bound and a new value.
+    """
+    if high is None or value < high:
+        return value
+    return high
+
+
+def build_living_status(args):
+    """
+    Build the living status for a tree, the event index must be present.
+    """
+    living_status = LivingStatus()
+    with readonly_database(args) as db:
+        living_status.load(db, args)
+    living_status.calculate()
+    return living_status
+
+
+def analyze_person(db, person, tally, args):
+    """
+    Tally the statistics contribution of a person.
+    """
+    tally["total"] += 1
+
+    length = len(person.media_list)
+    if length > 0:
+        tally["media"] += 1
+        tally["media_refs"] += length
+        for media_ref in person.media_list:
+            if not media_ref.rect:
+                tally["missing_region"] += 1
+
+    if person.alternate_names:
+        tally["alternate_names"] += 1
+    for name in [person.primary_name] + person.alternate_names:
+        if name.private:
+            tally["names_private"] += 1
+        if not name.citation_list:
+            tally["names_uncited"] += 1
+        if name.first_name.strip() == "":
+            tally["incomplete_names"] += 1
+        else:
+            if name.surname_list:
+                for surname in name.surname_list:
+                    if surname.surname.strip() == "":
+                        tally["incomplete_names"] += 1
+            else:
+                tally["incomplete_names"] += 1
+
+    if not person.parent_family_list and not person.family_list:
+        tally["no_families"] += 1
+
+    gender = person.gender
+    tally[("gender_total", gender)] += 1
+    if person.private:
+        tally[("gender_private", gender)] += 1
+    if person.tag_list:
+        tally[("gender_tagged", gender)] += 1
+    if not person.citation_list:
+        tally[("gender_uncited", gender)] += 1
+
+    living = True
+    birth_ref = get_event_ref(person, person.birth_ref_index)
+    death_ref = get_event_ref(person, person.death_ref_index)
+    has_birth, has_baptism = False, False
+    has_death, has_burial = False, False
+
+    if person.event_ref_list:
+        tally["participant"] += 1
+        if args.get("all_events"):
+            for event_ref in person.event_ref_list:
+                tally["participant_refs"] += 1
+                role = get_type_key(get_role(event_ref))
+                tally[("participant_roles", role)] += 1
+                if event_ref.private:
+                    tally["participant_private"] += 1
+
+                if role[0] == EventRoleType.PRIMARY:
+                    (event_type, dated, placed, cited, private) = lookup_event(
+                        db, event_ref.ref, args
+                    )
+                    if birth_ref and event_ref.ref == birth_ref.ref:
+                        has_birth = True
+                        birth_ref = None
+                        if not dated:
+                            tally["no_birth_date"] += 1
+                        if not placed:
+                            tally["no_birth_place"] += 1
+                        if not cited:
+                            tally["births_uncited"] += 1
+                        if private:
+                            tally["births_private"] += 1
+                        continue
+                    if death_ref and event_ref.ref == death_ref.ref:
+                        has_death = True
+                        death_ref = None
+                        if not dated:
+                            tally["no_death_date"] += 1
+                        if not placed:
+                            tally["no_death_place"] += 1
+                        if not cited:
+                            tally["deaths_uncited"] += 1
+                        if private:
+                            tally["deaths_private"] += 1
+                        living = False
+                        continue
+                    if event_type[0] in [
+                        EventType.BAPTISM,
+                        EventType.CHRISTEN,
+                    ]:
+                        has_baptism = True
+                        if not dated:
+                            tally["no_baptism_date"] += 1
+                        if not placed:
+                            tally["no_baptism_place"] += 1
+                        if private:
+                            tally["baptisms_private"] += 1
+                        continue
+                    if event_type[0] in [
+                        EventType.BURIAL,
+                        EventType.CREMATION,
+                    ]:
+                        has_burial = True
+                        if not dated:
+                            tally["no_burial_date"] += 1
+                        if not placed:
+                            tally["no_burial_place"] += 1
+                        if private:
+                            tally["burials_private"] += 1
+                        living = False
+                        continue
+                    if event_type[0] in [
+                        EventType.CAUSE_DEATH,
+                        EventType.PROBATE,
+                    ]:
+                        living = False
+        else:
+            if birth_ref:
+                (dummy_type, dated, placed, cited, private) = lookup_event(
+                    db, birth_ref.ref, args
+                )
+                has_birth = True
+                if not dated:
+                    tally["no_birth_date"] += 1
+                if not placed:
+                    tally["no_birth_place"] += 1
+                if not cited:
+                    tally["births_uncited"] += 1
+                if private:
+                    tally["births_private"] += 1
+            if death_ref:
+                (dummy_type, dated, placed, cited, private) = lookup_event(
+                    db, death_ref.ref, args
+                )
+                has_death = True
+                if not dated:
+                    tally["no_death_date"] += 1
+                if not placed:
+                    tally["no_death_place"] += 1
+                if not cited:
+                    tally["deaths_uncited"] += 1
+                if private:
+                    tally["deaths_private"] += 1
+                living = False
+
+    if not has_birth:
+        tally["no_birth"] += 1
+    if not has_baptism:
+        tally["no_baptism"] += 1
+
+    if living:
+        living = is_living(db, person, args)
+        if living:
+            tally["total_living"] += 1
+            tally[("gender_living", gender)] += 1
+            if not person.private:
+                tally[("gender_living_not_private", gender)] += 1
+
+    if not living:
+        if not has_death:
+            tally["no_death"] += 1
+        if not has_burial:
+            tally["no_burial"] += 1
+
+    if person.person_ref_list:
+        tally["association"] += 1
+        for person_ref in person.person_ref_list:
+            tally["association_refs"] += 1
+            if person_ref.private:
+                tally["association_private"] += 1
+            if not person_ref.citation_list:
+                tally["association_uncited"] += 1
+            tally[("association_types", person_ref.rel)] += 1
+
+    if person.lds_ord_list:
+        tally["ldsord_people"] += 1
+        for ldsord in person.lds_ord_list:
+            tally["ldsord_refs"] += 1
+            if ldsord.private:
+                tally["ldsord_private"] += 1
+            if not ldsord.citation_list:
+                tally["ldsord_uncited"] += 1
+            if not has_date(ldsord):
+                tally["no_date"] += 1
+            if not ldsord.place:
+                tally["no_place"] += 1
+            if not ldsord.famc:
+                tally["no_family"] += 1
+            if not ldsord.temple:
+                tally["no_temple"] += 1
+            if not ldsord.status:
+                tally["no_status"] += 1
+
+
+def summarize_people(db, tally, args):
+    """
+    Prepare the people statistics payload from a tally.
+    """
+    total_people = tally["total"]
+    media_refs = tally["media_refs"]
+    association_refs = tally["association_refs"]
+    participant_refs = tally["participant_refs"]
+    ldsord_refs = tally["ldsord_refs"]
+    total_living = tally["total_living"]
+
+    participant_roles = collect_counts(
+        tally, "participant_roles", participant_refs
+    )
+    association_types = collect_counts(
+        tally, "association_types", association_refs
+    )
+
+    with_birth = total_people - tally["no_birth"]
+    with_baptism = total_people - tally["no_baptism"]
     dead_people = total_people - total_living
-    with_death = dead_people - no_death
-    with_burial = dead_people - no_burial
+    with_death = dead_people - tally["no_death"]
+    with_burial = dead_people - tally["no_burial"]
 
     payload = {
         "person": {
             "total": (total_people, None),
-            "incomplete_names": (incomplete_names, total_people),
-            "alternate_names": (alternate_names, total_people),
-            "no_family_connection": (no_families, total_people),
-            "no_birth": (no_birth, total_people),
-            "no_birth_date": (no_birth_date, with_birth),
-            "no_birth_place": (no_birth_place, with_birth),
-            "no_baptism": (no_baptism, total_people),
-            "no_baptism_date": (no_baptism_date, with_baptism),
-            "no_baptism_place": (no_baptism_place, with_baptism),
-            "no_death": (no_death, dead_people),
-            "no_death_date": (no_death_date, with_death),
-            "no_death_place": (no_death_place, with_death),
-            "no_burial": (no_burial, dead_people),
-            "no_burial_date": (no_burial_date, with_burial),
-            "no_burial_place": (no_burial_place, with_burial),
+            "incomplete_names": (tally["incomplete_names"], total_people),
+            "alternate_names": (tally["alternate_names"], total_people),
+            "no_family_connection": (tally["no_families"], total_people),
+            "no_birth": (tally["no_birth"], total_people),
+            "no_birth_date": (tally["no_birth_date"], with_birth),
+            "no_birth_place": (tally["no_birth_place"], with_birth),
+            "no_baptism": (tally["no_baptism"], total_people),
+            "no_baptism_date": (tally["no_baptism_date"], with_baptism),
+            "no_baptism_place": (tally["no_baptism_place"], with_baptism),
+            "no_death": (tally["no_death"], dead_people),
+            "no_death_date": (tally["no_death_date"], with_death),
+            "no_death_place": (tally["no_death_place"], with_death),
+            "no_burial": (tally["no_burial"], dead_people),
+            "no_burial_date": (tally["no_burial_date"], with_burial),
+            "no_burial_place": (tally["no_burial_place"], with_burial),
         },
         "media": {
-            "person": (media, total_people),
+            "person": (tally["media"], total_people),
             "person_refs": (media_refs, None),
-            "person_missing_region": (missing_region, media_refs),
+            "person_missing_region": (tally["missing_region"], media_refs),
         },
         "ldsord_person": {
-            "ldsord": (ldsord_people, total_people),
+            "ldsord": (tally["ldsord_people"], total_people),
             "ldsord_refs": (ldsord_refs, None),
-            "no_temple": (no_temple, ldsord_refs),
-            "no_status": (no_status, ldsord_refs),
-            "no_date": (no_date, ldsord_refs),
-            "no_place": (no_place, ldsord_refs),
-            "no_family": (no_family, ldsord_refs),
+            "no_temple": (tally["no_temple"], ldsord_refs),
+            "no_status": (tally["no_status"], ldsord_refs),
+            "no_date": (tally["no_date"], ldsord_refs),
+            "no_place": (tally["no_place"], ldsord_refs),
+            "no_family": (tally["no_family"], ldsord_refs),
         },
         "association": {
-            "total": (association, total_people),
+            "total": (tally["association"], total_people),
             "refs": (association_refs, None),
             "types": association_types,
         },
         "participant": {
-            "person_total": (participant, total_people),
+            "person_total": (tally["participant"], total_people),
             "person_refs": (participant_refs, None),
             "person_roles": participant_roles,
         },
         "uncited": {
-            "association": (association_uncited, association_refs),
-            "ldsord_person": (ldsord_uncited, ldsord_refs),
-            "names": (names_uncited, None),
-            "preferred_births": (births_uncited, with_birth),
-            "preferred_deaths": (deaths_uncited, with_death),
+            "association": (tally["association_uncited"], association_refs),
+            "ldsord_person": (tally["ldsord_uncited"], ldsord_refs),
+            "names": (tally["names_uncited"], None),
+            "preferred_births": (tally["births_uncited"], with_birth),
+            "preferred_deaths": (tally["deaths_uncited"], with_death),
         },
         "privacy": {
-            "names": (names_private, None),
-            "baptism": (baptisms_private, with_baptism),
-            "preferred_births": (births_private, with_birth),
-            "preferred_deaths": (deaths_private, with_death),
-            "burial": (burials_private, with_burial),
-            "ldsord_person": (ldsord_private, ldsord_refs),
-            "association": (association_private, association_refs),
-            "participant": (participant_private, participant_refs),
+            "names": (tally["names_private"], None),
+            "baptism": (tally["baptisms_private"], with_baptism),
+            "preferred_births": (tally["births_private"], with_birth),
+            "preferred_deaths": (tally["deaths_private"], with_death),
+            "burial": (tally["burials_private"], with_burial),
+            "ldsord_person": (tally["ldsord_private"], ldsord_refs),
+            "association": (tally["association_private"], association_refs),
+            "participant": (tally["participant_private"], participant_refs),
         },
         "tag": {},
     }
 
-    for gender in gender_stats:
+    genders = collect_counts(tally, "gender_total")
+    for (gender, total_gender) in genders.items():
         if gender == Person.MALE:
             prefix = "male"
         elif gender == Person.FEMALE:
             prefix = "female"
         else:
             prefix = "unknown"
-        data = gender_stats[gender]
-        total_gender = data["total"]
+        living = tally[("gender_living", gender)]
         payload["person"].update(
             {
                 "%s_total" % prefix: (total_gender, total_people),
-                "%s_living" % prefix: (data["living"], total_gender),
+                "%s_living" % prefix: (living, total_gender),
             }
         )
-        payload["tag"].update({prefix: (data["tagged"], total_gender)})
-        payload["uncited"].update({prefix: (data["uncited"], total_gender)})
+        payload["tag"].update(
+            {prefix: (tally[("gender_tagged", gender)], total_gender)}
+        )
+        payload["uncited"].update(
+            {prefix: (tally[("gender_uncited", gender)], total_gender)}
+        )
         payload["privacy"].update(
             {
-                prefix: (data["private"], total_gender),
+                prefix: (tally[("gender_private", gender)], total_gender),
                 "%s_living_not_private"
-                % prefix: (data["living_not_private"], data["living"]),
+                % prefix: (
+                    tally[("gender_living_not_private", gender)],
+                    living,
+                ),
             }
         )
-    return post_processing(args, "People", total_people, queue, payload)
+    return payload
 
 
-def examine_families(args, queue=None, thread_event=None):
+def examine_people(args, queue=None, thread_event=None):
     """
-    Parse and analyze families.
+    Parse and analyze people.
     """
-    media, media_refs = 0, 0
-    missing_one, missing_both = 0, 0
-    family_relations = {}
-    uncited, no_events, private, tagged = 0, 0, 0, 0
-    child, no_child, child_private, child_uncited = 0, 0, 0, 0
-    child_mother_relations, child_father_relations = {}, {}
-    ldsord_families, ldsord_refs, ldsord_private, ldsord_uncited = 0, 0, 0, 0
-    no_temple, no_status, no_date, no_place = 0, 0, 0, 0
-    participant_roles = {}
-    participant, participant_refs, participant_private = 0, 0, 0
+    return examine_objects(args, "Person", queue, thread_event)
 
-    db = open_readonly_database(args.get("tree_name"))
-    total_families = db.get_number_of_families()
-    total_surnames = len(set(db.surname_list))
 
-    for family in db.iter_families():
-        if thread_event and thread_event.is_set():
-            break
+def analyze_family(db, family, tally, args):
+    """
+    Tally the statistics contribution of a family.
+    """
+    tally["total"] += 1
 
-        length = len(family.media_list)
-        if length > 0:
-            media += 1
-            media_refs += length
-
-        if not family.father_handle and not family.mother_handle:
-            missing_both += 1
-        elif not family.father_handle or not family.mother_handle:
-            missing_one += 1
-
-        family_type = family.type.serialize()
-        if family_type not in family_relations:
-            family_relations[family_type] = 0
-        family_relations[family_type] += 1
-
-        if not family.citation_list:
-            uncited += 1
-        if family.private:
-            private += 1
-        if family.tag_list:
-            tagged += 1
-
-        if not family.event_ref_list:
-            no_events += 1
-        else:
-            participant += 1
-            for event_ref in family.event_ref_list:
-                participant_refs += 1
-                role = event_ref.get_role().serialize()
-                if role not in participant_roles:
-                    participant_roles[role] = 0
-                participant_roles[role] += 1
-                if event_ref.private:
-                    participant_private += 1
+    length = len(family.media_list)
+    if length > 0:
+        tally["media"] += 1
+        tally["media_refs"] += length
 
-        if not family.child_ref_list:
-            no_child += 1
-        else:
-            for child_ref in family.child_ref_list:
-                child += 1
-                if child_ref.private:
-                    child_private += 1
-                if not child_ref.citation_list:
-                    child_uncited += 1
-                mother_relation = child_ref.mrel.serialize()
-                if mother_relation not in child_mother_relations:
-                    child_mother_relations[mother_relation] = 0
-                child_mother_relations[mother_relation] += 1
-                father_relation = child_ref.frel.serialize()
-                if father_relation not in child_father_relations:
-                    child_father_relations[father_relation] = 0
-                child_father_relations[father_relation] += 1
-
-        if family.lds_ord_list:
-            ldsord_families += 1
-            for ldsord in family.lds_ord_list:
-                ldsord_refs += 1
-                if ldsord.private:
-                    ldsord_private += 1
-                if not ldsord.citation_list:
-                    ldsord_uncited += 1
-                if not get_date(ldsord):
-                    no_date += 1
-                if not ldsord.place:
-                    no_place += 1
-                if not ldsord.temple:
-                    no_temple += 1
-                if not ldsord.status:
-                    no_status += 1
-    close_readonly_database(db)
-
-    for key in family_relations:
-        family_relations[key] = (family_relations[key], total_families)
-    for key in child_mother_relations:
-        child_mother_relations[key] = (child_mother_relations[key], child)
-    for key in child_father_relations:
-        child_father_relations[key] = (child_father_relations[key], child)
-    for key in participant_roles:
-        participant_roles[key] = (participant_roles[key], participant_refs)
+    if not family.father_handle and not family.mother_handle:
+        tally["missing_both"] += 1
+    elif not family.father_handle or not family.mother_handle:
+        tally["missing_one"] += 1
 
-    payload = {
+    tally[("family_relations", get_type_key(family.type))] += 1
+
+    if not family.citation_list:
+        tally["uncited"] += 1
+    if family.private:
+        tally["private"] += 1
+    if family.tag_list:
+        tally["tagged"] += 1
+
+    if not family.event_ref_list:
+        tally["no_events"] += 1
+    else:
+        tally["participant"] += 1
+        for event_ref in family.event_ref_list:
+            tally["participant_refs"] += 1
+            role = get_type_key(get_role(event_ref))
+            tally[("participant_roles", role)] += 1
+            if event_ref.private:
+                tally["participant_private"] += 1
+
+    if not family.child_ref_list:
+        tally["no_child"] += 1
+    else:
+        for child_ref in family.child_ref_list:
+            tally["child"] += 1
+            if child_ref.private:
+                tally["child_private"] += 1
+            if not child_ref.citation_list:
+                tally["child_uncited"] += 1
+            tally[("mother_relations", get_type_key(child_ref.mrel))] += 1
+            tally[("father_relations", get_type_key(child_ref.frel))] += 1
+
+    if family.lds_ord_list:
+        tally["ldsord_families"] += 1
+        for ldsord in family.lds_ord_list:
+            tally["ldsord_refs"] += 1
+            if ldsord.private:
+                tally["ldsord_private"] += 1
+            if not ldsord.citation_list:
+                tally["ldsord_uncited"] += 1
+            if not has_date(ldsord):
+                tally["no_date"] += 1
+            if not ldsord.place:
+                tally["no_place"] += 1
+            if not ldsord.temple:
+                tally["no_temple"] += 1
+            if not ldsord.status:
+                tally["no_status"] += 1
+
+
+def summarize_families(db, tally, args):
+    """
+    Prepare the family statistics payload from a tally.
+    """
+    total_families = tally["total"]
+    total_surnames = len(set(db.surname_list))
+    child = tally["child"]
+    ldsord_refs = tally["ldsord_refs"]
+    participant_refs = tally["participant_refs"]
+
+    family_relations = collect_counts(
+        tally, "family_relations", total_families
+    )
+    child_mother_relations = collect_counts(tally, "mother_relations", child)
+    child_father_relations = collect_counts(tally, "father_relations", child)
+    participant_roles = collect_counts(
+        tally, "participant_roles", participant_refs
+    )
+
+    return {
         "family": {
             "total": (total_families, None),
             "surname_total": (total_surnames, None),
-            "missing_one": (missing_one, total_families),
-            "missing_both": (missing_both, total_families),
-            "no_child": (no_child, total_families),
-            "no_events": (no_events, total_families),
+            "missing_one": (tally["missing_one"], total_families),
+            "missing_both": (tally["missing_both"], total_families),
+            "no_child": (tally["no_child"], total_families),
+            "no_events": (tally["no_events"], total_families),
             "relations": family_relations,
         },
         "ldsord_family": {
-            "ldsord": (ldsord_families, total_families),
+            "ldsord": (tally["ldsord_families"], total_families),
             "ldsord_refs": (ldsord_refs, None),
-            "no_temple": (no_temple, ldsord_refs),
-            "no_status": (no_status, ldsord_refs),
-            "no_date": (no_date, ldsord_refs),
-            "no_place": (no_place, ldsord_refs),
+            "no_temple": (tally["no_temple"], ldsord_refs),
+            "no_status": (tally["no_status"], ldsord_refs),
+            "no_date": (tally["no_date"], ldsord_refs),
+            "no_place": (tally["no_place"], ldsord_refs),
         },
         "uncited": {
-            "family": (uncited, total_families),
-            "child": (child_uncited, child),
-            "ldsord_family": (ldsord_uncited, ldsord_refs),
+            "family": (tally["uncited"], total_families),
+            "child": (tally["child_uncited"], child),
+            "ldsord_family": (tally["ldsord_uncited"], ldsord_refs),
         },
         "privacy": {
-            "family": (private, total_families),
-            "child": (child_private, child),
-            "family_participant": (participant_private, None),
-            "ldsord_family": (ldsord_private, ldsord_refs),
+            "family": (tally["private"], total_families),
+            "child": (tally["child_private"], child),
+            "family_participant": (tally["participant_private"], None),
+            "ldsord_family": (tally["ldsord_private"], ldsord_refs),
         },
         "tag": {
-            "family": (tagged, total_families),
+            "family": (tally["tagged"], total_families),
         },
         "children": {
             "refs": (child, None),
@@ -536,215 +1180,219 @@ def examine_families(args, queue=None, thread_event=None):
             "father_relations": child_father_relations,
         },
         "participant": {
-            "family_total": participant,
+            "family_total": tally["participant"],
             "family_refs": participant_refs,
             "family_roles": participant_roles,
         },
         "media": {
-            "family": (media, total_families),
-            "family_refs": (media_refs, None),
+            "family": (tally["media"], total_families),
+            "family_refs": (tally["media_refs"], None),
         },
     }
-    return post_processing(args, "Families", total_families, queue, payload)
 
 
-def examine_events(args, queue=None, thread_event=None):
+def examine_families(args, queue=None, thread_event=None):
     """
-    Parse and analyze events.
+    Parse and analyze families.
     """
-    media, media_refs = 0, 0
-    no_date, no_place, no_description = 0, 0, 0
-    uncited, private, tagged, marriages = 0, 0, 0, 0
-    event_types = {}
-    uncited_events = {}
-    no_marriage_date, no_marriage_place, marriage_private = 0, 0, 0
-
-    db = open_readonly_database(args.get("tree_name"))
-    total_events = db.get_number_of_events()
-
-    for event in db.iter_events():
-        if thread_event and thread_event.is_set():
-            break
+    return examine_objects(args, "Family", queue, thread_event)
 
-        length = len(event.media_list)
-        if length > 0:
-            media += 1
-            media_refs += length
 
-        if not event.citation_list:
-            uncited += 1
+def analyze_event(db, event, tally, args):
+    """
+    Tally the statistics contribution of an event.
+    """
+    tally["total"] += 1
+
+    length = len(event.media_list)
+    if length > 0:
+        tally["media"] += 1
+        tally["media_refs"] += length
+
+    if not event.citation_list:
+        tally["uncited"] += 1
+    if not event.place:
+        tally["no_place"] += 1
+    dated = has_date(event)
+    if not dated:
+        tally["no_date"] += 1
+    if not event.description:
+        tally["no_description"] += 1
+    if event.private:
+        tally["private"] += 1
+    if event.tag_list:
+        tally["tagged"] += 1
+
+    event_key = get_type_key(get_type(event))
+    if event_key[0] == EventType.MARRIAGE:
+        tally["marriages"] += 1
         if not event.place:
-            no_place += 1
-        if not get_date(event):
-            no_date += 1
-        if not event.get_description():
-            no_description += 1
+            tally["no_marriage_place"] += 1
+        if not dated:
+            tally["no_marriage_date"] += 1
         if event.private:
-            private += 1
-        if event.tag_list:
-            tagged += 1
-
-        event_type = event.get_type()
-        if event_type == EventType.MARRIAGE:
-            marriages += 1
-            if not event.place:
-                no_marriage_place += 1
-            if not get_date(event):
-                no_marriage_date += 1
-            if event.private:
-                marriage_private += 1
-
-        event_key = event_type.serialize()
-        if event_key not in event_types:
-            event_types[event_key] = 0
-            uncited_events[event_key] = 0
-        event_types[event_key] += 1
-        if not event.citation_list:
-            uncited_events[event_key] += 1
-    close_readonly_database(db)
-
-    for key in uncited_events:
-        uncited_events[key] = (uncited_events[key], event_types[key])
+            tally["marriage_private"] += 1
+
+    tally[("event_types", event_key)] += 1
+    if not event.citation_list:
+        tally[("uncited_events", event_key)] += 1
+
+
+def summarize_events(db, tally, args):
+    """
+    Prepare the event statistics payload from a tally.
+    """
+    total_events = tally["total"]
+    marriages = tally["marriages"]
+
+    event_types = collect_counts(tally, "event_types")
+    uncited_events = {}
+    for key in event_types:
+        uncited_events[key] = (
+            tally[("uncited_events", key)],
+            event_types[key],
+        )
     for key in event_types:
         event_types[key] = (event_types[key], total_events)
 
-    payload = {
+    return {
         "event": {
             "total": (total_events, None),
-            "no_place": (no_place, total_events),
-            "no_date": (no_date, total_events),
-            "no_description": (no_description, total_events),
+            "no_place": (tally["no_place"], total_events),
+            "no_date": (tally["no_date"], total_events),
+            "no_description": (tally["no_description"], total_events),
             "types": event_types,
         },
         "family": {
-            "no_marriage_date": (no_marriage_date, marriages),
-            "no_marriage_place": (no_marriage_place, marriages),
+            "no_marriage_date": (tally["no_marriage_date"], marriages),
+            "no_marriage_place": (tally["no_marriage_place"], marriages),
         },
         "uncited": {
-            "event": (uncited, total_events),
+            "event": (tally["uncited"], total_events),
             "events": uncited_events,
         },
         "privacy": {
-            "event": (private, total_events),
-            "marriage": (marriage_private, marriages),
+            "event": (tally["private"], total_events),
+            "marriage": (tally["marriage_private"], marriages),
         },
         "tag": {
-            "event": (tagged, total_events),
+            "event": (tally["tagged"], total_events),
         },
         "media": {
-            "event": (media, total_events),
-            "event_refs": (media_refs, None),
+            "event": (tally["media"], total_events),
+            "event_refs": (tally["media_refs"], None),
         },
     }
-    return post_processing(args, "Events", total_events, queue, payload)
 
 
-def examine_places(args, queue=None, thread_event=None):
+def examine_events(args, queue=None, thread_event=None):
     """
-    Parse and analyze places.
+    Parse and analyze events.
     """
-    media, media_refs = 0, 0
-    no_name, no_latitude, no_longitude, no_code = 0, 0, 0, 0
-    uncited, private, tagged = 0, 0, 0
-    place_types = {}
+    return examine_objects(args, "Event", queue, thread_event)
 
-    db = open_readonly_database(args.get("tree_name"))
-    total_places = db.get_number_of_places()
 
-    for place in db.iter_places():
-        if thread_event and thread_event.is_set():
-            break
-
-        length = len(place.media_list)
-        if length > 0:
-            media += 1
-            media_refs += length
-
-        place_type = place.get_type().serialize()
-        if place_type not in place_types:
-            place_types[place_type] = 0
-        place_types[place_type] += 1
-
-        if not place.name:
-            no_name += 1
-        if not place.lat:
-            no_latitude += 1
-        if not place.long:
-            no_longitude += 1
-        if not place.code:
-            no_code += 1
-        if not place.citation_list:
-            uncited += 1
-        if place.private:
-            private += 1
-        if place.tag_list:
-            tagged += 1
-    close_readonly_database(db)
-
-    for key in place_types:
-        place_types[key] = (place_types[key], total_places)
+def analyze_place(db, place, tally, args):
+    """
+    Tally the statistics contribution of a place.
+    """
+    tally["total"] += 1
+
+    length = len(place.media_list)
+    if length > 0:
+        tally["media"] += 1
+        tally["media_refs"] += length
+
+    tally[("place_types", get_type_key(place.place_type))] += 1
+
+    if not place.name:
+        tally["no_name"] += 1
+    if not place.lat:
+        tally["no_latitude"] += 1
+    if not place.long:
+        tally["no_longitude"] += 1
+    if not place.code:
+        tally["no_code"] += 1
+    if not place.citation_list:
+        tally["uncited"] += 1
+    if place.private:
+        tally["private"] += 1
+    if place.tag_list:
+        tally["tagged"] += 1
+
+
+def summarize_places(db, tally, args):
+    """
+    Prepare the place statistics payload from a tally.
+    """
+    total_places = tally["total"]
+    place_types = collect_counts(tally, "place_types", total_places)
 
-    payload = {
+    return {
         "place": {
             "total": (total_places, None),
-            "no_name": (no_name, total_places),
-            "no_latitude": (no_latitude, total_places),
-            "no_longitude": (no_longitude, total_places),
-            "no_code": (no_code, total_places),
+            "no_name": (tally["no_name"], total_places),
+            "no_latitude": (tally["no_latitude"], total_places),
+            "no_longitude": (tally["no_longitude"], total_places),
+            "no_code": (tally["no_code"], total_places),
             "types": place_types,
         },
         "uncited": {
-            "place": (uncited, total_places),
+            "place": (tally["uncited"], total_places),
         },
         "privacy": {
-            "place": (private, total_places),
+            "place": (tally["private"], total_places),
         },
         "tag": {
-            "place": (tagged, total_places),
+            "place": (tally["tagged"], total_places),
         },
         "media": {
-            "place": (media, total_places),
-            "place_refs": (media_refs, None),
+            "place": (tally["media"], total_places),
+            "place_refs": (tally["media_refs"], None),
         },
     }
-    return post_processing(args, "Places", total_places, queue, payload)
 
 
-def examine_media(args, queue=None, thread_event=None):
+def examine_places(args, queue=None, thread_event=None):
     """
-    Parse and analyze media objects.
+    Parse and analyze places.
     """
-    no_desc, no_date, no_path, no_mime = 0, 0, 0, 0
-    uncited, private, tagged, size_bytes = 0, 0, 0, 0
-    not_found = []
+    return examine_objects(args, "Place", queue, thread_event)
 
-    db = open_readonly_database(args.get("tree_name"))
-    total_media = db.get_number_of_media()
 
-    for media in db.iter_media():
-        if thread_event and thread_event.is_set():
-            break
+def analyze_media(db, media, tally, args):
+    """
+    Tally the statistics contribution of a media object.
+    """
+    tally["total"] += 1
+
+    if not media.desc:
+        tally["no_desc"] += 1
+    if not has_date(media):
+        tally["no_date"] += 1
+    if not media.mime:
+        tally["no_mime"] += 1
+    if media.private:
+        tally["private"] += 1
+    if media.tag_list:
+        tally["tagged"] += 1
+    if not media.path:
+        tally["no_path"] += 1
+    else:
+        fullname = media_path_full(db, media.path)
+        try:
+            tally["size_bytes"] += os.path.getsize(fullname)
+        except OSError:
+            tally[("not_found", media.path)] += 1
 
-        if not media.desc:
-            no_desc += 1
-        if not get_date(media):
-            no_date += 1
-        if not media.mime:
-            no_mime += 1
-        if media.private:
-            private += 1
-        if media.tag_list:
-            tagged += 1
-        if not media.path:
-            no_path += 1
-        else:
-            fullname = media_path_full(db, media.path)
-            try:
-                size_bytes += os.path.getsize(fullname)
-            except OSError:
-                if media.path not in not_found:
-                    not_found.append(media.path)
-    close_readonly_database(db)
+
+def summarize_media(db, tally, args):
+    """
+    Prepare the media statistics payload from a tally.
+    """
+    total_media = tally["total"]
+    size_bytes = tally["size_bytes"]
+    not_found = list(collect_counts(tally, "not_found"))
 
     if not int(size_bytes / 1024):
         size_string = "%s bytes" % size_bytes
@@ -753,295 +1401,309 @@ def examine_media(args, queue=None, thread_event=None):
     else:
         size_string = "%s MB" % int(size_bytes / 1048576)
 
-    payload = {
+    return {
         "media": {
             "total": (total_media, None),
             "size": (size_string, None),
-            "no_path": (no_path, total_media),
-            "no_file": (len(not_found), total_media - no_path),
+            "no_path": (tally["no_path"], total_media),
+            "no_file": (len(not_found), total_media - tally["no_path"]),
             "not_found": not_found,
-            "no_description": (no_desc, total_media),
-            "no_date": (no_date, total_media),
-            "no_mime": (no_mime, total_media),
+            "no_description": (tally["no_desc"], total_media),
+            "no_date": (tally["no_date"], total_media),
+            "no_mime": (tally["no_mime"], total_media),
         },
         "uncited": {
-            "media": (uncited, total_media),
+            "media": (tally["uncited"], total_media),
         },
         "privacy": {
-            "media": (private, total_media),
+            "media": (tally["private"], total_media),
         },
         "tag": {
-            "media": (tagged, total_media),
+            "media": (tally["tagged"], total_media),
         },
     }
-    return post_processing(args, "Media", total_media, queue, payload)
 
 
-def examine_sources(args, queue=None, thread_event=None):
+def examine_media(args, queue=None, thread_event=None):
     """
-    Parse and analyze sources.
+    Parse and analyze media objects.
     """
-    media, media_refs = 0, 0
-    no_title, no_author, no_pubinfo, no_abbrev = 0, 0, 0, 0
-    no_repository, repos_refs, no_call_number, private, tagged = 0, 0, 0, 0, 0
-    media_types = {}
+    return examine_objects(args, "Media", queue, thread_event)
 
-    db = open_readonly_database(args.get("tree_name"))
-    total_sources = db.get_number_of_sources()
 
-    for source in db.iter_sources():
-        if thread_event and thread_event.is_set():
-            break
-
-        length = len(source.media_list)
-        if length > 0:
-            media += 1
-            media_refs += length
-
-        if not source.title:
-            no_title += 1
-        if not source.author:
-            no_author += 1
-        if not source.pubinfo:
-            no_pubinfo += 1
-        if not source.abbrev:
-            no_abbrev += 1
-        if not source.reporef_list:
-            no_repository += 1
-        else:
-            repos_refs += len(source.reporef_list)
-            for repo_ref in source.reporef_list:
-                if not repo_ref.call_number:
-                    no_call_number += 1
-                media_type = repo_ref.media_type.serialize()
-                if media_type not in media_types:
-                    media_types[media_type] = 0
-                media_types[media_type] += 1
-        if source.private:
-            private += 1
-        if source.tag_list:
-            tagged += 1
-    close_readonly_database(db)
-
-    for key in media_types:
-        media_types[key] = (media_types[key], repos_refs)
+def analyze_source(db, source, tally, args):
+    """
+    Tally the statistics contribution of a source.
+    """
+    tally["total"] += 1
+
+    length = len(source.media_list)
+    if length > 0:
+        tally["media"] += 1
+        tally["media_refs"] += length
+
+    if not source.title:
+        tally["no_title"] += 1
+    if not source.author:
+        tally["no_author"] += 1
+    if not source.pubinfo:
+        tally["no_pubinfo"] += 1
+    if not source.abbrev:
+        tally["no_abbrev"] += 1
+    if not source.reporef_list:
+        tally["no_repository"] += 1
+    else:
+        tally["repos_refs"] += len(source.reporef_list)
+        for repo_ref in source.reporef_list:
+            if not repo_ref.call_number:
+                tally["no_call_number"] += 1
+            tally[("media_types", get_type_key(repo_ref.media_type))] += 1
+    if source.private:
+        tally["private"] += 1
+    if source.tag_list:
+        tally["tagged"] += 1
+
+
+def summarize_sources(db, tally, args):
+    """
+    Prepare the source statistics payload from a tally.
+    """
+    total_sources = tally["total"]
+    repos_refs = tally["repos_refs"]
+    media_types = collect_counts(tally, "media_types", repos_refs)
 
-    payload = {
+    return {
         "source": {
             "total": (total_sources, None),
-            "no_title": (no_title, total_sources),
-            "no_author": (no_author, total_sources),
-            "no_pubinfo": (no_pubinfo, total_sources),
-            "no_abbrev": (no_abbrev, total_sources),
-            "no_repository": (no_repository, total_sources),
+            "no_title": (tally["no_title"], total_sources),
+            "no_author": (tally["no_author"], total_sources),
+            "no_pubinfo": (tally["no_pubinfo"], total_sources),
+            "no_abbrev": (tally["no_abbrev"], total_sources),
+            "no_repository": (tally["no_repository"], total_sources),
             "repository_refs": (repos_refs, None),
-            "no_call_number": (no_call_number, repos_refs),
+            "no_call_number": (tally["no_call_number"], repos_refs),
             "types": media_types,
         },
         "privacy": {
-            "source": (private, total_sources),
+            "source": (tally["private"], total_sources),
         },
         "tag": {
-            "source": (tagged, total_sources),
+            "source": (tally["tagged"], total_sources),
         },
         "media": {
-            "source": (media, total_sources),
-            "source_refs": (media_refs, None),
+            "source": (tally["media"], total_sources),
+            "source_refs": (tally["media_refs"], None),
         },
     }
-    return post_processing(args, "Sources", total_sources, queue, payload)
 
 
-def examine_citations(args, queue=None, thread_event=None):
+def examine_sources(args, queue=None, thread_event=None):
     """
-    Parse and analyze citation objects.
+    Parse and analyze sources.
     """
-    media, media_refs = 0, 0
-    no_source, no_page, no_date, private, tagged = 0, 0, 0, 0, 0
-    very_low, low, normal, high, very_high = 0, 0, 0, 0, 0
-
-    db = open_readonly_database(args.get("tree_name"))
-    total_citations = db.get_number_of_citations()
+    return examine_objects(args, "Source", queue, thread_event)
 
-    for citation in db.iter_citations():
-        if thread_event and thread_event.is_set():
-            break
 
-        length = len(citation.media_list)
-        if length > 0:
-            media += 1
-            media_refs += length
-
-        if not get_date(citation):
-            no_date += 1
-        if not citation.source_handle:
-            no_source += 1
-        if not citation.page:
-            no_page += 1
-        if citation.private:
-            private += 1
-        if citation.tag_list:
-            tagged += 1
-        if citation.confidence == Citation.CONF_VERY_LOW:
-            very_low += 1
-        elif citation.confidence == Citation.CONF_LOW:
-            low += 1
-        elif citation.confidence == Citation.CONF_NORMAL:
-            normal += 1
-        elif citation.confidence == Citation.CONF_HIGH:
-            high += 1
-        elif citation.confidence == Citation.CONF_VERY_HIGH:
-            very_high += 1
-    close_readonly_database(db)
+def analyze_citation(db, citation, tally, args):
+    """
+    Tally the statistics contribution of a citation.
+    """
+    tally["total"] += 1
+
+    length = len(citation.media_list)
+    if length > 0:
+        tally["media"] += 1
+        tally["media_refs"] += length
+
+    if not has_date(citation):
+        tally["no_date"] += 1
+    if not citation.source_handle:
+        tally["no_source"] += 1
+    if not citation.page:
+        tally["no_page"] += 1
+    if citation.private:
+        tally["private"] += 1
+    if citation.tag_list:
+        tally["tagged"] += 1
+    if citation.confidence == Citation.CONF_VERY_LOW:
+        tally["very_low"] += 1
+    elif citation.confidence == Citation.CONF_LOW:
+        tally["low"] += 1
+    elif citation.confidence == Citation.CONF_NORMAL:
+        tally["normal"] += 1
+    elif citation.confidence == Citation.CONF_HIGH:
+        tally["high"] += 1
+    elif citation.confidence == Citation.CONF_VERY_HIGH:
+        tally["very_high"] += 1
+
+
+def summarize_citations(db, tally, args):
+    """
+    Prepare the citation statistics payload from a tally.
+    """
+    total_citations = tally["total"]
 
     payload = {
         "citation": {
             "total": (total_citations, None),
-            "no_source": (no_source, total_citations),
-            "no_date": (no_date, total_citations),
-            "no_page": (no_page, total_citations),
+            "no_source": (tally["no_source"], total_citations),
+            "no_date": (tally["no_date"], total_citations),
+            "no_page": (tally["no_page"], total_citations),
             "confidence": {},
         },
         "privacy": {
-            "citation": (private, total_citations),
+            "citation": (tally["private"], total_citations),
         },
         "tag": {
-            "citation": (tagged, total_citations),
+            "citation": (tally["tagged"], total_citations),
         },
         "media": {
-            "citation": (media, total_citations),
-            "citation_refs": (media_refs, None),
+            "citation": (tally["media"], total_citations),
+            "citation_refs": (tally["media_refs"], None),
         },
     }
     if total_citations:
         payload["citation"]["confidence"].update(
             {
-                "very_low": (very_low, total_citations),
-                "low": (low, total_citations),
-                "normal": (normal, total_citations),
-                "high": (high, total_citations),
-                "very_high": (very_high, total_citations),
+                "very_low": (tally["very_low"], total_citations),
+                "low": (tally["low"], total_citations),
+                "normal": (tally["normal"], total_citations),
+                "high": (tally["high"], total_citations),
+                "very_high": (tally["very_high"], total_citations),
             }
         )
-    return post_processing(args, "Citations", total_citations, queue, payload)
+    return payload
 
 
-def examine_repositories(args, queue=None, thread_event=None):
+def examine_citations(args, queue=None, thread_event=None):
     """
-    Parse and analyze repositories.
+    Parse and analyze citation objects.
     """
-    no_name, no_address, private, tagged = 0, 0, 0, 0
-    repository_types = {}
+    return examine_objects(args, "Citation", queue, thread_event)
 
-    db = open_readonly_database(args.get("tree_name"))
-    total_repositories = db.get_number_of_repositories()
 
-    for repository in db.iter_repositories():
-        if thread_event and thread_event.is_set():
-            break
+def analyze_repository(db, repository, tally, args):
+    """
+    Tally the statistics contribution of a repository.
+    """
+    tally["total"] += 1
 
-        repository_type = repository.get_type().serialize()
-        if repository_type not in repository_types:
-            repository_types[repository_type] = 0
-        repository_types[repository_type] += 1
+    tally[("repository_types", get_type_key(repository.type))] += 1
 
-        if not repository.name:
-            no_name += 1
-        if not repository.address_list:
-            no_address += 1
-        if repository.private:
-            private += 1
-        if repository.tag_list:
-            tagged += 1
-    close_readonly_database(db)
+    if not repository.name:
+        tally["no_name"] += 1
+    if not repository.address_list:
+        tally["no_address"] += 1
+    if repository.private:
+        tally["private"] += 1
+    if repository.tag_list:
+        tally["tagged"] += 1
 
-    for key in repository_types:
-        repository_types[key] = (repository_types[key], total_repositories)
 
-    payload = {
+def summarize_repositories(db, tally, args):
+    """
+    Prepare the repository statistics payload from a tally.
+    """
+    total_repositories = tally["total"]
+    repository_types = collect_counts(
+        tally, "repository_types", total_repositories
+    )
+
+    return {
         "repository": {
             "total": (total_repositories, None),
-            "no_name": (no_name, total_repositories),
-            "no_address": (no_address, total_repositories),
+            "no_name": (tally["no_name"], total_repositories),
+            "no_address": (tally["no_address"], total_repositories),
             "types": repository_types,
         },
         "privacy": {
-            "repository": (private, total_repositories),
+            "repository": (tally["private"], total_repositories),
         },
         "tag": {
-            "repository": (tagged, total_repositories),
+            "repository": (tally["tagged"], total_repositories),
         },
     }
-    return post_processing(
-        args, "Repositories", total_repositories, queue, payload
-    )
 
 
-def examine_notes(args, queue=None, thread_event=None):
+def examine_repositories(args, queue=None, thread_event=None):
     """
-    Parse and analyze notes.
+    Parse and analyze repositories.
     """
-    no_text, private, tagged = 0, 0, 0
-    note_types = {}
+    return examine_objects(args, "Repository", queue, thread_event)
 
-    db = open_readonly_database(args.get("tree_name"))
-    total_notes = db.get_number_of_notes()
 
-    for note in db.iter_notes():
-        if thread_event and thread_event.is_set():
-            break
+def analyze_note(db, note, tally, args):
+    """
+    Tally the statistics contribution of a note.
+    """
+    tally["total"] += 1
 
-        note_type = note.get_type().serialize()
-        if note_type not in note_types:
-            note_types[note_type] = 0
-        note_types[note_type] += 1
+    tally[("note_types", get_type_key(note.type))] += 1
 
-        if not note.text:
-            no_text += 1
-        if note.private:
-            private += 1
-        if note.tag_list:
-            tagged += 1
-    close_readonly_database(db)
+    if not note.text:
+        tally["no_text"] += 1
+    if note.private:
+        tally["private"] += 1
+    if note.tag_list:
+        tally["tagged"] += 1
 
-    for key in note_types:
-        note_types[key] = (note_types[key], total_notes)
 
-    payload = {
+def summarize_notes(db, tally, args):
+    """
+    Prepare the note statistics payload from a tally.
+    """
+    total_notes = tally["total"]
+    note_types = collect_counts(tally, "note_types", total_notes)
+
+    return {
         "note": {
             "total": (total_notes, None),
-            "no_text": (no_text, total_notes),
+            "no_text": (tally["no_text"], total_notes),
             "types": note_types,
         },
         "privacy": {
-            "note": (private, total_notes),
+            "note": (tally["private"], total_notes),
         },
         "tag": {
-            "note": (tagged, total_notes),
+            "note": (tally["tagged"], total_notes),
         },
     }
-    return post_processing(args, "Notes", total_notes, queue, payload)
 
 
-def examine_tags(args, queue=None, thread_event=None):
+def examine_notes(args, queue=None, thread_event=None):
     """
-    Parse and analyze tags.
+    Parse and analyze notes.
     """
-    db = open_readonly_database(args.get("tree_name"))
-    total_tags = db.get_number_of_tags()
-    close_readonly_database(db)
+    return examine_objects(args, "Note", queue, thread_event)
 
-    payload = {
-        "tag": {"total": (total_tags, None)},
+
+def analyze_tag(db, tag, tally, args):
+    """
+    Tally the statistics contribution of a tag.
+    """
+    tally["total"] += 1
+
+
+def summarize_tags(db, tally, args):
+    """
+    Prepare the tag statistics payload from a tally.
+    """
+    return {
+        "tag": {"total": (tally["total"], None)},
     }
-    return post_processing(args, "Tags", total_tags, queue, payload)
 
 
-def examine_bookmarks(args):
+def examine_tags(args, queue=None, thread_event=None):
     """
-    Parse and analyze bookmarks.
+    Parse and analyze tags.
+    """
+    return examine_objects(args, "Tag", queue, thread_event)
+
+
+def summarize_bookmarks(db):
+    """
+    Prepare the bookmark statistics payload.
     """
-    db = open_readonly_database(args.get("tree_name"))
     person_bookmarks = len(db.get_bookmarks().bookmarks)
     family_bookmarks = len(db.get_family_bookmarks().bookmarks)
     event_bookmarks = len(db.get_event_bookmarks().bookmarks)
@@ -1062,7 +1724,7 @@ def examine_bookmarks(args):
         + repository_bookmarks
         + note_bookmarks
     )
-    payload = {
+    return {
         "bookmark": {
             "total": (total_bookmarks, None),
             "person": (person_bookmarks, total_bookmarks),
@@ -1076,10 +1738,208 @@ def examine_bookmarks(args):
             "note": (note_bookmarks, total_bookmarks),
         }
     }
-    close_readonly_database(db)
+
+
+def examine_bookmarks(args):
+    """
+    Parse and analyze bookmarks.
+    """
+    with readonly_database(args) as db:
+        payload = summarize_bookmarks(db)
+    total_bookmarks = payload["bookmark"]["total"][0]
     return post_processing(args, "Bookmarks", total_bookmarks, None, payload)
 
 
+def examine_objects(args, obj_type, queue=None, thread_event=None):
+    """
+    Parse and analyze all objects of a given type.
+    """
+    handler = OBJECT_HANDLERS[obj_type]
+    label, dummy_class, dummy_iter, analyze, summarize = handler
+    tally = Counter()
+
+    with readonly_database(args) as db:
+        for obj in iter_objects(db, obj_type, args):
+            if thread_event and thread_event.is_set():
+                break
+            analyze(db, obj, tally, args)
+        payload = summarize(db, tally, args)
+    return post_processing(args, label, tally["total"], queue, payload)
+
+
+def collect_counts(tally, group, total=False):
+    """
+    Extract the non-zero counts tallied for a group of keyed values. If a
+    total is provided each count is paired with it.
+    """
+    counts = {}
+    for (key, count) in tally.items():
+        if count and isinstance(key, tuple) and key[0] == group:
+            if total is False:
+                counts[key[1]] = count
+            else:
+                counts[key[1]] = (count, total)
+    return counts
+
+
+# -------------------------------------------------------------------------
+#
+# StatisticsLedger Class
+#
+# -------------------------------------------------------------------------
+class StatisticsLedger:
+    """
+    Keeps the statistics contribution of every object in the tree so the
+    statistics can be adjusted as objects are added, updated or deleted
+    instead of rescanning every table.
+
+    Contributions are interned as identical ones are very common, which
+    keeps the per object cost down to a single reference.
+    """
+
+    def __init__(self, args):
+        self.args = dict(args)
+        self.events = None
+        self.living = None
+        self.profiles = {}
+        self.tallies = {}
+        self.contributions = {}
+        for obj_type in OBJECT_HANDLERS:
+            self.tallies[obj_type] = Counter()
+            self.contributions[obj_type] = {}
+
+    def build(self, db, thread_event=None):
+        """
+        Record the contributions of all objects in the database.
+        """
+        self.events = EventIndex()
+        self.events.build(db, self.args)
+        self.args["event_index"] = self.events
+        self.living = LivingStatus()
+        self.living.load(db, self.args)
+        self.args["living"] = self.living.calculate()
+        for obj_type in OBJECT_HANDLERS:
+            for obj in iter_objects(db, obj_type, self.args):
+                if thread_event and thread_event.is_set():
+                    return False
+                self.record(db, obj_type, obj)
+        return True
+
+    def record(self, db, obj_type, obj):
+        """
+        Record the contribution of an object.
+        """
+        tally = Counter()
+        OBJECT_HANDLERS[obj_type][3](db, obj, tally, self.args)
+        profile = frozenset(tally.items())
+        profile = self.profiles.setdefault(profile, profile)
+        self.contributions[obj_type][obj.handle] = profile
+        totals = self.tallies[obj_type]
+        for (key, count) in profile:
+            totals[key] += count
+
+    def forget(self, obj_type, handle):
+        """
+        Remove the recorded contribution of an object.
+        """
+        profile = self.contributions[obj_type].pop(handle, None)
+        if profile:
+            totals = self.tallies[obj_type]
+            for (key, count) in profile:
+                totals[key] -= count
+
+    def apply_changes(self, db, changes):
+        """
+        Apply a batch of database changes to the recorded contributions.
+        The living status is recalculated once for the whole batch.
+        """
+        affected = {}
+        people = set()
+        for (obj_type, action, handles) in changes:
+            changed = self.prepare_change(db, obj_type, action, handles)
+            for (affected_type, affected_handles) in changed.items():
+                affected.setdefault(affected_type, set()).update(
+                    affected_handles
+                )
+            if self.living:
+                people.update(
+                    self.living.apply_change(
+                        db, obj_type, action, handles, self.events
+                    )
+                )
+
+        if people:
+            changed = self.living.update(people)
+            self.args["living"] = self.living.living
+            if changed:
+                affected.setdefault("Person", set()).update(changed)
+
+        for (affected_type, affected_handles) in affected.items():
+            for handle in affected_handles:
+                self.forget(affected_type, handle)
+                obj = fetch_object(db, affected_type, handle)
+                if obj:
+                    self.record(db, affected_type, obj)
+
+    def prepare_change(self, db, obj_type, action, handles):
+        """
+        Update the event index for a change and return the handles of the
+        objects whose contributions it affects by type.
+        """
+        if obj_type == "Event" and self.events:
+            self.events.apply_change(db, action, handles)
+
+        affected = {obj_type: set(handles)}
+        if action != "delete":
+            if obj_type == "Event":
+                people = affected.setdefault("Person", set())
+                for handle in handles:
+                    backlinks = db.find_backlink_handles(handle, ["Person"])
+                    people.update([x[1] for x in backlinks])
+            elif obj_type == "Family":
+                people = affected.setdefault("Person", set())
+                for handle in handles:
+                    family = fetch_object(db, "Family", handle)
+                    if family:
+                        people.update(
+                            [family.father_handle, family.mother_handle]
+                            + [x.ref for x in family.child_ref_list]
+                        )
+                people.discard(None)
+        return affected
+
+    def summarize(self, db):
+        """
+        Return the statistics for the recorded contributions.
+        """
+        facts = summarize_bookmarks(db)
+        for (obj_type, tally) in self.tallies.items():
+            summarize = OBJECT_HANDLERS[obj_type][4]
+            fold(facts, summarize(db, tally, self.args))
+        return facts
+
+
+def fetch_object(db, obj_type, handle):
+    """
+    Fetch an object returning None if it no longer exists.
+    """
+    try:
+        return db.method("get_%s_from_handle", obj_type)(handle)
+    except HandleError:
+        return None
+
+
+def build_statistics_ledger(args, thread_event=None):
+    """
+    Gather tree statistics recording the contribution of every object.
+    """
+    ledger = StatisticsLedger(args)
+    with readonly_database(args) as db:
+        ledger.build(db, thread_event=thread_event)
+        facts = ledger.summarize(db)
+    return ledger, facts
+
+
 def open_readonly_database(dbname):
     """
     Open database for read only access.
@@ -1088,6 +1948,8 @@ def open_readonly_database(dbname):
     dbpath, dummy_locked, dummy_locked_by, backend = data
     database = make_database(backend)
     database.load(dbpath, mode=DBMODE_R, update=False)
+    if PROFILE:
+        PROFILE.watch(database)
     return database
 
 
@@ -1104,6 +1966,23 @@ def close_readonly_database(db):
         write_lock_file(save_dir)
 
 
+@contextmanager
+def readonly_database(args):
+    """
+    Provide the database for a tree. It is opened and closed around each
+    use unless one already open is passed along, as in serve mode.
+    """
+    db = args.get("db")
+    if db is not None:
+        yield db
+        return
+    db = open_readonly_database(args.get("tree_name"))
+    try:
+        yield db
+    finally:
+        close_readonly_database(db)
+
+
 def post_processing(args, obj_type, total, queue, payload):
     """
     Handle collection post processing.
@@ -1125,25 +2004,32 @@ def get_object_list(dbname):
     """
     Prepare object list based on descending number of objects.
     """
-    db = open_readonly_database(dbname)
-    object_list = [
-        ("Person", db.get_number_of_people()),
-        ("Family", db.get_number_of_families()),
-        ("Event", db.get_number_of_events()),
-        ("Place", db.get_number_of_places()),
-        ("Media", db.get_number_of_media()),
-        ("Source", db.get_number_of_sources()),
-        ("Citation", db.get_number_of_citations()),
-        ("Repository", db.get_number_of_repositories()),
-        ("Note", db.get_number_of_notes()),
-        ("Tag", db.get_number_of_tags()),
-    ]
-    close_readonly_database(db)
-    object_list.sort(key=lambda x: x[1], reverse=True)
+    object_list = get_object_counts({"tree_name": dbname})
     total = sum([y for (x, y) in object_list])
     return total, [x for (x, y) in object_list]
 
 
+def get_object_counts(args):
+    """
+    Prepare object counts in descending number of objects.
+    """
+    with readonly_database(args) as db:
+        object_list = [
+            ("Person", db.get_number_of_people()),
+            ("Family", db.get_number_of_families()),
+            ("Event", db.get_number_of_events()),
+            ("Place", db.get_number_of_places()),
+            ("Media", db.get_number_of_media()),
+            ("Source", db.get_number_of_sources()),
+            ("Citation", db.get_number_of_citations()),
+            ("Repository", db.get_number_of_repositories()),
+            ("Note", db.get_number_of_notes()),
+            ("Tag", db.get_number_of_tags()),
+        ]
+    object_list.sort(key=lambda x: x[1], reverse=True)
+    return object_list
+
+
 def fold(one, two):
     """
     Fold a set of dictionary entries into another.
@@ -1157,6 +2043,59 @@ def fold(one, two):
                     one[key].update({subkey: two[key][subkey]})
 
 
+SHARD_MINIMUM = 5000
+
+SAMPLE_MINIMUM = 1000
+
+CONFIDENCE_Z = 1.96
+
+SHARED_INDEXES = {}
+
+PROFILE = None
+
+OBJECT_HANDLERS = {
+    "Person": (
+        "People",
+        Person,
+        "iter_people",
+        analyze_person,
+        summarize_people,
+    ),
+    "Family": (
+        "Families",
+        Family,
+        "iter_families",
+        analyze_family,
+        summarize_families,
+    ),
+    "Event": ("Events", Event, "iter_events", analyze_event, summarize_events),
+    "Place": ("Places", Place, "iter_places", analyze_place, summarize_places),
+    "Media": ("Media", Media, "iter_media", analyze_media, summarize_media),
+    "Source": (
+        "Sources",
+        Source,
+        "iter_sources",
+        analyze_source,
+        summarize_sources,
+    ),
+    "Citation": (
+        "Citations",
+        Citation,
+        "iter_citations",
+        analyze_citation,
+        summarize_citations,
+    ),
+    "Repository": (
+        "Repositories",
+        Repository,
+        "iter_repositories",
+        analyze_repository,
+        summarize_repositories,
+    ),
+    "Note": ("Notes", Note, "iter_notes", analyze_note, summarize_notes),
+    "Tag": ("Tags", Tag, "iter_tags", analyze_tag, summarize_tags),
+}
+
 TASK_HANDLERS = {
     "Person": examine_people,
     "Family": examine_families,
@@ -1171,48 +2110,424 @@ TASK_HANDLERS = {
 }
 
 
-def gather_serial_statistics(args, obj_list, event=None):
+# -------------------------------------------------------------------------
+#
+# StatisticsProfile Class
+#
+# -------------------------------------------------------------------------
+class StatisticsProfile:
+    """
+    Records the wall time, peak traced memory and database reads for each
+    statistics handler that is run. Reads are counted per SQL statement
+    executed, which is only possible with the SQLite backend, and the rows
+    returned by table scans are counted separately.
+    """
+
+    def __init__(self, tree_name):
+        self.tree_name = tree_name
+        self.start = time.perf_counter()
+        self.reads = 0
+        self.rows = 0
+        self.watched = False
+        self.handlers = []
+
+    def watch(self, db):
+        """
+        Count the statements executed on a newly opened database.
+        """
+        connection = getattr(
+            getattr(db, "dbapi", None), "_Connection__connection", None
+        )
+        if hasattr(connection, "set_trace_callback"):
+            connection.set_trace_callback(self.count_read)
+            self.watched = True
+
+    def count_read(self, dummy_statement):
+        """
+        Count a database read.
+        """
+        self.reads += 1
+
+    def run(self, handler, obj_type, objects, *args, **kwargs):
+        """
+        Run and profile a handler.
+        """
+        self.reads = 0
+        self.rows = 0
+        tracemalloc.start()
+        start = time.perf_counter()
+        result = handler(*args, **kwargs)
+        elapsed = time.perf_counter() - start
+        dummy_current, peak = tracemalloc.get_traced_memory()
+        tracemalloc.stop()
+        rate = None
+        if elapsed:
+            rate = round(objects / elapsed, 1)
+        self.handlers.append(
+            {
+                "handler": handler.__name__,
+                "object_type": obj_type,
+                "objects": objects,
+                "seconds": round(elapsed, 4),
+                "objects_per_second": rate,
+                "peak_memory_bytes": peak,
+                "database_reads": self.reads if self.watched else None,
+                "rows_scanned": self.rows,
+            }
+        )
+        return result
+
+    def dump(self, file_name):
+        """
+        Write the profile as JSON to a file or to standard error.
+        """
+        profile = {
+            "tree_name": self.tree_name,
+            "seconds": round(time.perf_counter() - self.start, 4),
+            "handlers": self.handlers,
+        }
+        if file_name == "-":
+            print(json.dumps(profile, indent=2), file=sys.stderr)
+        else:
+            with open(file_name, "w", encoding="utf-8") as profile_file:
+                json.dump(profile, profile_file, indent=2)
+
+
+def run_handler(handler, obj_type, objects, *args, **kwargs):
+    """
+    Run a handler, profiling it if requested.
+    """
+    if PROFILE:
+        return PROFILE.run(handler, obj_type, objects, *args, **kwargs)
+    return handler(*args, **kwargs)
+
+
+def gather_serial_statistics(args, obj_list, event=None, report=None):
     """
     Gather statistics using non-concurrent serial mode.
     """
-    facts = examine_bookmarks(args)
+    facts = run_handler(examine_bookmarks, "Bookmark", 0, args)
+    if report:
+        report("facts", ("Bookmark", facts))
+    total = sum(args.get("counts", {}).values())
+    count = 0
     for obj_type in obj_list:
-        results = TASK_HANDLERS[obj_type](args, thread_event=event)
-        if event.is_set():
+        results = run_handler(
+            TASK_HANDLERS[obj_type],
+            obj_type,
+            args.get("counts", {}).get(obj_type, 0),
+            args,
+            thread_event=event,
+        )
+        if event and event.is_set():
             break
         fold(facts, results)
+        if report:
+            count = count + args.get("counts", {}).get(obj_type, 0)
+            report("facts", (obj_type, results))
+            report("progress", (count, total))
     return facts
 
 
-def gather_concurrent_statistics(args, obj_list, event=None):
+def examine_shard(task):
     """
-    Gather statistics using multiprocessing mode.
+    Parse and analyze the objects of a given type within a handle range,
+    returning the partial tally.
     """
-    workers = {}
-    queues = {}
-    for obj_type in obj_list:
-        queues[obj_type] = Queue()
-        workers[obj_type] = Process(
-            target=TASK_HANDLERS[obj_type],
-            args=(args, queues[obj_type], event),
+    (args, obj_type, low, high) = task
+    if SHARED_INDEXES:
+        args = dict(args, **SHARED_INDEXES)
+    analyze = OBJECT_HANDLERS[obj_type][3]
+    tally = Counter()
+
+    with readonly_database(args) as db:
+        raw = use_raw_rows(db, args)
+        for obj in iter_handle_range(db, obj_type, low, high, raw=raw):
+            analyze(db, obj, tally, args)
+    return obj_type, tally
+
+
+def iter_objects(db, obj_type, args):
+    """
+    Iterate over all objects of a given type, as raw rows if requested.
+    """
+    if use_raw_rows(db, args):
+        return iter_handle_range(db, obj_type, None, None, raw=True)
+    return getattr(db, OBJECT_HANDLERS[obj_type][2])()
+
+
+def use_raw_rows(db, args):
+    """
+    Return true if raw rows were requested and the database stores them in
+    a form that provides attribute access.
+    """
+    return (
+        args.get("raw")
+        and hasattr(db, "dbapi")
+        and db.serializer.data_field == "json_data"
+    )
+
+
+def iter_handle_range(db, obj_type, low, high, raw=False):
+    """
+    Iterate over the objects of a given type with a handle in the range
+    low to high. Either bound may be None for an open ended range. If raw
+    is set the raw rows are returned without building the objects.
+    """
+    obj_class = OBJECT_HANDLERS[obj_type][1]
+    if hasattr(db, "dbapi"):
+        conditions, values = [], []
+        if low:
+            conditions.append("handle >= ?")
+            values.append(low)
+        if high:
+            conditions.append("handle < ?")
+            values.append(high)
+        query = "SELECT %s FROM %s" % (
+            db.serializer.data_field,
+            obj_type.lower(),
         )
-        workers[obj_type].start()
+        if conditions:
+            query = "%s WHERE %s" % (query, " AND ".join(conditions))
+        with db.dbapi.cursor() as cursor:
+            cursor.execute(query, values)
+            rows = cursor.fetchmany()
+            while rows:
+                if PROFILE:
+                    PROFILE.rows += len(rows)
+                for row in rows:
+                    data = db.serializer.string_to_data(row[0])
+                    if raw:
+                        yield data
+                    else:
+                        yield db.serializer.data_to_object(data, obj_class)
+                rows = cursor.fetchmany()
+    else:
+        fetch = db.method("get_%s_from_handle", obj_type)
+        for handle in getattr(db, "iter_%s_handles" % obj_type.lower())():
+            if (not low or handle >= low) and (not high or handle < high):
+                yield fetch(handle)
 
-    facts = examine_bookmarks(args)
-    obj_list.reverse()
-    for obj_type in obj_list:
-        result_set = queues[obj_type].get()
-        workers[obj_type].join()
-        fold(facts, result_set)
+
+def get_shard_ranges(db, obj_type, jobs):
+    """
+    Split the handles for an object type into ranges of roughly equal size
+    so large tables can be scanned by multiple processes.
+    """
+    handles = sorted(getattr(db, "iter_%s_handles" % obj_type.lower())())
+    shards = max(1, min(jobs, len(handles) // SHARD_MINIMUM))
+    step = len(handles) / shards
+    bounds = [None]
+    for index in range(1, shards):
+        bounds.append(handles[int(index * step)])
+    bounds.append(None)
+    return list(zip(bounds[:-1], bounds[1:]))
+
+
+def gather_concurrent_statistics(args, obj_list, event=None, report=None):
+    """
+    Gather statistics using multiprocessing mode. Large tables are split
+    into handle ranges and all the shards are scanned by a fixed size
+    process pool, the partial tallies are then combined per object type.
+    An object type is summarized as soon as all of its shards are done.
+    """
+    jobs = args.get("jobs") or os.cpu_count() or 1
+    shared = {x: args[x] for x in ("event_index", "living") if x in args}
+    task_args = {
+        x: y for (x, y) in args.items() if x not in shared and x != "db"
+    }
+    with readonly_database(args) as db:
+        tasks, remaining = [], Counter()
+        for obj_type in obj_list:
+            for (low, high) in get_shard_ranges(db, obj_type, jobs):
+                tasks.append((task_args, obj_type, low, high))
+                remaining[obj_type] += 1
+
+        facts = examine_bookmarks(args)
+        if report:
+            report("facts", ("Bookmark", facts))
+        total = sum(args.get("counts", {}).values())
+        count = 0
+        tallies = {}
+        with Pool(
+            processes=jobs,
+            initializer=install_shared_indexes,
+            initargs=(shared, args.get("tree_name")),
+        ) as pool:
+            for (obj_type, tally) in pool.imap_unordered(examine_shard, tasks):
+                if event and event.is_set():
+                    pool.terminate()
+                    break
+                if obj_type not in tallies:
+                    tallies[obj_type] = tally
+                else:
+                    tallies[obj_type].update(tally)
+                count = count + tally["total"]
+                remaining[obj_type] -= 1
+                if remaining[obj_type] == 0:
+                    handler = OBJECT_HANDLERS[obj_type]
+                    tally = tallies[obj_type]
+                    payload = handler[4](db, tally, args)
+                    post_processing(
+                        args, handler[0], tally["total"], None, payload
+                    )
+                    fold(facts, payload)
+                    if report:
+                        report("facts", (obj_type, payload))
+                if report:
+                    report("progress", (count, total))
     return facts
 
 
-def gather_statistics(args, event=None):
+def gather_sampled_statistics(args, obj_list, event=None, report=None):
     """
-    Gather tree statistics.
+    Gather approximate statistics by examining a random sample of each
+    object type. Counts are scaled to the full table and the margin of
+    error for each is recorded under the estimate key.
+    """
+    facts = run_handler(examine_bookmarks, "Bookmark", 0, args)
+    if report:
+        report("facts", ("Bookmark", facts))
+    total = sum(args.get("counts", {}).values())
+    count = 0
+    with readonly_database(args) as db:
+        for obj_type in obj_list:
+            payload = run_handler(
+                examine_sample,
+                obj_type,
+                args.get("counts", {}).get(obj_type, 0),
+                db,
+                obj_type,
+                args,
+                event,
+            )
+            if event and event.is_set():
+                break
+            fold(facts, payload)
+            if report:
+                count = count + args.get("counts", {}).get(obj_type, 0)
+                report("facts", (obj_type, payload))
+                report("progress", (count, total))
+    return facts
+
+
+def examine_sample(db, obj_type, args, event=None):
+    """
+    Parse and analyze a random sample of the objects of a given type,
+    small tables are examined in full.
+    """
+    label, dummy_class, dummy_iter, analyze, summarize = OBJECT_HANDLERS[
+        obj_type
+    ]
+    handles = list(db.method("get_%s_handles", obj_type)())
+    population = len(handles)
+    size = max(
+        math.ceil(population * args.get("sample")),
+        min(population, SAMPLE_MINIMUM),
+    )
+    if size >= population:
+        tally = Counter()
+        for obj in iter_objects(db, obj_type, args):
+            analyze(db, obj, tally, args)
+        payload = summarize(db, tally, args)
+        return post_processing(args, label, population, None, payload)
+
+    if use_raw_rows(db, args):
+        fetch = db.method("get_raw_%s_data", obj_type)
+    else:
+        fetch = partial(fetch_object, db, obj_type)
+    sums, squares = Counter(), Counter()
+    for handle in random.sample(handles, size):
+        if event and event.is_set():
+            break
+        obj = fetch(handle)
+        if obj:
+            tally = Counter()
+            analyze(db, obj, tally, args)
+            sums.update(tally)
+            squares.update({x: y * y for (x, y) in tally.items()})
+    tallies = estimate_tally(sums, squares, size, population)
+    payloads = [summarize(db, tally, args) for tally in tallies]
+    payload = payloads[0]
+    payload["estimate"] = collect_margins(*payloads)
+    payload["estimate"][("sample", obj_type)] = (size, population)
+    return post_processing(args, label, population, None, payload)
+
+
+def estimate_tally(sums, squares, size, population):
+    """
+    Scale a tally taken from a sample to the population, returning the
+    estimated tally and the tallies at the low and high bounds of the
+    confidence interval.
+    """
+    scale = population / size
+    correction = (population - size) / population
+    estimate, low, high = Counter(), Counter(), Counter()
+    for (key, value) in sums.items():
+        variance = 0
+        if size > 1:
+            variance = max(
+                (squares[key] - value * value / size) / (size - 1), 0
+            )
+        margin = CONFIDENCE_Z * population * math.sqrt(
+            correction * variance / size
+        )
+        estimate[key] = round(value * scale)
+        low[key] = max(round(value * scale - margin), 0)
+        high[key] = round(value * scale + margin)
+    return estimate, low, high
+
+
+def collect_margins(payload, low_payload, high_payload):
+    """
+    Compare the payloads prepared from the estimated tally and the
+    confidence bounds and return the margin of error for each count.
+    """
+    margins = {}
+    for (group, entries) in payload.items():
+        for (key, value) in entries.items():
+            low = low_payload.get(group, {}).get(key)
+            high = high_payload.get(group, {}).get(key)
+            if isinstance(value, dict):
+                for (subkey, subvalue) in value.items():
+                    margin = get_margin(
+                        subvalue,
+                        (low or {}).get(subkey),
+                        (high or {}).get(subkey),
+                    )
+                    if margin:
+                        margins[(group, key, subkey)] = margin
+            else:
+                margin = get_margin(value, low, high)
+                if margin:
+                    margins[(group, key)] = margin
+    return margins
+
+
+def get_margin(value, low, high):
+    """
+    Return the margin of error for a count given the values found at the
+    low and high bounds.
+    """
+    if not isinstance(value, tuple) or not isinstance(value[0], int):
+        return 0
+    count = value[0]
+    low_count, high_count = 0, count
+    if isinstance(low, tuple) and isinstance(low[0], int):
+        low_count = low[0]
+    if isinstance(high, tuple) and isinstance(high[0], int):
+        high_count = high[0]
+    return max(count - low_count, high_count - count, 0)
+
+
+def gather_statistics(args, event=None, report=None):
+    """
+    Gather tree statistics. If a report function is provided it is called
+    with the facts for each object type as they are completed and with
+    progress counts.
     """
     try:
-        total, obj_list = get_object_list(args.get("tree_name"))
+        object_counts = get_object_counts(args)
     except TypeError:
         print(
             "Error: Problem finding and loading tree: %s"
@@ -1221,13 +2536,137 @@ def gather_statistics(args, event=None):
         )
         sys.exit(1)
 
+    categories = args.get("categories")
+    if categories:
+        object_counts = [x for x in object_counts if x[0] in categories]
+    args["counts"] = dict(object_counts)
+    total = sum(args["counts"].values())
+    obj_list = [x for (x, y) in object_counts]
+    if args.get("sample"):
+        facts = gather_sampled_statistics(
+            args, obj_list, event=event, report=report
+        )
+        return total, facts
+    if "Person" in obj_list:
+        args["event_index"] = run_handler(
+            build_event_index, "Event", args["counts"].get("Event", 0), args
+        )
+        args["living"] = run_handler(
+            build_living_status,
+            "Person",
+            args["counts"].get("Person", 0),
+            args,
+        ).living
     if args.get("serial"):
-        facts = gather_serial_statistics(args, obj_list, event=event)
+        facts = gather_serial_statistics(
+            args, obj_list, event=event, report=report
+        )
     else:
-        facts = gather_concurrent_statistics(args, obj_list, event=event)
+        facts = gather_concurrent_statistics(
+            args, obj_list, event=event, report=report
+        )
     return total, facts
 
 
+def open_message_channel():
+    """
+    Reserve standard output for framed messages, anything else written to
+    it is redirected to standard error so it can not corrupt the stream.
+    """
+    sys.stdout.flush()
+    channel = os.fdopen(os.dup(sys.stdout.fileno()), "wb")
+    os.dup2(sys.stderr.fileno(), sys.stdout.fileno())
+    return channel
+
+
+def write_message(channel, kind, value):
+    """
+    Write a framed message to the channel. Each frame is a pickled tuple
+    of the message kind and value prefixed by the length.
+    """
+    message = pickle.dumps((kind, value))
+    channel.write(struct.pack("!I", len(message)))
+    channel.write(message)
+    channel.flush()
+
+
+def read_message(stream):
+    """
+    Read a framed message from a stream, returns None at end of stream.
+    """
+    header = stream.read(4)
+    if len(header) < 4:
+        return None
+    (length,) = struct.unpack("!I", header)
+    message = stream.read(length)
+    if len(message) < length:
+        return None
+    return pickle.loads(message)
+
+
+def serve_statistics(args, channel):
+    """
+    Serve statistics requests read from standard input until told to quit
+    or the input is closed, which happens if the application exits. Each
+    request is either recompute or recompute categories followed by a
+    comma separated list of object types, and optionally sample followed
+    by the fraction of each table to examine for approximate statistics.
+    The statistics are streamed back as they are collected and followed
+    by a complete message. The tree is opened once and kept open for all
+    of the requests, the service starts a new worker if the tree changes.
+    """
+    report = partial(write_message, channel)
+    with readonly_database(args) as db:
+        for line in sys.stdin:
+            command = line.split()
+            if not command:
+                continue
+            if command[0] == "quit":
+                break
+            if command[0] == "recompute":
+                request = dict(args, db=db)
+                options = dict(zip(command[1::2], command[2::2]))
+                if "categories" in options:
+                    categories = options["categories"].split(",")
+                    request["categories"] = categories
+                if "sample" in options:
+                    request["sample"] = float(options["sample"])
+                total, dummy_facts = gather_statistics(
+                    request, report=report
+                )
+                report("complete", total)
+
+
+def compare_statistics(args):
+    """
+    Gather statistics using both raw rows and full objects and report any
+    differences. Returns the exit status.
+    """
+    dummy_total, raw_facts = gather_statistics(dict(args, raw=True))
+    dummy_total, object_facts = gather_statistics(dict(args, raw=False))
+    differences = 0
+    for key in sorted(set(raw_facts) | set(object_facts)):
+        raw_group = raw_facts.get(key, {})
+        object_group = object_facts.get(key, {})
+        for subkey in sorted(set(raw_group) | set(object_group)):
+            if raw_group.get(subkey) != object_group.get(subkey):
+                differences += 1
+                print(
+                    "{0}.{1}: raw {2} objects {3}".format(
+                        key,
+                        subkey,
+                        raw_group.get(subkey),
+                        object_group.get(subkey),
+                    ),
+                    file=sys.stderr,
+                )
+    if differences:
+        print("%s differences found" % differences, file=sys.stderr)
+        return 1
+    print("Raw row and object statistics are identical", file=sys.stderr)
+    return 0
+
+
 def main():
     """
     Main program.
@@ -1256,6 +2695,17 @@ def main():
         action="store_true",
         help="Dump run times",
     )
+    parser.add_argument(
+        "-P",
+        "--profile",
+        dest="profile",
+        default=None,
+        nargs="?",
+        const="-",
+        metavar="FILE",
+        help="Dump a JSON profile of each handler to standard error or a "
+        "file, implies serial mode and timings include tracing overhead",
+    )
     parser.add_argument(
         "-s",
         "--serial",
@@ -1264,6 +2714,14 @@ def main():
         action="store_true",
         help="Serial mode",
     )
+    parser.add_argument(
+        "-j",
+        "--jobs",
+        dest="jobs",
+        default=None,
+        type=int,
+        help="Number of processes to use, defaults to number of cores",
+    )
     parser.add_argument(
         "-y",
         "--yaml",
@@ -1272,6 +2730,38 @@ def main():
         action="store_true",
         help="Dump statistics in YAML format if YAML support available",
     )
+    parser.add_argument(
+        "-o",
+        "--objects",
+        dest="objects",
+        default=False,
+        action="store_true",
+        help="Examine full objects instead of raw rows",
+    )
+    parser.add_argument(
+        "-p",
+        "--sample",
+        dest="sample",
+        default=None,
+        type=float,
+        help="Estimate statistics from a sample of this fraction of objects",
+    )
+    parser.add_argument(
+        "-S",
+        "--serve",
+        dest="serve",
+        default=False,
+        action="store_true",
+        help="Serve recompute requests read from standard input",
+    )
+    parser.add_argument(
+        "-c",
+        "--compare",
+        dest="compare",
+        default=False,
+        action="store_true",
+        help="Verify raw row and full object statistics are identical",
+    )
     parsed_args = parser.parse_args()
 
     args = {
@@ -1279,14 +2769,27 @@ def main():
         "tree_name": parsed_args.tree_name,
         "time": parsed_args.time,
         "serial": parsed_args.serial,
+        "jobs": parsed_args.jobs,
+        "raw": not parsed_args.objects,
+        "sample": parsed_args.sample,
     }
+    if parsed_args.compare:
+        sys.exit(compare_statistics(args))
+    if parsed_args.profile:
+        global PROFILE
+        PROFILE = StatisticsProfile(parsed_args.tree_name)
+        args["serial"] = True
+    if parsed_args.serve:
+        channel = open_message_channel()
+        serve_statistics(args, channel)
+        channel.close()
+        sys.exit(0)
     if parsed_args.time:
         args["start_time"] = time.time()
         print("Run started", file=sys.stderr)
 
-    total, facts = gather_statistics(args)
-
     if parsed_args.yaml:
+        total, facts = gather_statistics(args)
         try:
             import yaml
 
@@ -1294,16 +2797,20 @@ def main():
         except ModuleNotFoundError:
             print("YAML support not available", file=sys.stderr)
     else:
-        # https://stackoverflow.com/questions/38029058/sending-pickled-data-to-a-server
-        sys.stdout = io.TextIOWrapper(sys.stdout.detach(), encoding="latin-1")
-        print(pickle.dumps(facts).decode("latin-1"), end="", flush=True)
+        channel = open_message_channel()
+        report = partial(write_message, channel)
+        total, facts = gather_statistics(args, report=report)
+        report("complete", total)
+        channel.close()
     if parsed_args.time:
         print(
             "{0:<12} {1:6} {2}".format(
-                "Run complete", total, time.time() - args.start_time
+                "Run complete", total, time.time() - args["start_time"]
             ),
             file=sys.stderr,
         )
+    if PROFILE:
+        PROFILE.dump(parsed_args.profile)
     sys.exit(0)
 
 
@@ -0,0 +1,273 @@
+#
+# Gramps - a GTK+/GNOME based genealogy program
+#
+# Copyright (C) 2022       Christopher Horn
+#
+# This program is free software; you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation; either version 2 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program; if not, write to the Free Software
+# Foundation, Inc., 51 Franklin Street, Fifth Floor, Boston, MA 02110-1301 USA.
+#
+
+"""
+VitalsService, PersonVitals
+"""
+
+# -------------------------------------------------------------------------
+#
+# Python Modules
+#
+# -------------------------------------------------------------------------
+from collections import OrderedDict
+
+# -------------------------------------------------------------------------
+#
+# Gramps Modules
+#
+# -------------------------------------------------------------------------
+from gramps.gen.errors import HandleError
+from gramps.gen.lib import EventType
+from gramps.gen.utils.alive import probably_alive
+
+# -------------------------------------------------------------------------
+#
+# Plugin Modules
+#
+# -------------------------------------------------------------------------
+from .service_signals import get_signal_map
+
+DEATH_INDICATORS = [
+    EventType.DEATH,
+    EventType.BURIAL,
+    EventType.CREMATION,
+    EventType.CAUSE_DEATH,
+    EventType.PROBATE,
+]
+
+CACHE_SIZE = 10000
+
+
+# -------------------------------------------------------------------------
+#
+# PersonVitals Class
+#
+# -------------------------------------------------------------------------
+class PersonVitals:
+    """
+    The birth and death events of a person along with the first primary
+    events that can stand in for them.
+    """
+
+    __slots__ = (
+        "birth",
+        "death",
+        "birth_fallback",
+        "death_fallback",
+        "dead",
+        "events",
+    )
+
+    def __init__(self, person, events):
+        self.birth = None
+        self.death = None
+        self.birth_fallback = None
+        self.death_fallback = None
+        self.dead = False
+        self.events = []
+        birth_ref = person.get_birth_ref()
+        death_ref = person.get_death_ref()
+        for event in events:
+            if not event:
+                continue
+            self.events.append(event.handle)
+            if birth_ref and event.handle == birth_ref.ref:
+                self.birth = event
+            elif death_ref and event.handle == death_ref.ref:
+                self.death = event
+                self.dead = True
+            elif event.type.is_death_fallback():
+                self.dead = True
+            if not self.birth_fallback and event.type.is_birth_fallback():
+                self.birth_fallback = event
+            if not self.death_fallback and event.type in DEATH_INDICATORS:
+                self.death_fallback = event
+
+    def get_birth(self):
+        """
+        Return the birth event or the fallback for it.
+        """
+        return self.birth or self.birth_fallback
+
+    def get_death(self):
+        """
+        Return the death event or the fallback for it.
+        """
+        return self.death or self.death_fallback
+
+    def get_birth_sortval(self):
+        """
+        Return the sort value for the birth or the fallback for it.
+        """
+        return get_sortval(self.get_birth())
+
+    def get_death_sortval(self):
+        """
+        Return the sort value for the death or the fallback for it.
+        """
+        return get_sortval(self.get_death())
+
+
+def get_primary_events(db, person):
+    """
+    Return the primary events of a person, skipping any missing.
+    """
+    events = []
+    for event_ref in person.get_primary_event_ref_list():
+        try:
+            events.append(db.get_event_from_handle(event_ref.ref))
+        except HandleError:
+            continue
+    return events
+
+
+def get_sortval(event):
+    """
+    Return the date sort value for an event.
+    """
+    if event and event.get_date_object():
+        return event.get_date_object().sortval
+    return 0
+
+
+# -------------------------------------------------------------------------
+#
+# VitalsService Class
+#
+# -------------------------------------------------------------------------
+class VitalsService:
+    """
+    A singleton class that remembers the vital events of people so they
+    are only worked out once no matter how many cards, fields or timelines
+    need them. Entries are dropped when the person or one of their events
+    changes, and the least recently used ones once more are kept than the
+    cache size allows.
+    """
+
+    def __new__(cls, grstate):
+        """
+        Return the singleton class.
+        """
+        if not hasattr(cls, "instance"):
+            cls.instance = super(VitalsService, cls).__new__(cls)
+            cls.instance.__init_singleton__(grstate)
+        return cls.instance
+
+    def __init_singleton__(self, grstate):
+        """
+        Prepare the vitals service for use.
+        """
+        self.grstate = grstate
+        self.dbstate = grstate.dbstate
+        self.vitals = OrderedDict()
+        self.dependents = {}
+        self.signal_map = get_signal_map(["Person", "Event"], self.drop_vitals)
+        self.dbstate.connect("database-changed", self.database_changed)
+        self.database_changed()
+
+    def database_changed(self, *_dummy_args):
+        """
+        Connect to the new database and forget the vitals.
+        """
+        for (sig, callback) in self.signal_map.items():
+            self.dbstate.db.connect(sig, callback)
+        self.clear_cache()
+
+    def clear_cache(self):
+        """
+        Forget the vitals.
+        """
+        self.vitals = OrderedDict()
+        self.dependents = {}
+
+    def drop_vitals(self, obj_type, handles=None):
+        """
+        Forget the vitals of changed people or people with changed events.
+        """
+        if obj_type not in ["Person", "Event"]:
+            return
+        if handles is None:
+            self.clear_cache()
+            return
+        for handle in handles:
+            if obj_type == "Person":
+                self.forget_vitals(handle)
+            else:
+                for person_handle in list(self.dependents.get(handle, [])):
+                    self.forget_vitals(person_handle)
+
+    def forget_vitals(self, handle):
+        """
+        Forget the vitals of a person and the events they depend on.
+        """
+        vitals = self.vitals.pop(handle, None)
+        if vitals is None:
+            return
+        for event_handle in vitals.events:
+            dependents = self.dependents.get(event_handle)
+            if dependents is not None:
+                dependents.discard(handle)
+                if not dependents:
+                    del self.dependents[event_handle]
+
+    def get_vitals(self, handle, person=None):
+        """
+        Return the vitals for a person, loading the person and their events
+        through the object cache if they are not known.
+        """
+        vitals = self.vitals.get(handle)
+        if vitals is not None:
+            self.vitals.move_to_end(handle)
+            return vitals
+        if person is None:
+            person = self.grstate.fetch("Person", handle)
+        events = self.grstate.fetch_many(
+            "Event", [x.ref for x in person.get_primary_event_ref_list()]
+        )
+        vitals = PersonVitals(person, events)
+        self.vitals[handle] = vitals
+        for event_handle in vitals.events:
+            self.dependents.setdefault(event_handle, set()).add(handle)
+        while len(self.vitals) > CACHE_SIZE:
+            self.forget_vitals(next(iter(self.vitals)))
+        return vitals
+
+
+def find_vitals(db, handle, person=None):
+    """
+    Return the vitals for a person through the service if it is running
+    for the database.
+    """
+    service = getattr(VitalsService, "instance", None)
+    if service and service.dbstate.db is db:
+        return service.get_vitals(handle, person=person)
+    if person is None:
+        person = db.get_person_from_handle(handle)
+    return PersonVitals(person, get_primary_events(db, person))
+
+
+def find_living(db, person):
+    """
+    Return true if person is probably living.
+    """
+    if find_vitals(db, person.handle, person=person).dead:
+        return False
+    return probably_alive(person, db)
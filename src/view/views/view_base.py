@@ -27,14 +27,16 @@ GrampsObjectView
 # Python Modules
 #
 # -------------------------------------------------------------------------
+import time
 from abc import abstractmethod
+from functools import partial
 
 # -------------------------------------------------------------------------
 #
 # GTK Modules
 #
 # -------------------------------------------------------------------------
-from gi.repository import Gtk
+from gi.repository import GLib, Gtk
 
 # -------------------------------------------------------------------------
 #
@@ -65,6 +67,10 @@ _ = glocale.translation.sgettext
 class GrampsObjectView(Gtk.VBox):
     """
     Provides functionality common to all object views.
+
+    Unless tabbed the header is shown at once and the groups are then
+    built one after another when the main loop is idle, as many at a
+    time as fit in the configured slice time.
     """
 
     def __init__(self, grstate, grcontext):
@@ -77,6 +83,9 @@ class GrampsObjectView(Gtk.VBox):
         self.view_body = Gtk.HBox(vexpand=False)
         self.view_object = None
         self.view_focus = None
+        self.rendered_groups = {}
+        self.render_queue = []
+        self.render_source = None
         self.render_view()
 
     def render_view(self):
@@ -104,6 +113,9 @@ class GrampsObjectView(Gtk.VBox):
                 self.add_media_bar(wrapper, self.grcontext.primary_obj.obj)
             self.pack_start(wrapper, True, True, 0)
         self.show_all()
+        if self.render_queue:
+            self.grstate.open_cache()
+            self.render_source = GLib.idle_add(self.render_pending_groups)
 
     def render_view_body(self, widget, mode):
         """
@@ -181,14 +193,98 @@ class GrampsObjectView(Gtk.VBox):
         args = {"page_type": self.grcontext.page_type.lower()}
         if age_base:
             args["age_base"] = age_base
+        tabbed = self.grstate.config.get("%s.tabbed" % space)
+        progressive = self.grstate.config.get("display.render-slice-time")
         object_groups = {}
         for group in groups:
             if self.grstate.config.get("%s.%s.visible" % (space, group)):
-                object_groups.update(
-                    {group: group_builder(self.grstate, group, obj, args)}
-                )
+                if tabbed:
+                    widget = partial(self.build_group, group, obj, args)
+                elif progressive:
+                    widget = Gtk.VBox(vexpand=False)
+                    self.render_queue.append((widget, group, obj, args))
+                else:
+                    widget = self.build_group(group, obj, args)
+                object_groups.update({group: widget})
         return object_groups
 
+    def build_group(self, group, obj, args):
+        """
+        Build a group, recording what it depends on.
+        """
+        self.grstate.start_recording()
+        try:
+            widget = group_builder(self.grstate, group, obj, args)
+        finally:
+            dependencies = self.grstate.stop_recording()
+        self.rendered_groups[group] = (obj, args, widget, dependencies)
+        return widget
+
+    def render_pending_groups(self):
+        """
+        Build queued groups until the slice time is used up, putting each
+        in place of its placeholder. Returns true while more remain.
+        """
+        if self.get_parent() is None:
+            self.finish_render()
+            return False
+        budget = self.grstate.config.get("display.render-slice-time") / 1000
+        start = time.time()
+        while self.render_queue:
+            (placeholder, group, obj, args) = self.render_queue.pop(0)
+            widget = self.build_group(group, obj, args)
+            if widget:
+                replace_widget(placeholder, widget)
+            else:
+                hide_placeholder(placeholder, self.view_body)
+            if time.time() - start > budget:
+                break
+        if self.render_queue:
+            return True
+        self.finish_render()
+        return False
+
+    def cancel_render(self):
+        """
+        Stop building queued groups, used when navigating away before
+        the view is complete.
+        """
+        if self.render_source:
+            GLib.source_remove(self.render_source)
+            self.finish_render()
+
+    def finish_render(self):
+        """
+        Clean up once queued groups are built or no longer wanted.
+        """
+        self.render_queue = []
+        self.render_source = None
+        self.grstate.close_cache()
+
+    def get_dependent_groups(self, handles):
+        """
+        Return the rendered groups that depend on any of the handles.
+        """
+        return [
+            group
+            for (group, entry) in self.rendered_groups.items()
+            if entry[3] & handles
+        ]
+
+    def rebuild_group(self, group):
+        """
+        Rebuild a rendered group in place. Returns false if that is not
+        possible because the group was not shown or would now be empty.
+        """
+        (obj, args, widget, dummy_dependencies) = self.rendered_groups[group]
+        if not widget or not widget.get_parent():
+            return False
+        new_widget = self.build_group(group, obj, args)
+        if not new_widget:
+            return False
+        replace_widget(widget, new_widget)
+        return True
+
     def render_group_view(self, obj_groups, space_override=None):
         """
         Identify format for the group view and call method to prepare it.
@@ -230,6 +326,43 @@ class GrampsObjectView(Gtk.VBox):
                 widget.pack_start(mediabar, False, False, 0)
 
 
+def replace_widget(widget, new_widget):
+    """
+    Replace a widget with another in the same place in its container.
+    """
+    parent = widget.get_parent()
+    if isinstance(parent, Gtk.Box):
+        (expand, fill, padding, pack_type) = parent.query_child_packing(
+            widget
+        )
+        position = parent.child_get_property(widget, "position")
+        parent.remove(widget)
+        if pack_type == Gtk.PackType.END:
+            parent.pack_end(new_widget, expand, fill, padding)
+        else:
+            parent.pack_start(new_widget, expand, fill, padding)
+        parent.reorder_child(new_widget, position)
+    else:
+        parent.remove(widget)
+        parent.add(new_widget)
+    new_widget.show_all()
+
+
+def hide_placeholder(placeholder, top):
+    """
+    Hide the placeholder for a group that turned out to be empty, along
+    with any container it leaves with nothing to show.
+    """
+    widget = placeholder
+    while widget is not top:
+        widget.set_no_show_all(True)
+        widget.hide()
+        parent = widget.get_parent()
+        if parent is None or any(x.get_visible() for x in parent):
+            break
+        widget = parent
+
+
 def add_to_title(title, group):
     """
     Add group label to title.
@@ -278,23 +411,79 @@ def prepare_untabbed_groups(obj_groups, groupings, scrolled):
 
 def prepare_tabbed_groups(obj_groups, groupings, scrolled):
     """
-    Generate the tabbed notebook view for the groups.
+    Generate the tabbed notebook view for the groups. Groups may be given
+    as callables to build them, in which case each tab is only built the
+    first time it is selected. Tabs that turn out to be empty are dropped.
     """
     notebook = Gtk.Notebook()
+    pending = {}
     for grouping in groupings:
         title = ""
-        if len(grouping) == 1:
-            label = Gtk.Label(label=add_to_title(title, grouping[0]))
-            notebook.append_page(
-                make_scrollable(obj_groups[grouping[0]]), tab_label=label
-            )
-        else:
-            box = Gtk.HBox(spacing=3, vexpand=False)
-            for group in grouping:
-                title = add_to_title(title, group)
-                pack_container(box, scrolled, obj_groups[group])
-            label = Gtk.Label(label=title)
-            notebook.append_page(
-                make_scrollable(box, vexpand=False), tab_label=label
-            )
+        for group in grouping:
+            title = add_to_title(title, group)
+        page = Gtk.VBox(vexpand=True)
+        pending[page] = grouping
+        notebook.append_page(page, tab_label=Gtk.Label(label=title))
+
+    for page in list(pending):
+        if build_tab(obj_groups, pending.pop(page), scrolled, page):
+            break
+        notebook.remove_page(notebook.page_num(page))
+    notebook.connect(
+        "switch-page", build_pending_tab, obj_groups, pending, scrolled
+    )
     return notebook
+
+
+def build_pending_tab(
+    notebook, page, _dummy_page_num, obj_groups, pending, scrolled
+):
+    """
+    Build a tab when first selected, dropping it if it is empty.
+    """
+    grouping = pending.pop(page, None)
+    if grouping and not build_tab(obj_groups, grouping, scrolled, page):
+        GLib.idle_add(remove_tab, notebook, page)
+
+
+def remove_tab(notebook, page):
+    """
+    Remove a tab from a notebook.
+    """
+    page_num = notebook.page_num(page)
+    if page_num >= 0:
+        notebook.remove_page(page_num)
+    return False
+
+
+def build_tab(obj_groups, grouping, scrolled, page):
+    """
+    Build the groups for a tab and pack those with content in the page.
+    Returns false if none have any.
+    """
+    widgets = [get_group_widget(obj_groups, x) for x in grouping]
+    widgets = [x for x in widgets if x is not None]
+    if not widgets:
+        return False
+    if len(widgets) == 1:
+        content = make_scrollable(widgets[0])
+    else:
+        box = Gtk.HBox(spacing=3, vexpand=False)
+        for widget in widgets:
+            pack_container(box, scrolled, widget)
+        content = make_scrollable(box, vexpand=False)
+    page.pack_start(content, True, True, 0)
+    page.show_all()
+    return True
+
+
+def get_group_widget(obj_groups, group):
+    """
+    Return the widget for a group, building it if needed. Returns None if
+    the group is empty.
+    """
+    widget = obj_groups[group]
+    if callable(widget):
+        widget = widget()
+        obj_groups[group] = widget
+    return widget
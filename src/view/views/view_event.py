@@ -36,6 +36,7 @@ from gramps.gen.const import GRAMPS_LOCALE as glocale
 # -------------------------------------------------------------------------
 from ..common.common_classes import GrampsOptions
 from ..groups.group_builder import get_references_group
+from ..services.service_backlinks import find_backlinks
 from .view_base import GrampsObjectView
 from .view_const import CARD_MAP
 
@@ -86,7 +87,7 @@ class EventObjectView(GrampsObjectView):
         for (
             obj_type,
             obj_handle,
-        ) in self.grstate.dbstate.db.find_backlink_handles(event.handle):
+        ) in find_backlinks(self.grstate.dbstate.db, event.handle):
             if obj_type == "Person" and obj_handle not in people_list:
                 people_list.append(("Person", obj_handle))
             elif obj_type == "Family" and obj_handle not in family_list:
@@ -36,6 +36,7 @@ from gramps.gen.const import GRAMPS_LOCALE as glocale
 # -------------------------------------------------------------------------
 from ..common.common_classes import GrampsOptions
 from ..groups.group_builder import get_references_group
+from ..services.service_backlinks import find_backlinks
 from .view_base import GrampsObjectView
 from .view_const import CARD_MAP
 
@@ -81,7 +82,7 @@ class SourceObjectView(GrampsObjectView):
         for (
             obj_type,
             obj_handle,
-        ) in self.grstate.dbstate.db.find_backlink_handles(source.handle):
+        ) in find_backlinks(self.grstate.dbstate.db, source.handle):
             if obj_type == "Citation":
                 self.__extract_references(
                     obj_handle, people_list, events_list, places_list
@@ -141,7 +142,7 @@ class SourceObjectView(GrampsObjectView):
         for (
             obj_type,
             obj_handle,
-        ) in self.grstate.dbstate.db.find_backlink_handles(handle):
+        ) in find_backlinks(self.grstate.dbstate.db, handle):
             if obj_type == "Person":
                 if obj_handle not in people_list:
                     people_list.append(("Person", obj_handle))
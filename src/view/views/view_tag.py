@@ -29,6 +29,7 @@ TagObjectView
 # -------------------------------------------------------------------------
 from ..common.common_classes import GrampsOptions
 from ..groups.group_builder import get_references_group
+from ..services.service_backlinks import find_backlinks
 from .view_base import GrampsObjectView
 from .view_const import CARD_MAP
 
@@ -58,7 +59,7 @@ class TagObjectView(GrampsObjectView):
         for (
             obj_type,
             obj_handle,
-        ) in self.grstate.dbstate.db.find_backlink_handles(tag.handle):
+        ) in find_backlinks(self.grstate.dbstate.db, tag.handle):
             if obj_type not in object_list:
                 object_list.update({obj_type: []})
             object_list[obj_type].append((obj_type, obj_handle))